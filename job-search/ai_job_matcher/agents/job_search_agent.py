@@ -1,5 +1,8 @@
 """Job Search Agent - Generates smart queries and searches jobs"""
+import queue
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -12,6 +15,7 @@ from .state import AgentState
 
 # Import JobSpy
 from jobspy import scrape_jobs
+from jobspy.geo import normalize_location
 
 
 llm = ChatOpenAI(api_key=OPENAI_API_KEY, model=OPENAI_CHAT_MODEL, temperature=0.3)
@@ -37,11 +41,28 @@ Return ONLY a JSON array of search query strings. Example:
 ])
 
 
+def _raw_profile_input(raw_data: dict) -> dict:
+    """Query prompt input from the parsed resume, before the profile is enhanced"""
+    skills = raw_data.get("skills", {}) or {}
+    roles = [exp.get("role", "") for exp in raw_data.get("experience", []) if exp.get("role")]
+    return {
+        "target_roles": ", ".join(roles[:3]) if roles else "software developer",
+        "technical_skills": ", ".join(skills.get("technical", [])[:10]),
+        "tools": ", ".join(skills.get("tools", [])[:10]),
+        "years_exp": "unknown",
+        "summary": (raw_data.get("summary") or "")[:500],
+    }
+
+
 def generate_search_queries(state: AgentState) -> AgentState:
-    """Generate smart job search queries from resume profile"""
+    """
+    Generate smart job search queries from resume profile, or from the parsed resume
+    when the profile isn't enhanced yet (the async workflow runs both at once)
+    """
     profile = state.get("resume_profile")
+    raw_data = state.get("resume_raw", {})
     
-    if not profile:
+    if not profile and not raw_data:
         state["search_queries"] = ["software engineer"]  # Fallback
         return state
     
@@ -49,13 +70,17 @@ def generate_search_queries(state: AgentState) -> AgentState:
     
     try:
         import json
-        response = chain.invoke({
-            "target_roles": ", ".join(profile.target_roles) if profile.target_roles else "software developer",
-            "technical_skills": ", ".join(profile.skills.technical[:10]) if profile.skills.technical else "",
-            "tools": ", ".join(profile.skills.tools[:10]) if profile.skills.tools else "",
-            "years_exp": profile.years_of_experience,
-            "summary": profile.summary[:500] if profile.summary else "",
-        })
+        if profile:
+            prompt_input = {
+                "target_roles": ", ".join(profile.target_roles) if profile.target_roles else "software developer",
+                "technical_skills": ", ".join(profile.skills.technical[:10]) if profile.skills.technical else "",
+                "tools": ", ".join(profile.skills.tools[:10]) if profile.skills.tools else "",
+                "years_exp": profile.years_of_experience,
+                "summary": profile.summary[:500] if profile.summary else "",
+            }
+        else:
+            prompt_input = _raw_profile_input(raw_data)
+        response = chain.invoke(prompt_input)
         
         content = response.content
         # Extract JSON array
@@ -65,36 +90,45 @@ def generate_search_queries(state: AgentState) -> AgentState:
             queries = json.loads(content[start:end])
             state["search_queries"] = queries[:5]  # Max 5 queries
         else:
-            state["search_queries"] = profile.target_roles[:3] if profile.target_roles else ["software engineer"]
+            state["search_queries"] = profile.target_roles[:3] if profile and profile.target_roles else ["software engineer"]
             
     except Exception as e:
         state["errors"] = state.get("errors", []) + [f"Query generation failed: {str(e)}"]
-        state["search_queries"] = profile.target_roles[:3] if profile.target_roles else ["software engineer"]
+        state["search_queries"] = profile.target_roles[:3] if profile and profile.target_roles else ["software engineer"]
     
     state["current_step"] = "queries_generated"
     return state
 
 
-def search_jobs(state: AgentState) -> AgentState:
-    """Search jobs using JobSpy with generated queries"""
-    queries = state.get("search_queries", ["software engineer"])
+def search_location(state: AgentState) -> str:
+    """Location to search in: the preference, else the profile's, else the resume address"""
     preferences = state.get("search_preferences", {})
     profile = state.get("resume_profile")
     
     location = preferences.get("location", "") or preferences.get("desired_location", "") or preferences.get("current_location", "")
     if not location and profile and profile.preferred_locations:
         location = profile.preferred_locations[0]
+    if not location and not profile:
+        # The async workflow searches while the profile is still being enhanced
+        address = (state.get("resume_raw", {}).get("contact", {}) or {}).get("address", "")
+        location = address_location(address) if isinstance(address, str) else ""
     if not location:
         location = "United States"  # Default fallback
-    
-    all_jobs = []
-    seen_ids = set()
-    
-    is_remote = preferences.get("is_remote", False)
-    print(f"   [3/6] Searching jobs with {len(queries)} queries...")
-    print(f"         Location: '{location}', Remote: {is_remote}")
-    
-    # Detect country from location
+    return location
+
+
+def address_location(address: str) -> str:
+    """City, state and country of a resume address, or "" if it names no known place"""
+    # Street and postal code parts don't resolve, so the address is read from each
+    # part onwards and the first reading down to a city wins
+    parts = [part for part in re.sub(r"\d+", " ", address).split(",") if part.strip()]
+    places = [normalize_location(",".join(parts[i:])) for i in range(len(parts))]
+    place = next((p for p in places if p and p.kind == "city"), None) or next((p for p in places if p), None)
+    return place.display_name if place else ""
+
+
+def detect_country(location: str) -> str:
+    """Detect country from location"""
     location_lower = location.lower()
     if "india" in location_lower:
         country = "India"
@@ -108,7 +142,23 @@ def search_jobs(state: AgentState) -> AgentState:
         country = "Germany"
     else:
         country = "USA"
+    return country
+
+
+def search_jobs(state: AgentState) -> AgentState:
+    """Search jobs using JobSpy with generated queries"""
+    queries = state.get("search_queries", ["software engineer"])
+    preferences = state.get("search_preferences", {})
+    location = search_location(state)
     
+    all_jobs = []
+    seen_ids = set()
+    
+    is_remote = preferences.get("is_remote", False)
+    print(f"   [3/6] Searching jobs with {len(queries)} queries...")
+    print(f"         Location: '{location}', Remote: {is_remote}")
+    
+    country = detect_country(location)
     print(f"         Country detected: {country}")
     
     for i, query in enumerate(queries[:3]):  # Limit to 3 queries for speed
@@ -121,6 +171,7 @@ def search_jobs(state: AgentState) -> AgentState:
                 results_wanted=15,
                 hours_old=72,
                 country_indeed=country,
+                dedupe=True,
             )
             
             print(f"         Found {len(jobs_df)} jobs for query '{query}'")
@@ -140,3 +191,79 @@ def search_jobs(state: AgentState) -> AgentState:
     state["current_step"] = "jobs_searched"
     
     return state
+
+
+_SEARCH_DONE = object()
+
+
+class JobStream:
+    """
+    Jobs of all search queries as they are scraped. The queries run concurrently in
+    the background from the moment the stream is created; iterating yields batches of
+    new jobs (unique by id) as pages come in, until every search has finished.
+    Unlike search_jobs there is no cross-site dedupe, which needs all jobs at once.
+    """
+    
+    def __init__(self, queries: list[str], location: str, country: str, results_wanted: int = 15, hours_old: int = 72):
+        self.queries = queries
+        self.jobs: list[dict] = []  # Every job yielded so far
+        self.errors: list[str] = []
+        self.queue = queue.Queue()
+        self.seen_ids = set()
+        self.pool = ThreadPoolExecutor(max_workers=max(len(queries), 1), thread_name_prefix="job-search")
+        for query in queries:
+            self.pool.submit(self._search, query, location, country, results_wanted, hours_old)
+        self.pool.shutdown(wait=False)
+    
+    def _search(self, query: str, location: str, country: str, results_wanted: int, hours_old: int):
+        try:
+            jobs = scrape_jobs(
+                site_name=["indeed", "linkedin"],
+                search_term=query,
+                location=location,
+                results_wanted=results_wanted,
+                hours_old=hours_old,
+                country_indeed=country,
+                as_records=True,
+                on_jobs=self.queue.put,
+            )
+            print(f"         Found {len(jobs)} jobs for query '{query}'")
+        except Exception as e:
+            print(f"         ERROR: {str(e)}")
+            self.errors.append(f"Search failed for '{query}': {str(e)}")
+        finally:
+            self.queue.put(_SEARCH_DONE)
+    
+    def __iter__(self):
+        running = len(self.queries)
+        while running:
+            # Take everything that has arrived, so a slow consumer gets bigger batches
+            items = [self.queue.get()]
+            while True:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            batch = []
+            for item in items:
+                if item is _SEARCH_DONE:
+                    running -= 1
+                    continue
+                for job in item:
+                    job_id = str(job.get("id", ""))
+                    if job_id and job_id not in self.seen_ids:
+                        self.seen_ids.add(job_id)
+                        batch.append(job)
+            if batch:
+                self.jobs.extend(batch)
+                yield batch
+
+
+def stream_jobs(state: AgentState) -> JobStream:
+    """Start searching jobs for the generated queries, streaming them as they are found"""
+    queries = state.get("search_queries", ["software engineer"])[:3]  # Limit to 3 queries for speed
+    location = search_location(state)
+    country = detect_country(location)
+    print(f"   [3/6] Streaming jobs for {len(queries)} queries in '{location}' ({country})...")
+    return JobStream(queries, location, country)
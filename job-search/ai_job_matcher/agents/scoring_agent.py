@@ -1,24 +1,46 @@
 """Scoring Agent - Calculates match scores between resume and jobs"""
-import json
+import math
+from typing import Iterator
+
+import numpy as np
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 
-from ..config import OPENAI_API_KEY, OPENAI_CHAT_MODEL, SCORING_WEIGHTS
-from ..models import JobMatch
+from jobspy.geo import location_matches
+from jobspy.index import JobIndex
+
+from ..config import (
+    OPENAI_API_KEY, OPENAI_CHAT_MODEL, SCORING_WEIGHTS, KEYWORD_PREFILTER,
+    LOCATION_RADIUS_MILES, LLM_MAX_CONCURRENCY, LLM_TIMEOUT_SECONDS, LLM_MAX_RETRIES,
+    CACHE_PATH, REQUIREMENTS_CACHE_SIZE, ANALYSIS_TOP_K, ANALYSIS_MIN_SCORE,
+)
+from ..cache import JsonCache, cache_key
+from ..models import JobMatch, JobRequirements, MatchAnalysis
 from ..embeddings import SkillEmbeddings
 from .state import AgentState
 
 
-llm = ChatOpenAI(api_key=OPENAI_API_KEY, model=OPENAI_CHAT_MODEL, temperature=0)
+# Timeouts and retries (with backoff on rate limits and server errors) apply per call,
+# so one slow job doesn't hold up the rest of its batch
+llm = ChatOpenAI(
+    api_key=OPENAI_API_KEY,
+    model=OPENAI_CHAT_MODEL,
+    temperature=0,
+    timeout=LLM_TIMEOUT_SECONDS,
+    max_retries=LLM_MAX_RETRIES,
+)
 
 
+# Bump when SKILL_EXTRACTION_PROMPT changes,
+# so cached extractions from the old prompt are not reused
+SKILL_EXTRACTION_PROMPT_VERSION = 2
+
 SKILL_EXTRACTION_PROMPT = ChatPromptTemplate.from_messages([
-    ("system", """Extract required skills from this job description.
-Return JSON with:
-- required_skills: list of technical skills/technologies required
-- experience_years: estimated years required (int, 0 if not specified)
+    ("system", """Extract the requirements of this job description:
+- required_skills: technical skills/technologies required
+- experience_years: estimated years required (0 if not specified)
 - education_required: degree level if mentioned (e.g., "Bachelor's", "Master's", "")
-- is_remote: bool if remote work mentioned"""),
+- is_remote: whether remote work is mentioned"""),
     ("human", "Job: {title} at {company}\n\nDescription:\n{description}")
 ])
 
@@ -30,9 +52,7 @@ Provide:
 1. matching_skills: skills the candidate has that match the job
 2. missing_skills: important skills the job needs that candidate lacks
 3. match_reasons: 2-3 bullet points on why they're a good/bad fit
-4. overall_assessment: brief assessment
-
-Return as JSON."""),
+4. overall_assessment: brief assessment"""),
     ("human", """CANDIDATE PROFILE:
 Skills: {candidate_skills}
 Experience: {years_exp} years
@@ -42,145 +62,492 @@ JOB REQUIREMENTS:
 Title: {job_title}
 Required Skills: {job_skills}
 Experience needed: {job_exp} years
-Description: {job_desc}""")
+Education required: {job_education}
+Remote: {job_remote}""")
 ])
 
 
+def job_description(job: dict) -> str:
+    """Job description with NaN and None values as empty string"""
+    description = job.get("description", "")
+    if description is None or (isinstance(description, float) and math.isnan(description)):
+        return ""
+    return str(description)
+
+
+def empty_requirements(job: dict) -> dict:
+    return {
+        "required_skills": [],
+        "experience_years": 0,
+        "education_required": "",
+        "is_remote": job.get("is_remote", False)
+    }
+
+
+def candidate_input(profile) -> dict:
+    """Prompt input describing the candidate"""
+    # Handle education - could be dict or object
+    if profile.education:
+        edu = profile.education[0]
+        education_str = edu.degree if hasattr(edu, 'degree') else edu.get("degree", "")
+    else:
+        education_str = "Not specified"
+    return {
+        "candidate_skills": ", ".join(profile.skills.technical[:15]),
+        "years_exp": profile.years_of_experience,
+        "education": education_str,
+    }
+
+
 class JobScorer:
-    def __init__(self):
+    """
+    LLM replies are structured output (JSON schema), so there is no reply parsing.
+    A call that still fails is recorded in failures instead of passing for empty data.
+    """
+    
+    def __init__(self, requirements_cache: JsonCache | None = None):
         self.embeddings = SkillEmbeddings()
+        self.requirements_cache = requirements_cache or JsonCache(
+            CACHE_PATH, "job_requirements", REQUIREMENTS_CACHE_SIZE
+        )
+        self.llm_calls = 0
+        self.failures: list[str] = []
+    
+    def _requirements_input(self, job: dict) -> dict | None:
+        """Prompt input for requirement extraction, None if the description is too short"""
+        description = job_description(job)
+        if len(description) < 50:
+            return None
+        return {
+            "title": job.get("title", ""),
+            "company": job.get("company", ""),
+            "description": description[:2000]  # Limit length
+        }
+    
+    def _requirements_key(self, prompt_input: dict) -> str:
+        return cache_key(
+            prompt_input["title"],
+            prompt_input["company"],
+            prompt_input["description"],
+            SKILL_EXTRACTION_PROMPT_VERSION,
+            OPENAI_CHAT_MODEL,
+        )
+    
+    def _run_batch(self, chain, inputs: list[dict], what: str) -> list:
+        """Run a structured output chain over inputs concurrently; failed calls give None"""
+        if not inputs:
+            return []
+        self.llm_calls += len(inputs)
+        results = chain.batch(
+            inputs,
+            config={"max_concurrency": LLM_MAX_CONCURRENCY},
+            return_exceptions=True,
+        )
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                self.failures.append(f"{what} failed: {type(result).__name__}: {result}")
+                results[i] = None
+        return results
+    
+    def _lookup_requirements(self, jobs: list[dict]) -> tuple[list[dict], dict[str, tuple[dict, list[int]]]]:
+        """
+        Requirements of the jobs that need no LLM call (cached or too short to extract),
+        and the rest as {cache key: (prompt input, job indexes)} - identical jobs share a key
+        """
+        results = [empty_requirements(job) for job in jobs]
+        keyed = []
+        for i, job in enumerate(jobs):
+            prompt_input = self._requirements_input(job)
+            if prompt_input is not None:
+                keyed.append((i, prompt_input, self._requirements_key(prompt_input)))
+        cached = self.requirements_cache.get_many([key for _, _, key in keyed])
+        
+        pending = {}
+        for i, prompt_input, key in keyed:
+            if key in cached:
+                results[i] = cached[key]
+            else:
+                pending.setdefault(key, (prompt_input, []))[1].append(i)
+        return results, pending
     
     def extract_job_requirements(self, job: dict) -> dict:
         """Extract structured requirements from job description"""
-        import math
-        description = job.get("description", "")
-        # Handle NaN and None values
-        if description is None or (isinstance(description, float) and math.isnan(description)):
-            description = ""
-        if not description or len(str(description)) < 50:
-            return {
-                "required_skills": [],
-                "experience_years": 0,
-                "education_required": "",
-                "is_remote": job.get("is_remote", False)
-            }
-        
-        try:
-            chain = SKILL_EXTRACTION_PROMPT | llm
-            response = chain.invoke({
-                "title": job.get("title", ""),
-                "company": job.get("company", ""),
-                "description": description[:2000]  # Limit length
-            })
-            
-            content = response.content
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-            
-            return json.loads(content)
-        except:
-            return {
-                "required_skills": [],
-                "experience_years": 0,
-                "education_required": "",
-                "is_remote": False
-            }
-    
-    def calculate_scores(self, profile, job: dict, job_reqs: dict) -> dict:
-        """Calculate match scores"""
-        scores = {}
+        return self.extract_requirements_batch([job])[0]
+    
+    def extract_requirements_batch(self, jobs: list[dict]) -> list[dict]:
+        """
+        Extract requirements for many jobs, in job order. Jobs seen before (same title,
+        company and description) come from the cache; the rest are concurrent LLM calls.
+        """
+        results, pending = self._lookup_requirements(jobs)
+        chain = SKILL_EXTRACTION_PROMPT | llm.with_structured_output(JobRequirements)
+        replies = self._run_batch(
+            chain, [prompt_input for prompt_input, _ in pending.values()], "Requirement extraction"
+        )
         
-        # Technical skills score (semantic similarity)
+        extracted = {}
+        for (key, (_, indexes)), reply in zip(pending.items(), replies):
+            if reply is None:
+                continue
+            extracted[key] = reply.model_dump()
+            for i in indexes:
+                results[i] = extracted[key]
+        # Failed extractions are not cached, so the next run tries them again
+        self.requirements_cache.put_many(extracted)
+        return results
+    
+    def technical_scores(self, profile, all_reqs: list[dict]) -> list[float]:
+        """Technical skills score (semantic similarity) of every job, with batched embeddings"""
         candidate_skills = (
             profile.skills.technical + 
             profile.skills.tools + 
             profile.skills.languages
         )
-        job_skills = job_reqs.get("required_skills", [])
+        all_job_skills = [job_reqs.get("required_skills", []) for job_reqs in all_reqs]
+        if not candidate_skills:
+            return [0.5] * len(all_reqs)  # Neutral if no data
         
-        if candidate_skills and job_skills:
-            scores["technical_score"] = self.embeddings.calculate_skill_overlap(
-                job_skills, candidate_skills
-            )
-        else:
-            scores["technical_score"] = 0.5  # Neutral if no data
-        
-        # Experience score
-        candidate_exp = profile.years_of_experience
-        required_exp = job_reqs.get("experience_years", 0)
-        
-        if required_exp == 0:
-            scores["experience_score"] = 0.8  # No requirement = good
-        elif candidate_exp >= required_exp:
-            scores["experience_score"] = 1.0
-        elif candidate_exp >= required_exp - 2:
-            scores["experience_score"] = 0.7  # Close enough
-        else:
-            scores["experience_score"] = max(0.3, candidate_exp / required_exp)
-        
-        # Education score (simplified)
-        scores["education_score"] = 0.8  # Default good
+        overlaps = self.embeddings.calculate_skill_overlaps(all_job_skills, candidate_skills)
+        return [
+            overlap if job_skills else 0.5
+            for overlap, job_skills in zip(overlaps, all_job_skills)
+        ]
+    
+    def calculate_scores(self, profile, job: dict, job_reqs: dict, technical_score: float | None = None) -> dict:
+        """Calculate match scores, embedding the skills unless technical_score is given"""
+        scores = {}
         
-        # Location score
-        job_location = job.get("location", "").lower()
-        is_remote = job.get("is_remote", False) or job_reqs.get("is_remote", False)
+        if technical_score is None:
+            technical_score = self.technical_scores(profile, [job_reqs])[0]
+        scores["technical_score"] = technical_score
+        scores["experience_score"] = experience_score(
+            profile.years_of_experience, job_reqs.get("experience_years", 0)
+        )
+        scores["education_score"] = EDUCATION_SCORE
+        scores["location_score"] = location_score(
+            profile, job.get("location", ""), job.get("is_remote", False) or job_reqs.get("is_remote", False)
+        )
+        scores["overall_score"] = overall_score(scores)
         
-        if is_remote and profile.is_remote_preferred:
-            scores["location_score"] = 1.0
-        elif any(loc.lower() in job_location for loc in profile.preferred_locations):
-            scores["location_score"] = 1.0
-        elif is_remote:
-            scores["location_score"] = 0.9
-        else:
-            scores["location_score"] = 0.6
+        return scores
+    
+    def score_matrix(self, profiles: list, jobs: list[dict], all_reqs: list[dict]) -> dict[str, np.ndarray]:
+        """
+        calculate_scores for every profile (rows) and job (columns), as matrices by score
+        name. All skills are embedded once and compared in one matrix product; experience
+        and location are computed once per distinct value instead of once per pair.
+        """
+        all_candidate_skills = [
+            profile.skills.technical + profile.skills.tools + profile.skills.languages
+            for profile in profiles
+        ]
+        all_job_skills = [job_reqs.get("required_skills", []) for job_reqs in all_reqs]
+        technical = self.embeddings.skill_similarity_matrix(all_candidate_skills, all_job_skills)
+        # Neutral if no data
+        technical[[i for i, skills in enumerate(all_candidate_skills) if not skills], :] = 0.5
+        technical[:, [j for j, skills in enumerate(all_job_skills) if not skills]] = 0.5
         
-        # Overall weighted score
-        scores["overall_score"] = (
-            scores["technical_score"] * SCORING_WEIGHTS["technical_skills"] +
-            scores["experience_score"] * SCORING_WEIGHTS["experience_level"] +
-            scores["education_score"] * SCORING_WEIGHTS["education"] +
-            scores["location_score"] * SCORING_WEIGHTS["location"] +
-            0.5 * SCORING_WEIGHTS["soft_skills"]  # Default for soft skills
+        # Distinct years of experience on each side, looked up from a small table
+        candidate_years, candidate_index = np.unique(
+            [profile.years_of_experience for profile in profiles], return_inverse=True
+        )
+        required_years, required_index = np.unique(
+            [job_reqs.get("experience_years", 0) for job_reqs in all_reqs], return_inverse=True
         )
+        experience = np.array([
+            [experience_score(candidate_exp, required_exp) for required_exp in required_years]
+            for candidate_exp in candidate_years
+        ], dtype=np.float32).reshape(len(candidate_years), len(required_years))
+        experience = experience[candidate_index.reshape(-1)][:, required_index.reshape(-1)]
         
+        # Jobs by distinct (location, remote), scored once per profile
+        job_places = [
+            (safe_str(job.get("location"), ""), bool(job.get("is_remote", False) or job_reqs.get("is_remote", False)))
+            for job, job_reqs in zip(jobs, all_reqs)
+        ]
+        place_ids = {place: k for k, place in enumerate(dict.fromkeys(job_places))}
+        places = list(place_ids)
+        place_index = np.array([place_ids[place] for place in job_places], dtype=np.int64)
+        location = np.array([
+            [location_score(profile, job_location, is_remote) for job_location, is_remote in places]
+            for profile in profiles
+        ], dtype=np.float32).reshape(len(profiles), len(places))[:, place_index]
+        
+        scores = {
+            "technical_score": technical,
+            "experience_score": experience,
+            "education_score": np.full_like(technical, EDUCATION_SCORE),
+            "location_score": location,
+        }
+        scores["overall_score"] = overall_score(scores)
         return scores
     
-    def analyze_match(self, profile, job: dict, job_reqs: dict) -> dict:
-        """Get detailed match analysis from LLM"""
-        try:
-            # Handle education - could be dict or object
-            if profile.education:
-                edu = profile.education[0]
-                education_str = edu.degree if hasattr(edu, 'degree') else edu.get("degree", "")
+    
+    def analyze_match(self, profile, job: dict, job_reqs: dict) -> dict | None:
+        """Get detailed match analysis from LLM, None if the call failed"""
+        return self.analyze_matches_batch(profile, [job], [job_reqs])[0]
+    
+    def analyze_matches_batch(self, profile, jobs: list[dict], job_reqs: list[dict]) -> list[dict | None]:
+        """Get match analyses for many jobs with concurrent LLM calls, in job order"""
+        return self.analyze_pairs([(profile, job, reqs) for job, reqs in zip(jobs, job_reqs)])
+    
+    def analyze_pairs(self, pairs: list[tuple]) -> list[dict | None]:
+        """Match analyses of (profile, job, job requirements) pairs, of any mix of candidates, as one concurrent batch"""
+        candidates = {}
+        chain = MATCH_ANALYSIS_PROMPT | llm.with_structured_output(MatchAnalysis)
+        replies = self._run_batch(
+            chain,
+            [
+                {
+                    **candidates.setdefault(id(profile), candidate_input(profile)),
+                    "job_title": job.get("title", ""),
+                    "job_skills": ", ".join(reqs.get("required_skills", [])[:10]),
+                    "job_exp": reqs.get("experience_years", 0),
+                    "job_education": reqs.get("education_required") or "Not specified",
+                    "job_remote": "Yes" if reqs.get("is_remote") else "No",
+                }
+                for profile, job, reqs in pairs
+            ],
+            "Match analysis",
+        )
+        return [reply.model_dump() if reply is not None else None for reply in replies]
+
+
+def experience_score(candidate_exp: float, required_exp: float) -> float:
+    if required_exp == 0:
+        return 0.8  # No requirement = good
+    if candidate_exp >= required_exp:
+        return 1.0
+    if candidate_exp >= required_exp - 2:
+        return 0.7  # Close enough
+    return max(0.3, candidate_exp / required_exp)
+
+
+# Education score (simplified)
+EDUCATION_SCORE = 0.8  # Default good
+
+
+def location_score(profile, job_location: str, is_remote: bool) -> float:
+    job_location = job_location.lower()
+    if is_remote and profile.is_remote_preferred:
+        return 1.0
+    if any(
+        location_matches(job_location, loc, LOCATION_RADIUS_MILES)
+        or loc.lower() in job_location
+        for loc in profile.preferred_locations
+    ):
+        return 1.0
+    if is_remote:
+        return 0.9
+    return 0.6
+
+
+def overall_score(scores: dict):
+    """Overall weighted score, of single scores or of score matrices"""
+    return (
+        scores["technical_score"] * SCORING_WEIGHTS["technical_skills"] +
+        scores["experience_score"] * SCORING_WEIGHTS["experience_level"] +
+        scores["education_score"] * SCORING_WEIGHTS["education"] +
+        scores["location_score"] * SCORING_WEIGHTS["location"] +
+        0.5 * SCORING_WEIGHTS["soft_skills"]  # Default for soft skills
+    )
+
+
+def quick_match_analysis(profile, job_reqs: dict) -> dict:
+    """Matching and missing skills by name, for jobs that get no LLM analysis"""
+    candidate_skills = {
+        skill.lower()
+        for skill in profile.skills.technical + profile.skills.tools + profile.skills.languages
+    }
+    job_skills = job_reqs.get("required_skills", [])
+    return {
+        "matching_skills": [skill for skill in job_skills if skill.lower() in candidate_skills],
+        "missing_skills": [skill for skill in job_skills if skill.lower() not in candidate_skills],
+        "match_reasons": [],
+    }
+
+
+def shortlist_for_analysis(
+    all_scores: list[dict],
+    top_k: int = ANALYSIS_TOP_K,
+    min_score: float = ANALYSIS_MIN_SCORE,
+) -> list[int]:
+    """Indexes of the jobs worth an LLM match analysis: the top_k by cheap overall score, above min_score"""
+    ranked = sorted(range(len(all_scores)), key=lambda i: all_scores[i]["overall_score"], reverse=True)
+    return [i for i in ranked[:top_k] if all_scores[i]["overall_score"] >= min_score]
+
+
+class KeywordFilter:
+    """
+    Keyword prefilter over a job pool that can grow in batches, with one BM25 index for
+    the whole pool. Jobs that don't match are held back in rejected, so a caller can
+    still use them if nothing in the pool matched.
+    """
+    
+    def __init__(self, profile):
+        terms = profile.skills.technical + profile.skills.tools + profile.target_roles
+        self.query = " ".join(terms)
+        self.index = JobIndex()
+        self.matched = 0
+        self.rejected: list[dict] = []
+    
+    def add(self, jobs: list[dict]) -> list[dict]:
+        """Index jobs and return the ones that mention the candidate's skills or target roles"""
+        if not self.query:
+            return jobs
+        # A job whose key is already indexed keeps the doc it was indexed as
+        docs = [
+            self.index.add(job) if (job.get("id") or job.get("job_url")) not in self.index
+            else self.index.key_to_doc[job.get("id") or job.get("job_url")]
+            for job in jobs
+        ]
+        scores = self.index.scores(self.query)
+        kept = []
+        for job, doc in zip(jobs, docs):
+            if doc is not None and scores[doc] > 0:
+                kept.append(job)
             else:
-                education_str = "Not specified"
-            
-            chain = MATCH_ANALYSIS_PROMPT | llm
-            response = chain.invoke({
-                "candidate_skills": ", ".join(profile.skills.technical[:15]),
-                "years_exp": profile.years_of_experience,
-                "education": education_str,
-                "job_title": job.get("title", ""),
-                "job_skills": ", ".join(job_reqs.get("required_skills", [])[:10]),
-                "job_exp": job_reqs.get("experience_years", 0),
-                "job_desc": job.get("description", "")[:1000]
-            })
-            
-            content = response.content
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
+                self.rejected.append(job)
+        self.matched += len(kept)
+        return kept
+
+
+def keyword_prefilter(profile, jobs: list[dict]) -> list[dict]:
+    """Keep jobs whose title, skills or description mention the candidate's skills or target roles"""
+    keyword_filter = KeywordFilter(profile)
+    kept = keyword_filter.add(jobs)
+    if not keyword_filter.matched:
+        return jobs  # Nothing matched - don't throw the whole pool away
+    
+    return kept
+
+
+def safe_str(val, default=""):
+    if val is None or (isinstance(val, float) and math.isnan(val)):
+        return default
+    return str(val)
+
+
+def safe_float(val):
+    if val is None or (isinstance(val, float) and math.isnan(val)):
+        return None
+    return float(val)
+
+
+def build_job_match(job: dict, scores: dict, analysis: dict) -> JobMatch:
+    """Create JobMatch object - handle NaN values"""
+    return JobMatch(
+        job_id=safe_str(job.get("id"), ""),
+        title=safe_str(job.get("title"), ""),
+        company=safe_str(job.get("company"), ""),
+        location=safe_str(job.get("location"), ""),
+        job_url=safe_str(job.get("job_url"), ""),
+        description=safe_str(job.get("description"), "")[:500] if job.get("description") else "",
+        salary_min=safe_float(job.get("min_amount")),
+        salary_max=safe_float(job.get("max_amount")),
+        job_type=safe_str(job.get("job_type"), ""),
+        overall_score=round(scores["overall_score"], 2),
+        technical_score=round(scores["technical_score"], 2),
+        experience_score=round(scores["experience_score"], 2),
+        education_score=round(scores["education_score"], 2),
+        location_score=round(scores["location_score"], 2),
+        matching_skills=analysis.get("matching_skills", []),
+        missing_skills=analysis.get("missing_skills", []),
+        match_reasons=analysis.get("match_reasons", []),
+    )
+
+
+class IncrementalRanker:
+    """
+    Ranking of a job pool that grows in batches, e.g. while searches are still running.
+    Each batch gets its requirements extracted and is scored once. The LLM match analysis runs on the
+    analysis shortlist only: after every batch, or once when the pool is complete if the batches are
+    added with analyze=False, which keeps the analyses to ANALYSIS_TOP_K.
+    """
+    
+    def __init__(self, profile, resume_raw: dict | None = None, scorer: JobScorer | None = None):
+        self.profile = profile
+        self.scorer = scorer or JobScorer()
+        self.scorer.embeddings.create_resume_embeddings(resume_raw or {})
+        self.jobs: list[dict] = []
+        self.all_reqs: list[dict] = []
+        self.all_scores: list[dict] = []
+        self.analyses: list[dict | None] = []
+        self.analyzed = set()  # Jobs with an analysis attempt, even if it failed
+        self.extraction_calls = 0
+        self.match_analysis_calls = 0
+    
+    def add(self, jobs: list[dict], analyze: bool = True) -> list[JobMatch]:
+        """
+        Score a batch of new jobs and return the updated ranking.
+        :param analyze: also analyze the shortlist; without it, jobs rank with quick match analyses
+        """
+        if jobs:
+            # Requirements for every job: cached ones as is, the rest extracted with one
+            # concurrent, candidate-independent LLM call per job
+            calls = self.scorer.llm_calls
+            all_reqs = self.scorer.extract_requirements_batch(jobs)
+            self.extraction_calls += self.scorer.llm_calls - calls
             
-            return json.loads(content)
-        except:
-            return {
-                "matching_skills": [],
-                "missing_skills": [],
-                "match_reasons": []
-            }
+            # Quick scoring without LLM calls; skill embeddings are cached and batched
+            technical = self.scorer.technical_scores(self.profile, all_reqs)
+            self.jobs += jobs
+            self.all_reqs += all_reqs
+            self.all_scores += [
+                self.scorer.calculate_scores(self.profile, job, job_reqs, technical_score)
+                for job, job_reqs, technical_score in zip(jobs, all_reqs, technical)
+            ]
+            self.analyses += [None] * len(jobs)
+        
+        return self.analyze_shortlist() if analyze else self.ranked()
+    
+    def analyze_shortlist(self) -> list[JobMatch]:
+        """Analyze the shortlisted jobs that have no analysis yet and return the updated ranking"""
+        # Detailed analysis for better skill gap data, as concurrent LLM calls, only for the
+        # jobs that can still make the top of the ranking and weren't analyzed yet; the rest
+        # get skill gaps by name
+        shortlist = [i for i in shortlist_for_analysis(self.all_scores) if i not in self.analyzed]
+        shortlisted = self.scorer.analyze_matches_batch(
+            self.profile, [self.jobs[i] for i in shortlist], [self.all_reqs[i] for i in shortlist]
+        )
+        for i, analysis in zip(shortlist, shortlisted):
+            self.analyses[i] = analysis
+        self.analyzed.update(shortlist)
+        self.match_analysis_calls += len(shortlist)
+        
+        return self.ranked()
+    
+    def ranked(self) -> list[JobMatch]:
+        """All jobs so far as JobMatch objects, best first"""
+        job_matches = [
+            build_job_match(
+                job, scores,
+                analysis if analysis is not None else quick_match_analysis(self.profile, job_reqs),
+            )
+            for job, job_reqs, scores, analysis in zip(self.jobs, self.all_reqs, self.all_scores, self.analyses)
+        ]
+        job_matches.sort(key=lambda x: x.overall_score, reverse=True)
+        return job_matches
+    
+    def report(self) -> dict:
+        """
+        LLM and embedding usage so far. Each kind of call is counted against its own
+        baseline of one per job: extractions saved by the cache, analyses by the shortlist.
+        """
+        extractions_saved = len(self.jobs) - self.extraction_calls
+        analyses_saved = len(self.jobs) - self.match_analysis_calls
+        return {
+            "jobs_scored": len(self.jobs),
+            "requirement_cache_hits": self.scorer.requirements_cache.stats()["hits"],
+            "extraction_calls": self.extraction_calls,
+            "match_analysis_calls": self.match_analysis_calls,
+            "llm_calls": self.scorer.llm_calls,
+            "extractions_saved": extractions_saved,
+            "analyses_saved": analyses_saved,
+            "llm_calls_saved": extractions_saved + analyses_saved,
+            "failed_llm_calls": len(self.scorer.failures),
+            "embedding_calls": self.scorer.embeddings.embedding_calls,
+        }
 
 
 def score_jobs(state: AgentState) -> AgentState:
@@ -192,68 +559,138 @@ def score_jobs(state: AgentState) -> AgentState:
         state["job_matches"] = []
         return state
     
-    scorer = JobScorer()
+    if KEYWORD_PREFILTER:
+        kept = keyword_prefilter(profile, jobs)
+        print(f"         Keyword prefilter kept {len(kept)}/{len(jobs)} jobs")
+        jobs = kept
     
-    # Create embeddings from resume
-    scorer.embeddings.create_resume_embeddings(state.get("resume_raw", {}))
+    ranker = IncrementalRanker(profile, state.get("resume_raw", {}))
     
-    job_matches = []
+    print(f"   [4/6] Scoring {len(jobs)} jobs ({LLM_MAX_CONCURRENCY} concurrent LLM calls)...")
+    job_matches = ranker.add(jobs)
+    report = ranker.report()
+    stats = ranker.scorer.requirements_cache.stats()
+    print(f"         Requirements cache: {stats['hits']} hits, {stats['misses']} misses")
+    print(f"         Embedded skills with {report['embedding_calls']} embedding calls")
+    print(f"         Analyzed {report['match_analysis_calls']} top matches")
     
-    # First pass: quick scoring without LLM calls
-    print(f"   [4/6] Scoring {len(jobs)} jobs...")
-    
-    for i, job in enumerate(jobs):
-        if i % 10 == 0:
-            print(f"         Processing job {i+1}/{len(jobs)}...")
-        
-        # Extract job requirements (with LLM for jobs with descriptions)
-        job_reqs = scorer.extract_job_requirements(job)
-        
-        # Calculate scores
-        scores = scorer.calculate_scores(profile, job, job_reqs)
-        
-        # Get detailed analysis for better skill gap data
-        analysis = scorer.analyze_match(profile, job, job_reqs)
-        
-        # Create JobMatch object - handle NaN values
-        import math
-        def safe_str(val, default=""):
-            if val is None or (isinstance(val, float) and math.isnan(val)):
-                return default
-            return str(val)
-        
-        def safe_float(val):
-            if val is None or (isinstance(val, float) and math.isnan(val)):
-                return None
-            return float(val)
-        
-        match = JobMatch(
-            job_id=safe_str(job.get("id"), ""),
-            title=safe_str(job.get("title"), ""),
-            company=safe_str(job.get("company"), ""),
-            location=safe_str(job.get("location"), ""),
-            job_url=safe_str(job.get("job_url"), ""),
-            description=safe_str(job.get("description"), "")[:500] if job.get("description") else "",
-            salary_min=safe_float(job.get("min_amount")),
-            salary_max=safe_float(job.get("max_amount")),
-            job_type=safe_str(job.get("job_type"), ""),
-            overall_score=round(scores["overall_score"], 2),
-            technical_score=round(scores["technical_score"], 2),
-            experience_score=round(scores["experience_score"], 2),
-            education_score=round(scores["education_score"], 2),
-            location_score=round(scores["location_score"], 2),
-            matching_skills=analysis.get("matching_skills", []),
-            missing_skills=analysis.get("missing_skills", []),
-            match_reasons=analysis.get("match_reasons", []),
-        )
-        
-        job_matches.append(match)
-    
-    # Sort by overall score
-    job_matches.sort(key=lambda x: x.overall_score, reverse=True)
+    if ranker.scorer.failures:
+        print(f"         {len(ranker.scorer.failures)} LLM calls failed")
+        state["errors"] = state.get("errors", []) + ranker.scorer.failures
     
     state["job_matches"] = job_matches
     state["top_matches"] = job_matches[:10]  # Top 10
+    state["scoring_report"] = report
+    print(f"         {report['llm_calls']} LLM calls, {report['llm_calls_saved']} saved")
     state["current_step"] = "jobs_scored"
     
     return state
+
+
+def score_job_stream(state: AgentState, batches) -> Iterator[AgentState]:
+    """
+    Score jobs batch by batch as a search streams them in, yielding the state with the
+    ranking so far after each batch. jobs_found grows with the batches.
+    """
+    profile = state.get("resume_profile")
+    state["jobs_found"] = []
+    state["job_matches"] = []
+    if not profile:
+        for batch in batches:
+            state["jobs_found"] = state["jobs_found"] + batch
+        yield state
+        return
+    
+    ranker = IncrementalRanker(profile, state.get("resume_raw", {}))
+    keyword_filter = KeywordFilter(profile) if KEYWORD_PREFILTER else None
+    errors = state.get("errors", [])
+    
+    def update(job_matches: list[JobMatch]):
+        state["job_matches"] = job_matches
+        state["top_matches"] = job_matches[:10]  # Top 10
+        state["scoring_report"] = ranker.report()
+        state["errors"] = errors + ranker.scorer.failures
+    
+    for batch in batches:
+        state["jobs_found"] = state["jobs_found"] + batch
+        if keyword_filter is not None:
+            batch = keyword_filter.add(batch)
+            if not batch:
+                continue
+        # Ranked with quick match analyses while the pool grows, so a shortlist that is
+        # still changing doesn't cost analyses of jobs that later drop out of it
+        job_matches = ranker.add(batch, analyze=False)
+        print(f"   [4/6] Scored {len(ranker.jobs)} jobs so far, best {job_matches[0].overall_score:.2f}")
+        update(job_matches)
+        state["current_step"] = "jobs_scoring"
+        yield state
+    
+    # Same as keyword_prefilter on the whole pool: if nothing matched, score everything
+    if keyword_filter is not None and not keyword_filter.matched and keyword_filter.rejected:
+        ranker.add(keyword_filter.rejected, analyze=False)
+    
+    if ranker.jobs:
+        update(ranker.analyze_shortlist())
+        print(f"         Analyzed {ranker.match_analysis_calls} top matches")
+    state["current_step"] = "jobs_scored"
+    yield state
+
+
+def match_job_pool(
+    profiles: list,
+    jobs: list[dict],
+    top_k: int = ANALYSIS_TOP_K,
+    min_score: float = ANALYSIS_MIN_SCORE,
+    scorer: JobScorer | None = None,
+) -> tuple[list[list[JobMatch]], dict]:
+    """
+    Match many candidates against one job pool. Requirements are extracted (or read from
+    the cache) once per job, and every candidate is scored against every job as one set of
+    score matrices. Only each candidate's top_k jobs get an LLM match analysis, all of them
+    in one concurrent batch.
+    
+    Returns each profile's top_k matches, best first, and a report of the LLM and embedding usage.
+    """
+    scorer = scorer or JobScorer()
+    all_reqs = scorer.extract_requirements_batch(jobs)
+    extraction_calls = scorer.llm_calls
+    scores = scorer.score_matrix(profiles, jobs, all_reqs)
+    overall = scores["overall_score"]
+    
+    # Each candidate's shortlist, best first, without sorting whole rows
+    k = min(top_k, len(jobs))
+    shortlists = []
+    for row in overall:
+        top = np.argpartition(-row, k - 1)[:k] if k else np.empty(0, dtype=np.int64)
+        top = top[np.argsort(-row[top], kind="stable")]
+        shortlists.append([int(j) for j in top if row[j] >= min_score])
+    
+    pairs = [(i, j) for i, shortlist in enumerate(shortlists) for j in shortlist]
+    analyses = scorer.analyze_pairs([(profiles[i], jobs[j], all_reqs[j]) for i, j in pairs])
+    
+    matches = [[] for _ in profiles]
+    for (i, j), analysis in zip(pairs, analyses):
+        pair_scores = {name: float(matrix[i, j]) for name, matrix in scores.items()}
+        if analysis is None:
+            analysis = quick_match_analysis(profiles[i], all_reqs[j])
+        matches[i].append(build_job_match(jobs[j], pair_scores, analysis))
+    
+    # Each kind of call against its own baseline: one extraction per job and resume
+    # (as separate runs would make), one analysis per pair
+    extractions_saved = len(profiles) * len(jobs) - extraction_calls
+    analyses_saved = len(profiles) * len(jobs) - len(pairs)
+    report = {
+        "resumes": len(profiles),
+        "jobs_scored": len(jobs),
+        "pairs_scored": len(profiles) * len(jobs),
+        "requirement_cache_hits": scorer.requirements_cache.stats()["hits"],
+        "extraction_calls": extraction_calls,
+        "match_analysis_calls": len(pairs),
+        "llm_calls": scorer.llm_calls,
+        "extractions_saved": extractions_saved,
+        "analyses_saved": analyses_saved,
+        "llm_calls_saved": extractions_saved + analyses_saved,
+        "failed_llm_calls": len(scorer.failures),
+        "embedding_calls": scorer.embeddings.embedding_calls,
+    }
+    return matches, report
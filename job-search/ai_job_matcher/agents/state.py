@@ -23,6 +23,7 @@ class AgentState(TypedDict):
     # Matching & Scoring
     job_matches: list[JobMatch]  # Jobs with scores
     top_matches: list[JobMatch]  # Top N matches
+    scoring_report: dict  # LLM calls made and saved while scoring
     
     # Career guidance
     career_guidance: CareerGuidance | None
@@ -33,3 +34,22 @@ class AgentState(TypedDict):
     # Status
     current_step: str
     errors: list[str]
+
+
+def _latest(_, new):
+    return new
+
+
+def _merge(old: dict, new: dict) -> dict:
+    return {**old, **new}
+
+
+class ParallelAgentState(AgentState):
+    """
+    State of the async workflow, whose branches run concurrently. Nodes return only
+    the keys they change, so keys that several nodes write need reducers.
+    """
+    
+    errors: Annotated[list[str], add]  # New errors of each node are appended
+    current_step: Annotated[str, _latest]
+    node_timings: Annotated[dict, _merge]  # Node name -> seconds
@@ -0,0 +1,181 @@
+"""Persistent caches for LLM and embedding results, shared across pipeline runs"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+
+def cache_key(*parts) -> str:
+    """Stable hash of the given values (anything JSON serializable)"""
+    data = json.dumps(parts, ensure_ascii=False, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class KeyValueCache:
+    """
+    SQLite key/value cache with least-recently-used eviction and hit-rate stats.
+    Several caches can live in one database file as separate tables.
+    """
+
+    def __init__(self, path: str, table: str, max_entries: int = 50_000):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.table = table
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, used REAL NOT NULL)"
+        )
+        self.conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_used ON {table} (used)")
+        self.conn.commit()
+
+    def get_many(self, keys: list[str]) -> dict[str, bytes]:
+        """Values of the keys found in the cache"""
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        with self.lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(self.conn.execute(
+                    f"SELECT key, value FROM {self.table} WHERE key IN ({placeholders})", chunk
+                ).fetchall())
+            if found:
+                now = time.time()
+                self.conn.executemany(
+                    f"UPDATE {self.table} SET used = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                self.conn.commit()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def get(self, key: str) -> bytes | None:
+        return self.get_many([key]).get(key)
+
+    def put_many(self, items: dict[str, bytes]):
+        if not items:
+            return
+        now = time.time()
+        with self.lock:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, used) VALUES (?, ?, ?)",
+                [(key, value, now) for key, value in items.items()],
+            )
+            self._evict()
+            self.conn.commit()
+
+    def put(self, key: str, value: bytes):
+        self.put_many({key: value})
+
+    def _evict(self):
+        count = self.conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        if count > self.max_entries:
+            self.conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN "
+                f"(SELECT key FROM {self.table} ORDER BY used LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def stats(self) -> dict:
+        """Entries stored, plus hits and misses since this cache was opened"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        with self.lock:
+            self.conn.execute(f"DELETE FROM {self.table}")
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+class JsonCache(KeyValueCache):
+    """KeyValueCache holding JSON values"""
+
+    def get_many(self, keys: list[str]) -> dict[str, dict]:
+        return {
+            key: json.loads(value)
+            for key, value in super().get_many(keys).items()
+        }
+
+    def put_many(self, items: dict[str, dict]):
+        super().put_many({
+            key: json.dumps(value, ensure_ascii=False).encode("utf-8")
+            for key, value in items.items()
+        })
+
+
+class EmbeddingCache:
+    """
+    Embedding vectors of one model by text: an in-memory LRU in front of a
+    KeyValueCache, which keeps them as float32 bytes keyed on (model, text) hashes
+    """
+
+    def __init__(self, path: str, model: str, memory_size: int = 10_000, max_entries: int = 200_000):
+        self.model = model
+        self.disk = KeyValueCache(path, "embeddings", max_entries)
+        self.memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self.memory_size = memory_size
+        self.memory_hits = 0
+        self.lock = threading.Lock()
+
+    def _remember(self, text: str, vector: np.ndarray):
+        self.memory[text] = vector
+        self.memory.move_to_end(text)
+        while len(self.memory) > self.memory_size:
+            self.memory.popitem(last=False)
+
+    def get_many(self, texts: list[str]) -> dict[str, np.ndarray]:
+        """Vectors of the texts found in memory or on disk"""
+        found = {}
+        with self.lock:
+            for text in texts:
+                if text in self.memory:
+                    self.memory.move_to_end(text)
+                    found[text] = self.memory[text]
+            self.memory_hits += len(found)
+        rest = [text for text in dict.fromkeys(texts) if text not in found]
+        if rest:
+            keys = {cache_key(self.model, text): text for text in rest}
+            stored = self.disk.get_many(list(keys))
+            with self.lock:
+                for key, value in stored.items():
+                    vector = np.frombuffer(value, dtype=np.float32)
+                    found[keys[key]] = vector
+                    self._remember(keys[key], vector)
+        return found
+
+    def put_many(self, vectors: dict[str, np.ndarray]):
+        vectors = {text: np.asarray(vector, dtype=np.float32) for text, vector in vectors.items()}
+        with self.lock:
+            for text, vector in vectors.items():
+                self._remember(text, vector)
+        self.disk.put_many({
+            cache_key(self.model, text): vector.tobytes()
+            for text, vector in vectors.items()
+        })
+
+    def stats(self) -> dict:
+        """Disk cache stats, plus hits served from memory"""
+        return {**self.disk.stats(), "memory_hits": self.memory_hits}
@@ -13,10 +13,27 @@ OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
 OPENAI_CHAT_MODEL = "gpt-4o-mini"
 GROQ_CHAT_MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
 
+# Embedding backend: "openai" (OPENAI_EMBEDDING_MODEL over the API) or "local"
+# (an ONNX sentence-transformers model on CPU, all-MiniLM-L6-v2 by default - no network
+# once the model is downloaded, or point LOCAL_EMBEDDING_MODEL_DIR at model.onnx + tokenizer.json)
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "openai")
+LOCAL_EMBEDDING_MODEL_DIR = os.getenv("LOCAL_EMBEDDING_MODEL_DIR", "")
+LOCAL_EMBEDDING_BATCH_SIZE = 64
+LOCAL_EMBEDDING_THREADS = None  # ONNX Runtime threads, None = all cores
+
 # ChromaDB
 CHROMA_PERSIST_DIR = "./chroma_db"
 COLLECTION_NAME = "job_skills"
 
+# Persistent cache of LLM results (SQLite), shared across runs and resumes
+CACHE_PATH = "./matcher_cache.db"
+REQUIREMENTS_CACHE_SIZE = 50_000  # Least recently used entries are evicted beyond this
+EMBEDDING_CACHE_SIZE = 200_000
+EMBEDDING_MEMORY_CACHE_SIZE = 10_000  # Vectors also kept in memory, per process
+
+# Texts sent per embedding request
+EMBEDDING_BATCH_SIZE = 256
+
 # Scoring weights
 SCORING_WEIGHTS = {
     "technical_skills": 0.40,
@@ -25,3 +42,19 @@ SCORING_WEIGHTS = {
     "soft_skills": 0.10,
     "location": 0.10,
 }
+
+# Jobs within this distance of a preferred city get a full location score
+LOCATION_RADIUS_MILES = 50
+
+# Scoring LLM calls run as concurrent batches; each call times out and is retried on its own
+LLM_MAX_CONCURRENCY = 8
+LLM_TIMEOUT_SECONDS = 30
+LLM_MAX_RETRIES = 2
+
+# Two-stage ranking: every job gets the cheap scores (embeddings, experience, location),
+# only the best ANALYSIS_TOP_K of them an LLM match analysis
+ANALYSIS_TOP_K = 15
+ANALYSIS_MIN_SCORE = 0.0  # Jobs whose cheap overall score is below this are never analyzed
+
+# Drop jobs matching none of the candidate's skills/roles (BM25 index) before LLM scoring
+KEYWORD_PREFILTER = True
@@ -1,21 +1,93 @@
-"""Vector embeddings and similarity search using ChromaDB + OpenAI"""
+"""Vector embeddings and similarity search using ChromaDB + OpenAI or a local model"""
+import threading
+
 import chromadb
+import numpy as np
+from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
 from langchain_chroma import Chroma
 
-from .config import OPENAI_API_KEY, CHROMA_PERSIST_DIR, OPENAI_EMBEDDING_MODEL
+from .cache import EmbeddingCache
+from .similarity import similarity_matrix
+from .config import (
+    OPENAI_API_KEY, CHROMA_PERSIST_DIR, OPENAI_EMBEDDING_MODEL, CACHE_PATH,
+    EMBEDDING_CACHE_SIZE, EMBEDDING_MEMORY_CACHE_SIZE, EMBEDDING_BATCH_SIZE,
+    EMBEDDING_BACKEND, LOCAL_EMBEDDING_MODEL_DIR, LOCAL_EMBEDDING_BATCH_SIZE,
+    LOCAL_EMBEDDING_THREADS,
+)
+
+
+def create_embedding_backend(backend: str = EMBEDDING_BACKEND) -> tuple[Embeddings, str]:
+    """The configured embedding model and its name (which keys its cached vectors)"""
+    if backend == "openai":
+        return OpenAIEmbeddings(api_key=OPENAI_API_KEY, model=OPENAI_EMBEDDING_MODEL), OPENAI_EMBEDDING_MODEL
+    if backend == "local":
+        from .local_embeddings import OnnxEmbeddings
+        
+        embeddings = OnnxEmbeddings(
+            LOCAL_EMBEDDING_MODEL_DIR or None,
+            batch_size=LOCAL_EMBEDDING_BATCH_SIZE,
+            threads=LOCAL_EMBEDDING_THREADS,
+        )
+        return embeddings, f"local/{embeddings.model_name}"
+    raise ValueError(f"Unknown EMBEDDING_BACKEND: {backend}")
+
+
+_backends: dict[str, tuple[Embeddings, str]] = {}
+_backends_lock = threading.Lock()
+_caches: dict[str, EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(model: str) -> EmbeddingCache:
+    """Process-wide cache of a model's embeddings, so its in-memory part outlives one scoring run"""
+    with _caches_lock:
+        if model not in _caches:
+            _caches[model] = EmbeddingCache(
+                CACHE_PATH, model, EMBEDDING_MEMORY_CACHE_SIZE, EMBEDDING_CACHE_SIZE
+            )
+        return _caches[model]
+
+
+def get_embedding_backend(backend: str = EMBEDDING_BACKEND) -> tuple[Embeddings, str]:
+    """Process-wide embedding model, so a local model is loaded once"""
+    with _backends_lock:
+        if backend not in _backends:
+            _backends[backend] = create_embedding_backend(backend)
+        return _backends[backend]
 
 
 class SkillEmbeddings:
     """Handles skill embeddings and similarity search"""
     
-    def __init__(self):
-        self.embeddings = OpenAIEmbeddings(
-            api_key=OPENAI_API_KEY,
-            model=OPENAI_EMBEDDING_MODEL
-        )
+    def __init__(self, cache: EmbeddingCache | None = None, backend: str = EMBEDDING_BACKEND):
+        self.embeddings, self.model_name = get_embedding_backend(backend)
         self.client = chromadb.PersistentClient(path=CHROMA_PERSIST_DIR)
         self.vectorstore = None
+        # Vectors of different models have different sizes and can't share a collection
+        self.collection_name = "resume_skills" if backend == "openai" else f"resume_skills_{backend}"
+        self.cache = cache or get_embedding_cache(self.model_name)
+        self.embedding_calls = 0
+    
+    def embed_texts(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed texts as the rows of a matrix. Cached texts are not sent again, and the
+        rest go out in requests of EMBEDDING_BATCH_SIZE texts.
+        """
+        vectors = self.cache.get_many(texts)
+        missing = [text for text in dict.fromkeys(texts) if text not in vectors]
+        for start in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+            chunk = missing[start:start + EMBEDDING_BATCH_SIZE]
+            embedded = {
+                text: np.asarray(vector, dtype=np.float32)
+                for text, vector in zip(chunk, self.embeddings.embed_documents(chunk))
+            }
+            self.embedding_calls += 1
+            self.cache.put_many(embedded)
+            vectors.update(embedded)
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([vectors[text] for text in texts])
     
     def create_resume_embeddings(self, resume_data: dict) -> Chroma:
         """Create embeddings from resume skills and experience"""
@@ -54,7 +126,7 @@ class SkillEmbeddings:
             texts=documents,
             embedding=self.embeddings,
             metadatas=metadatas,
-            collection_name="resume_skills",
+            collection_name=self.collection_name,
             persist_directory=CHROMA_PERSIST_DIR
         )
         return self.vectorstore
@@ -80,18 +152,25 @@ class SkillEmbeddings:
     
     def calculate_skill_overlap(self, job_skills: list[str], resume_skills: list[str]) -> float:
         """Calculate semantic skill overlap using embeddings"""
-        if not job_skills or not resume_skills:
-            return 0.0
-        
-        job_text = " ".join(job_skills)
-        resume_text = " ".join(resume_skills)
-        
-        job_embedding = self.embeddings.embed_query(job_text)
-        resume_embedding = self.embeddings.embed_query(resume_text)
+        return self.calculate_skill_overlaps([job_skills], resume_skills)[0]
+    
+    def calculate_skill_overlaps(self, job_skills_list: list[list[str]], resume_skills: list[str]) -> list[float]:
+        """Calculate semantic skill overlap of many jobs with one resume"""
+        return self.skill_similarity_matrix([resume_skills], job_skills_list)[0].tolist()
+    
+    def skill_similarity_matrix(self, resume_skills_list: list[list[str]], job_skills_list: list[list[str]]) -> np.ndarray:
+        """
+        Semantic skill overlap of every resume (rows) with every job (columns), 0 where
+        either has no skills. All skill strings are embedded in batched calls and the
+        similarities computed as one matrix product.
+        """
+        scores = np.zeros((len(resume_skills_list), len(job_skills_list)), dtype=np.float32)
+        resumes = [i for i, skills in enumerate(resume_skills_list) if skills]
+        jobs = [j for j, skills in enumerate(job_skills_list) if skills]
+        if not resumes or not jobs:
+            return scores
         
-        # Cosine similarity
-        import numpy as np
-        similarity = np.dot(job_embedding, resume_embedding) / (
-            np.linalg.norm(job_embedding) * np.linalg.norm(resume_embedding)
-        )
-        return float(similarity)
+        texts = [" ".join(resume_skills_list[i]) for i in resumes] + [" ".join(job_skills_list[j]) for j in jobs]
+        matrix = self.embed_texts(texts)
+        scores[np.ix_(resumes, jobs)] = similarity_matrix(matrix[:len(resumes)], matrix[len(resumes):])
+        return scores
@@ -0,0 +1,99 @@
+"""Local CPU sentence embeddings with ONNX Runtime - no API calls, no network once the model is on disk"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+def default_model_dir() -> Path:
+    """all-MiniLM-L6-v2 as ONNX, shared with ChromaDB's default embedding function"""
+    from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
+
+    model_dir = ONNXMiniLM_L6_V2.DOWNLOAD_PATH / ONNXMiniLM_L6_V2.EXTRACTED_FOLDER_NAME
+    if not (model_dir / "model.onnx").exists():
+        ONNXMiniLM_L6_V2()(["download"])  # Fetches and unpacks the model, once
+    return model_dir
+
+
+class OnnxEmbeddings(Embeddings):
+    """
+    Mean-pooled, normalized sentence embeddings from a BERT-style ONNX model
+    (all-MiniLM-L6-v2 and similar sentence-transformers exports).
+
+    Texts are sorted by length so each batch is padded only to its longest text,
+    and the next batch is tokenized on a worker thread while the current one runs.
+    """
+
+    def __init__(
+        self,
+        model_dir: str | None = None,
+        batch_size: int = 64,
+        max_length: int = 256,
+        threads: int | None = None,
+    ):
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        model_dir = Path(model_dir) if model_dir else default_model_dir()
+        self.model_name = model_dir.parent.name if model_dir.name == "onnx" else model_dir.name
+        self.batch_size = batch_size
+
+        self.tokenizer = Tokenizer.from_file(str(model_dir / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding(pad_id=0, pad_token="[PAD]")
+
+        options = onnxruntime.SessionOptions()
+        options.log_severity_level = 3
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = threads or os.cpu_count() or 1
+        self.session = onnxruntime.InferenceSession(
+            str(model_dir / "model.onnx"), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+        self.tokenizer_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tokenizer")
+
+    def _tokenize(self, texts: list[str]) -> dict[str, np.ndarray]:
+        encoded = self.tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encoded], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encoded], dtype=np.int64)
+        inputs = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            inputs["token_type_ids"] = np.zeros_like(input_ids)
+        return inputs
+
+    def _forward(self, inputs: dict[str, np.ndarray]) -> np.ndarray:
+        token_states = self.session.run(None, inputs)[0]
+        mask = inputs["attention_mask"][:, :, None].astype(np.float32)
+        pooled = (token_states * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return (pooled / np.clip(norms, 1e-12, None)).astype(np.float32)
+
+    def embed_array(self, texts: list[str]) -> np.ndarray:
+        """Embed texts as the rows of a float32 matrix"""
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        batches = [
+            [texts[i] for i in order[start:start + self.batch_size]]
+            for start in range(0, len(order), self.batch_size)
+        ]
+
+        vectors = []
+        pending = self.tokenizer_pool.submit(self._tokenize, batches[0])
+        for n in range(len(batches)):
+            inputs = pending.result()
+            if n + 1 < len(batches):
+                pending = self.tokenizer_pool.submit(self._tokenize, batches[n + 1])
+            vectors.append(self._forward(inputs))
+
+        result = np.empty((len(texts), vectors[0].shape[1]), dtype=np.float32)
+        result[order] = np.concatenate(vectors)
+        return result
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.embed_array(texts).tolist()
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_array([text])[0].tolist()
@@ -3,8 +3,10 @@ AI Job Matcher - Main Entry Point
 
 Usage:
     python -m ai_job_matcher.main --resume path/to/resume.pdf --location "New York" --remote
+    python -m ai_job_matcher.main --resume path/to/resume.pdf --stream
 """
 import argparse
+import asyncio
 import json
 from pathlib import Path
 
@@ -19,6 +21,7 @@ def main():
     parser.add_argument("--salary", "-s", type=int, default=0, help="Minimum salary")
     parser.add_argument("--output", "-o", default="results.json", help="Output JSON file")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--stream", action="store_true", help="Score jobs as they are found, showing the best match so far")
     
     args = parser.parse_args()
     
@@ -40,12 +43,24 @@ def main():
     print("⏳ Processing... (this may take a few minutes)")
     print("   [1/6] Parsing resume...")
     
-    result = pipeline.run(
-        resume_path=str(resume_path),
-        location=args.location,
-        remote=args.remote,
-        min_salary=args.salary,
-    )
+    if args.stream:
+        result = {}
+        for result in pipeline.stream(
+            resume_path=str(resume_path),
+            location=args.location,
+            remote=args.remote,
+            min_salary=args.salary,
+        ):
+            if result.get("top_matches"):
+                best = result["top_matches"][0]
+                print(f"         Best so far: {best.title} at {best.company} ({best.overall_score * 100:.0f}%)")
+    else:
+        result = asyncio.run(pipeline.arun(
+            resume_path=str(resume_path),
+            location=args.location,
+            remote=args.remote,
+            min_salary=args.salary,
+        ))
     
     # Print summary
     summary = pipeline.get_summary(result)
@@ -57,6 +72,8 @@ def main():
         "search_queries": result.get("search_queries", []),
         "total_jobs_found": len(result.get("jobs_found", [])),
         "top_matches": [m.model_dump() for m in result.get("top_matches", [])],
+        "scoring_report": result.get("scoring_report", {}),
+        "node_timings": result.get("node_timings", {}),
         "career_guidance": result["career_guidance"].model_dump() if result.get("career_guidance") else None,
         "errors": result.get("errors", []),
     }
@@ -94,3 +94,19 @@ class CareerGuidance(BaseModel):
     career_paths: list[str] = []
     interview_tips: list[str] = []
     salary_insights: str = ""
+
+
+class JobRequirements(BaseModel):
+    """Requirements extracted from a job description"""
+    required_skills: list[str] = Field(description="Technical skills/technologies required")
+    experience_years: int = Field(description="Estimated years of experience required, 0 if not specified")
+    education_required: str = Field(description="Degree level if mentioned (e.g. \"Bachelor's\", \"Master's\"), else empty")
+    is_remote: bool = Field(description="Whether remote work is mentioned")
+
+
+class MatchAnalysis(BaseModel):
+    """LLM analysis of how a candidate fits a job"""
+    matching_skills: list[str] = Field(description="Skills the candidate has that match the job")
+    missing_skills: list[str] = Field(description="Important skills the job needs that the candidate lacks")
+    match_reasons: list[str] = Field(description="2-3 short points on why they're a good/bad fit")
+    overall_assessment: str = Field(description="Brief assessment")
@@ -0,0 +1,32 @@
+"""Vectorized cosine similarity between candidate and job embeddings"""
+import numpy as np
+
+
+def normalize_rows(matrix) -> np.ndarray:
+    """Scale each row to unit length; all-zero rows stay zero"""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
+    inverse = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+    return matrix * inverse[:, None]
+
+
+def similarity_matrix(candidates, jobs) -> np.ndarray:
+    """
+    Cosine similarity of every candidate (rows) with every job (columns).
+    Each side is normalized once and the M x N result is a single matmul.
+    """
+    return normalize_rows(candidates) @ normalize_rows(jobs).T
+
+
+class SimilarityIndex:
+    """Job embeddings normalized once, to score any number of candidates against them"""
+
+    def __init__(self, jobs):
+        self.jobs = normalize_rows(jobs)
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def scores(self, candidates) -> np.ndarray:
+        """Cosine similarity of every candidate (rows) with every job (columns)"""
+        return normalize_rows(candidates) @ self.jobs.T
@@ -1,11 +1,20 @@
 """LangGraph Workflow - Orchestrates the entire job matching pipeline"""
+import asyncio
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
 from langgraph.graph import StateGraph, END
 
-from .agents.state import AgentState
+from .agents.state import AgentState, ParallelAgentState
 from .agents.resume_agent import parse_resume, enhance_profile
-from .agents.job_search_agent import generate_search_queries, search_jobs
-from .agents.scoring_agent import score_jobs
+from .agents.job_search_agent import (
+    generate_search_queries, search_jobs, stream_jobs, search_location, detect_country, JobStream,
+)
+from .agents.scoring_agent import score_jobs, score_job_stream, match_job_pool, JobScorer
 from .agents.career_coach_agent import generate_career_guidance
+from .config import LLM_MAX_CONCURRENCY, ANALYSIS_TOP_K
 
 
 def should_continue(state: AgentState) -> str:
@@ -41,11 +50,79 @@ def create_workflow() -> StateGraph:
     return workflow.compile()
 
 
+def _run_steps(steps: tuple, state: dict) -> tuple[dict, dict]:
+    timings = {}
+    for name, node in steps:
+        started = time.perf_counter()
+        state = node(state)
+        timings[name] = round(time.perf_counter() - started, 3)
+    return state, timings
+
+
+def async_node(*steps):
+    """
+    Async node for the parallel workflow, running the given (name, node) steps one
+    after another. The blocking steps run in a worker thread on their own copy of the
+    state, so branches don't wait on each other, and only the keys they changed are
+    returned, with their new errors and the time each step took.
+    """
+    async def run(state: ParallelAgentState) -> dict:
+        result, timings = await asyncio.to_thread(_run_steps, steps, dict(state))
+        
+        update = {
+            key: value for key, value in result.items()
+            if key not in ("errors", "messages", "node_timings")
+            and (key not in state or value is not state[key])
+        }
+        update["errors"] = (result.get("errors") or [])[len(state.get("errors") or []):]
+        update["node_timings"] = timings
+        return update
+    
+    return run
+
+
+def create_async_workflow() -> StateGraph:
+    """
+    Create the async LangGraph workflow (run it with ainvoke). Branches that don't
+    depend on each other run concurrently:
+    
+        parse_resume --> enhance_profile ----------------------> score_jobs --> career_guidance
+                     \-> find_jobs (generate_queries, search_jobs) -/
+    
+    Queries are generated from the parsed resume and searched while the profile is
+    enhanced, and scoring starts once both the profile and the jobs are in. Query
+    generation and search share a node because LangGraph runs a step's nodes in
+    lockstep: as separate nodes, the search would also wait for enhance_profile.
+    """
+    workflow = StateGraph(ParallelAgentState)
+    
+    workflow.add_node("parse_resume", async_node(("parse_resume", parse_resume)))
+    workflow.add_node("enhance_profile", async_node(("enhance_profile", enhance_profile)))
+    workflow.add_node("find_jobs", async_node(
+        ("generate_queries", generate_search_queries),
+        ("search_jobs", search_jobs),
+    ))
+    workflow.add_node("score_jobs", async_node(("score_jobs", score_jobs)))
+    workflow.add_node("career_guidance", async_node(("career_guidance", generate_career_guidance)))
+    
+    workflow.set_entry_point("parse_resume")
+    
+    # Fan out after parsing, fan in before scoring
+    workflow.add_edge("parse_resume", "enhance_profile")
+    workflow.add_edge("parse_resume", "find_jobs")
+    workflow.add_edge(["enhance_profile", "find_jobs"], "score_jobs")
+    workflow.add_edge("score_jobs", "career_guidance")
+    workflow.add_edge("career_guidance", END)
+    
+    return workflow.compile()
+
+
 class JobMatcherPipeline:
     """Main interface for the AI Job Matcher"""
     
     def __init__(self):
         self.workflow = create_workflow()
+        self.async_workflow = create_async_workflow()
     
     def run(
         self,
@@ -66,7 +143,145 @@ class JobMatcherPipeline:
         Returns:
             Complete results including matches and guidance
         """
-        initial_state = {
+        initial_state = self._initial_state(resume_path, location, remote, min_salary)
+        
+        # Run workflow
+        result = self.workflow.invoke(initial_state)
+        
+        return result
+    
+    async def arun(
+        self,
+        resume_path: str,
+        location: str = "",
+        remote: bool = False,
+        min_salary: int = 0,
+    ) -> dict:
+        """
+        Run the pipeline on the async workflow, with independent steps in parallel.
+        Same arguments and results as run, plus node_timings (seconds per node).
+        """
+        initial_state = self._initial_state(resume_path, location, remote, min_salary)
+        initial_state["node_timings"] = {}
+        
+        return await self.async_workflow.ainvoke(initial_state)
+    
+    def stream(
+        self,
+        resume_path: str,
+        location: str = "",
+        remote: bool = False,
+        min_salary: int = 0,
+    ) -> Iterator[dict]:
+        """
+        Run the pipeline with search and scoring pipelined: jobs are scored page by page
+        as the searches return them, instead of after the last search finishes.
+        
+        Yields the state (the same dict, updated) whenever the ranking changes, then once
+        more with career guidance. The last state has the same keys as arun's result.
+        """
+        state = self._initial_state(resume_path, location, remote, min_salary)
+        state, timings = _run_steps((("parse_resume", parse_resume),), state)
+        
+        # Enhance the profile while the queries generated from the parsed resume are searched
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="enhance-profile") as pool:
+            known_errors = len(state.get("errors", []))
+            enhancing = pool.submit(_run_steps, (("enhance_profile", enhance_profile),), dict(state))
+            state, query_timings = _run_steps((("generate_queries", generate_search_queries),), state)
+            started = time.perf_counter()
+            jobs = stream_jobs(state)
+            enhanced, enhance_timings = enhancing.result()
+        state["resume_profile"] = enhanced.get("resume_profile")
+        state["errors"] = state.get("errors", []) + enhanced.get("errors", [])[known_errors:]
+        timings.update(enhance_timings)
+        timings.update(query_timings)
+        state["node_timings"] = timings
+        
+        for state in score_job_stream(state, jobs):
+            yield state
+        state["errors"] = state.get("errors", []) + jobs.errors
+        timings["search_and_score"] = round(time.perf_counter() - started, 3)
+        
+        state, guidance_timings = _run_steps((("career_guidance", generate_career_guidance),), state)
+        timings.update(guidance_timings)
+        state["node_timings"] = timings
+        yield state
+    
+    def match_many(
+        self,
+        resumes: list[str],
+        job_pool: list[dict] | None = None,
+        location: str = "",
+        remote: bool = False,
+        min_salary: int = 0,
+        top_k: int = ANALYSIS_TOP_K,
+        max_queries: int = 10,
+    ) -> dict:
+        """
+        Match many resumes against one job pool: the jobs are searched, their requirements
+        extracted and their skills embedded once for all resumes, every resume is scored
+        against every job at once, and only each resume's top_k jobs get an LLM analysis.
+        
+        Args:
+            resumes: Paths to resume PDFs
+            job_pool: Jobs to match (row dicts or a scrape_jobs DataFrame); searched with
+                the resumes' most common queries (up to max_queries) when not given
+            top_k: Matches returned (and analyzed) per resume
+            
+        Returns:
+            {"results": one state per resume with its top_matches (no career guidance),
+             "jobs_found": the job pool, "scoring_report": LLM and embedding usage, "errors": pool-level issues}
+        """
+        if job_pool is not None and hasattr(job_pool, "to_dict"):
+            job_pool = job_pool.to_dict("records")
+        
+        steps = (("parse_resume", parse_resume), ("enhance_profile", enhance_profile))
+        if job_pool is None:
+            steps += (("generate_queries", generate_search_queries),)
+        
+        # Resumes are parsed and profiled concurrently - these are LLM calls
+        print(f"   [1/6] Profiling {len(resumes)} resumes...")
+        with ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY, thread_name_prefix="resume") as pool:
+            states = [
+                state for state, _ in pool.map(
+                    lambda path: _run_steps(steps, self._initial_state(path, location, remote, min_salary)),
+                    resumes,
+                )
+            ]
+        
+        errors = []
+        if job_pool is None:
+            queries = Counter(query for state in states for query in dict.fromkeys(state["search_queries"]))
+            state = self._initial_state("", location, remote, min_salary)
+            location = search_location(state)
+            jobs = JobStream([query for query, _ in queries.most_common(max_queries)], location, detect_country(location))
+            for _ in jobs:
+                pass  # Wait for every search
+            job_pool = jobs.jobs
+            errors += jobs.errors
+        
+        profiled = [state for state in states if state.get("resume_profile")]
+        print(f"   [4/6] Scoring {len(profiled)} resumes x {len(job_pool)} jobs...")
+        scorer = JobScorer()
+        matches, report = match_job_pool(
+            [state["resume_profile"] for state in profiled], job_pool, top_k=top_k, scorer=scorer
+        )
+        for state, job_matches in zip(profiled, matches):
+            state["job_matches"] = job_matches
+            state["top_matches"] = job_matches[:10]  # Top 10
+            state["current_step"] = "jobs_scored"
+        errors += scorer.failures
+        print(f"         {report['llm_calls']} LLM calls, {report['llm_calls_saved']} saved")
+        
+        return {
+            "results": states,
+            "jobs_found": job_pool,
+            "scoring_report": report,
+            "errors": errors,
+        }
+    
+    def _initial_state(self, resume_path: str, location: str, remote: bool, min_salary: int) -> dict:
+        return {
             "resume_path": resume_path,
             "search_preferences": {
                 "location": location,
@@ -79,16 +294,12 @@ class JobMatcherPipeline:
             "jobs_found": [],
             "job_matches": [],
             "top_matches": [],
+            "scoring_report": {},
             "career_guidance": None,
             "messages": [],
             "current_step": "starting",
             "errors": [],
         }
-        
-        # Run workflow
-        result = self.workflow.invoke(initial_state)
-        
-        return result
     
     def get_summary(self, result: dict) -> str:
         """Generate a human-readable summary of results"""
@@ -107,6 +318,12 @@ class JobMatcherPipeline:
             summary.append(f"🎯 Target Roles: {', '.join(profile.target_roles[:3])}")
         
         summary.append(f"\n📋 JOBS ANALYZED: {len(result.get('job_matches', []))}")
+        report = result.get("scoring_report") or {}
+        if report:
+            summary.append(
+                f"🤖 LLM calls: {report['extraction_calls']} extractions, "
+                f"{report['match_analysis_calls']} match analyses ({report['llm_calls_saved']} saved)"
+            )
         
         if top_matches:
             summary.append("\n🏆 TOP 5 MATCHES:")
@@ -146,6 +363,10 @@ class JobMatcherPipeline:
                 summary.append(f"\n💰 Salary Insights:")
                 summary.append(f"   {guidance.salary_insights}")
         
+        if result.get("node_timings"):
+            timings = result["node_timings"]
+            summary.append(f"\n⏱️ Step times: " + ", ".join(f"{name} {seconds:.1f}s" for name, seconds in timings.items()))
+        
         if result.get("errors"):
             summary.append(f"\n⚠️ Warnings: {len(result['errors'])} issues encountered")
         
@@ -0,0 +1,118 @@
+"""
+Compares the single-pass Google job extractor with the previous parser.
+
+    python benchmarks/google_parse.py                       # synthetic pages
+    python benchmarks/google_parse.py page.html async.txt   # captured responses
+
+Captured files are classified by content: async callback payloads start with
+")]}'" or "[[[", anything else is treated as an initial search page.
+"""
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jobspy.google.util import iter_job_infos
+
+
+def legacy_find_job_info(jobs_data):
+    if isinstance(jobs_data, dict):
+        for key, value in jobs_data.items():
+            if key == "520084652" and isinstance(value, list):
+                return value
+            result = legacy_find_job_info(value)
+            if result:
+                return result
+    elif isinstance(jobs_data, list):
+        for item in jobs_data:
+            result = legacy_find_job_info(item)
+            if result:
+                return result
+    return None
+
+
+def legacy_initial(html_text):
+    pattern = '520084652":(' + r"\[.*?\]\s*])\s*}\s*]\s*]\s*]\s*]\s*]"
+    return [json.loads(m.group(1)) for m in re.finditer(pattern, html_text)]
+
+
+def legacy_async(job_data):
+    start_idx = job_data.find("[[[")
+    end_idx = job_data.rindex("]]]") + 3
+    parsed = json.loads(job_data[start_idx:end_idx])[0]
+    infos = []
+    for _, inner in parsed:
+        if inner.startswith("[[["):
+            infos.append(legacy_find_job_info(json.loads(inner)))
+    return infos
+
+
+def synthetic_job(i):
+    description = (
+        f'Role #{i}: build "robust" services [Python/Go] at scale.\n'
+        "Requirements:\n- 5+ years\n- C:\\\\tools \u00e9t\u00e9 <b>bold</b>\n" * 40
+    )
+    job = [None] * 30
+    job[0] = f"Software Engineer {i}"
+    job[1] = f"Company {i}"
+    job[2] = "Austin, TX, United States"
+    job[3] = [[f"https://example.com/jobs/{i}", "apply"]]
+    job[12] = f"{i % 7} days ago"
+    job[19] = description
+    job[28] = f"job{i}"
+    job[29] = [1, [2, [3]]]
+    return job
+
+
+def synthetic_pages(n_jobs=10):
+    jobs = [synthetic_job(i) for i in range(n_jobs)]
+    blocks = "".join(
+        f'<script>AF_initDataCallback({{data:[[[[[{{"520084652":{json.dumps(job)}}}]]]]]]}});</script>'
+        for job in jobs
+    )
+    initial = "<html><body>" + "<div>filler</div>" * 2000 + blocks + "</body></html>"
+    inner = [
+        [f"id{i}", json.dumps([[[None, {"520084652": job}]]], ensure_ascii=False)]
+        for i, job in enumerate(jobs)
+    ]
+    async_payload = (
+        ")]}'\n"
+        + json.dumps([inner], ensure_ascii=False)
+        + '<div jsname="Yust4d" data-async-fc="cursor"></div>'
+    )
+    return [("initial", initial), ("async", async_payload)]
+
+
+def timeit(fn, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(text)
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    if len(sys.argv) > 1:
+        pages = []
+        for path in sys.argv[1:]:
+            text = Path(path).read_text(encoding="utf-8")
+            kind = "async" if text.lstrip().startswith((")]}'", "[[[")) else "initial"
+            pages.append((kind, text))
+    else:
+        pages = synthetic_pages()
+
+    for kind, text in pages:
+        legacy = legacy_async if kind == "async" else legacy_initial
+        legacy_ms, expected = timeit(legacy, text, 20)
+        new_ms, found = timeit(lambda t: list(iter_job_infos(t)), text, 20)
+        status = "ok" if found == expected else "MISMATCH"
+        print(
+            f"{kind:8} {len(text) / 1024:8.1f} KiB  {len(found):3} jobs  "
+            f"legacy {legacy_ms:7.2f} ms  single-pass {new_ms:7.2f} ms  {status}"
+        )
+
+
+if __name__ == "__main__":
+    main()
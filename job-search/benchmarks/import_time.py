@@ -0,0 +1,85 @@
+"""
+Measures how long `import jobspy` takes in a fresh interpreter.
+
+    python benchmarks/import_time.py                 # median of 5 runs, slowest modules
+    python benchmarks/import_time.py --max-ms 400    # exit 1 if slower (for CI)
+
+Every run also checks that no heavy dependency is loaded by the bare import;
+those are only imported by the scrapers or features that use them.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# must stay out of sys.modules after `import jobspy`
+LAZY_MODULES = ["pandas", "numpy", "tls_client", "markdownify", "bs4", "regex"]
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+loaded = [m for m in {lazy!r} if m in sys.modules]
+print(round(elapsed, 1), ",".join(loaded))
+"""
+
+
+def run_probe(module: str) -> tuple[float, list[str]]:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, lazy=LAZY_MODULES)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return float(output[0]), output[1].split(",") if len(output) > 1 else []
+
+
+def slowest_imports(module: str, top: int) -> list[tuple[int, str]]:
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        timings.append((int(cumulative), name.rstrip()))
+    return sorted(timings, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="jobspy")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list")
+    parser.add_argument("--max-ms", type=float, help="fail if the median exceeds this")
+    args = parser.parse_args()
+
+    results = [run_probe(args.module) for _ in range(args.runs)]
+    median = statistics.median(ms for ms, _ in results)
+    loaded = sorted({m for _, modules in results for m in modules})
+    print(f"import {args.module}: median {median:.1f} ms over {args.runs} runs")
+    for cumulative, name in slowest_imports(args.module, args.top):
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    failed = False
+    if loaded:
+        print(f"FAIL: eagerly imported {', '.join(loaded)}")
+        failed = True
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"FAIL: median {median:.1f} ms exceeds {args.max_ms:.1f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
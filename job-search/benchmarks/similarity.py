@@ -0,0 +1,68 @@
+"""
+Compares per-job cosine similarity in a Python loop with the matrix scorer.
+
+    python benchmarks/similarity.py                          # 10k jobs, 1 and 10 resumes
+    python benchmarks/similarity.py --jobs 50000 --resumes 100
+
+Uses random vectors of the OpenAI embedding size, so it needs no API key.
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from ai_job_matcher.similarity import SimilarityIndex, similarity_matrix
+
+
+def loop_scores(candidates: np.ndarray, jobs: np.ndarray) -> np.ndarray:
+    """The previous scorer: one np.dot / np.linalg.norm per candidate and job"""
+    scores = np.empty((len(candidates), len(jobs)), dtype=np.float32)
+    for i, candidate in enumerate(candidates):
+        for j, job in enumerate(jobs):
+            scores[i, j] = np.dot(job, candidate) / (np.linalg.norm(job) * np.linalg.norm(candidate))
+    return scores
+
+
+def timed(fn, *args, runs: int) -> tuple[float, np.ndarray]:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=10_000)
+    parser.add_argument("--resumes", type=int, default=10)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--skip-loop", action="store_true", help="only time the matrix scorer")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    jobs = rng.standard_normal((args.jobs, args.dim), dtype=np.float32)
+    candidates = rng.standard_normal((args.resumes, args.dim), dtype=np.float32)
+
+    index_ms, index = timed(SimilarityIndex, jobs, runs=args.runs)
+    print(f"normalize {args.jobs} jobs once: {index_ms:.1f} ms")
+    for m in sorted({1, args.resumes}):
+        matrix_ms, scores = timed(similarity_matrix, candidates[:m], jobs, runs=args.runs)
+        indexed_ms, _ = timed(index.scores, candidates[:m], runs=args.runs)
+        line = f"{m} x {args.jobs}: matrix {matrix_ms:7.1f} ms   prepared index {indexed_ms:7.1f} ms"
+        if not args.skip_loop:
+            loop_ms, expected = timed(loop_scores, candidates[:m], jobs, runs=1)
+            error = float(np.abs(scores - expected).max())
+            line += f"   loop {loop_ms:8.1f} ms ({loop_ms / matrix_ms:.0f}x)   max error {error:.1e}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,15 @@
 from __future__ import annotations
 
+import functools
+import importlib
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Tuple
-
-import pandas as pd
-
-from jobspy.bayt import BaytScraper
-from jobspy.bdjobs import BDJobs
-from jobspy.glassdoor import Glassdoor
-from jobspy.google import Google
-from jobspy.indeed import Indeed
-from jobspy.linkedin import LinkedIn
-from jobspy.naukri import Naukri
-from jobspy.model import JobType, Location, JobResponse, Country
-from jobspy.model import SalarySource, ScraperInput, Site
+from datetime import date
+from typing import TYPE_CHECKING, Callable, Tuple
+
+from jobspy.executor import SharedExecutor
+from jobspy.model import JobPost, JobType, Location, JobResponse, Country
+from jobspy.model import SalarySource, Scraper, ScraperInput, Site
+from jobspy.trace import Tracer, span, wrap_context
 from jobspy.util import (
     set_logger_level,
     extract_salary,
@@ -23,11 +19,72 @@ from jobspy.util import (
     convert_to_annual,
     desired_order,
 )
-from jobspy.ziprecruiter import ZipRecruiter
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from jobspy.index import JobIndex
+    from jobspy.spill import SpilledJobs
+    from jobspy.store import JobStore
+
+# scraper modules (and the parsers they pull in) are only imported for the
+# sites a call actually scrapes
+SCRAPER_MAPPING: dict[Site, str] = {
+    Site.LINKEDIN: "jobspy.linkedin:LinkedIn",
+    Site.INDEED: "jobspy.indeed:Indeed",
+    Site.ZIP_RECRUITER: "jobspy.ziprecruiter:ZipRecruiter",
+    Site.GLASSDOOR: "jobspy.glassdoor:Glassdoor",
+    Site.GOOGLE: "jobspy.google:Google",
+    Site.BAYT: "jobspy.bayt:BaytScraper",
+    Site.NAUKRI: "jobspy.naukri:Naukri",
+    Site.BDJOBS: "jobspy.bdjobs:BDJobs",
+}
+
+# names importable from the package without loading their modules up front
+_lazy_attributes = {
+    **{path.split(":")[1]: path for path in SCRAPER_MAPPING.values()},
+    "JobDeduplicator": "jobspy.dedupe:JobDeduplicator",
+    "JobIndex": "jobspy.index:JobIndex",
+    "JobStore": "jobspy.store:JobStore",
+}
+
+
+def _load(path: str):
+    module, name = path.split(":")
+    return getattr(importlib.import_module(module), name)
+
+
+def get_scraper_class(site: Site) -> type[Scraper]:
+    """Imports and returns the scraper class of a site"""
+    return _load(SCRAPER_MAPPING[site])
+
+
+def __getattr__(name: str):
+    if name in _lazy_attributes:
+        value = _load(_lazy_attributes[name])
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _trace_call(fn):
+    """Runs scrape_jobs under the tracer given as its trace argument, saving it if a path was given"""
 
-# Update the SCRAPER_MAPPING dictionary in the scrape_jobs function
+    @functools.wraps(fn)
+    def wrapper(*args, trace: str | Tracer | None = None, **kwargs):
+        if trace is None:
+            return fn(*args, **kwargs)
+        tracer = trace if isinstance(trace, Tracer) else Tracer()
+        with tracer, span("scrape_jobs", "call"):
+            result = fn(*args, **kwargs)
+        if not isinstance(trace, Tracer):
+            tracer.save(trace)
+        return result
 
+    return wrapper
+
+
+@_trace_call
 def scrape_jobs(
     site_name: str | list[str] | Site | list[Site] | None = None,
     search_term: str | None = None,
@@ -49,22 +106,27 @@ def scrape_jobs(
     enforce_annual_salary: bool = False,
     verbose: int = 0,
     user_agent: str = None,
+    dedupe: bool = False,
+    store: str | JobStore | None = None,
+    index: JobIndex | None = None,
+    geocode: bool = False,
+    scrapers: dict[Site, Scraper] | None = None,
+    naukri_fan_out: bool = False,
+    ziprecruiter_detail_policy: str = "truncated",
+    executor: SharedExecutor | None = None,
+    as_records: bool = False,
+    spill: bool = False,
+    on_jobs: Callable[[list[dict]], None] | None = None,
+    trace: str | Tracer | None = None,
     **kwargs,
-) -> pd.DataFrame:
+) -> pd.DataFrame | list[dict] | SpilledJobs:
     """
     Scrapes job data from job boards concurrently
-    :return: Pandas DataFrame containing job data
+    :param on_jobs: called from the scraper threads with each page of jobs as row dicts
+        (the as_records columns, before dedupe) as soon as it is scraped
+    :return: Pandas DataFrame containing job data, a list of row dicts with as_records,
+        or a lazily loaded SpilledJobs with spill
     """
-    SCRAPER_MAPPING = {
-        Site.LINKEDIN: LinkedIn,
-        Site.INDEED: Indeed,
-        Site.ZIP_RECRUITER: ZipRecruiter,
-        Site.GLASSDOOR: Glassdoor,
-        Site.GOOGLE: Google,
-        Site.BAYT: BaytScraper,
-        Site.NAUKRI: Naukri,
-        Site.BDJOBS: BDJobs,  # Add BDJobs to the scraper mapping
-    }
     set_logger_level(verbose)
     job_type = get_enum_from_value(job_type) if job_type else None
 
@@ -97,14 +159,142 @@ def scrape_jobs(
         linkedin_fetch_description=linkedin_fetch_description,
         results_wanted=results_wanted,
         linkedin_company_ids=linkedin_company_ids,
+        naukri_fan_out=naukri_fan_out,
+        ziprecruiter_detail_policy=ziprecruiter_detail_policy,
         offset=offset,
         hours_old=hours_old,
     )
 
+    if geocode:
+        from jobspy.geo import geo_columns, normalize_location
+    columns = desired_order + geo_columns if geocode else desired_order
+
+    def to_row(site: str, job: JobPost) -> dict:
+        job_data = job.dict()
+        job_url = job_data["job_url"]
+        job_data["site"] = site
+        job_data["company"] = job_data["company_name"]
+        job_data["job_type"] = (
+            ", ".join(job_type.value[0] for job_type in job_data["job_type"])
+            if job_data["job_type"]
+            else None
+        )
+        job_data["emails"] = (
+            ", ".join(job_data["emails"]) if job_data["emails"] else None
+        )
+        if job_data["location"]:
+            job_data["location"] = Location(
+                **job_data["location"]
+            ).display_location()
+        if geocode:
+            place = normalize_location(job_data["location"])
+            job_data["place_id"] = place.id if place else None
+            job_data["latitude"] = place.lat if place else None
+            job_data["longitude"] = place.lon if place else None
+
+        # Handle compensation
+        compensation_obj = job_data.get("compensation")
+        if compensation_obj and isinstance(compensation_obj, dict):
+            job_data["interval"] = (
+                compensation_obj.get("interval").value
+                if compensation_obj.get("interval")
+                else None
+            )
+            job_data["min_amount"] = compensation_obj.get("min_amount")
+            job_data["max_amount"] = compensation_obj.get("max_amount")
+            job_data["currency"] = compensation_obj.get("currency", "USD")
+            job_data["salary_source"] = SalarySource.DIRECT_DATA.value
+            if enforce_annual_salary and (
+                job_data["interval"]
+                and job_data["interval"] != "yearly"
+                and job_data["min_amount"]
+                and job_data["max_amount"]
+            ):
+                convert_to_annual(job_data)
+        else:
+            if country_enum == Country.USA:
+                (
+                    job_data["interval"],
+                    job_data["min_amount"],
+                    job_data["max_amount"],
+                    job_data["currency"],
+                ) = extract_salary(
+                    job_data["description"],
+                    enforce_annual_salary=enforce_annual_salary,
+                )
+                job_data["salary_source"] = SalarySource.DESCRIPTION.value
+
+        job_data["salary_source"] = (
+            job_data["salary_source"]
+            if "min_amount" in job_data and job_data["min_amount"]
+            else None
+        )
+
+        #naukri-specific fields
+        job_data["skills"] = (
+            ", ".join(job_data["skills"]) if job_data["skills"] else None
+        )
+        job_data["experience_range"] = job_data.get("experience_range")
+        job_data["company_rating"] = job_data.get("company_rating")
+        job_data["company_reviews_count"] = job_data.get("company_reviews_count")
+        job_data["vacancy_count"] = job_data.get("vacancy_count")
+        job_data["work_from_home_type"] = job_data.get("work_from_home_type")
+
+        return job_data
+
+    def to_record(site: str, job: JobPost) -> dict:
+        row = to_row(site, job)
+        return {column: row.get(column) for column in columns}
+
+    spill_writer = None
+    if spill:
+        if dedupe:
+            raise ValueError("dedupe compares every job in memory and cannot be used with spill")
+        from jobspy.spill import SpillWriter
+
+        spill_writer = SpillWriter(columns)
+
+    def spill_jobs(site: Site, jobs: list[JobPost]):
+        if index is not None:
+            index.add_many(jobs)
+        with span("spill", "convert", jobs=len(jobs)):
+            spill_writer.write([to_row(site.value, job) for job in jobs])
+
     def scrape_site(site: Site) -> Tuple[str, JobResponse]:
-        scraper_class = SCRAPER_MAPPING[site]
-        scraper = scraper_class(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
+        # scrapers passed in are reused across calls so their sessions stay warm
+        scraper = scrapers.get(site) if scrapers is not None else None
+        if scraper is None:
+            scraper_class = get_scraper_class(site)
+            scraper = scraper_class(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
+            if scrapers is not None:
+                scrapers[site] = scraper
+        else:
+            scraper.reset()
+        if executor is not None:
+            scraper.executor = executor
+        streamed: list[JobPost] = []
+
+        def job_sink(jobs: list[JobPost]):
+            if on_jobs is not None:
+                on_jobs([to_record(site.value, job) for job in jobs])
+            if spill_writer is not None:
+                spill_jobs(site, jobs)
+            else:
+                streamed.extend(jobs)
+
+        if spill_writer is not None or on_jobs is not None:
+            # streaming scrapers hand over each page instead of keeping it
+            scraper.job_sink = job_sink
+        try:
+            with span("scrape", "site", site=site.value):
+                scraped_data: JobResponse = scraper.scrape(scraper_input)
+        finally:
+            scraper.job_sink = None
+        if on_jobs is not None and scraped_data.jobs:
+            # jobs of scrapers that don't stream arrive all at once
+            on_jobs([to_record(site.value, job) for job in scraped_data.jobs])
+        if streamed:
+            scraped_data.jobs = streamed + scraped_data.jobs
         cap_name = site.value.capitalize()
         site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
         site_name = "LinkedIn" if cap_name == "Linkedin" else cap_name
@@ -117,87 +307,63 @@ def scrape_jobs(
         site_val, scraped_info = scrape_site(site)
         return site_val, scraped_info
 
-    with ThreadPoolExecutor() as executor:
-        future_to_site = {
-            executor.submit(worker, site): site for site in scraper_input.site_type
-        }
-
-        for future in as_completed(future_to_site):
-            site_value, scraped_data = future.result()
-            site_to_jobs_dict[site_value] = scraped_data
-
-    jobs_dfs: list[pd.DataFrame] = []
-
-    for site, job_response in site_to_jobs_dict.items():
-        for job in job_response.jobs:
-            job_data = job.dict()
-            job_url = job_data["job_url"]
-            job_data["site"] = site
-            job_data["company"] = job_data["company_name"]
-            job_data["job_type"] = (
-                ", ".join(job_type.value[0] for job_type in job_data["job_type"])
-                if job_data["job_type"]
-                else None
-            )
-            job_data["emails"] = (
-                ", ".join(job_data["emails"]) if job_data["emails"] else None
-            )
-            if job_data["location"]:
-                job_data["location"] = Location(
-                    **job_data["location"]
-                ).display_location()
-
-            # Handle compensation
-            compensation_obj = job_data.get("compensation")
-            if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
-                )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
-                job_data["currency"] = compensation_obj.get("currency", "USD")
-                job_data["salary_source"] = SalarySource.DIRECT_DATA.value
-                if enforce_annual_salary and (
-                    job_data["interval"]
-                    and job_data["interval"] != "yearly"
-                    and job_data["min_amount"]
-                    and job_data["max_amount"]
-                ):
-                    convert_to_annual(job_data)
-            else:
-                if country_enum == Country.USA:
-                    (
-                        job_data["interval"],
-                        job_data["min_amount"],
-                        job_data["max_amount"],
-                        job_data["currency"],
-                    ) = extract_salary(
-                        job_data["description"],
-                        enforce_annual_salary=enforce_annual_salary,
-                    )
-                    job_data["salary_source"] = SalarySource.DESCRIPTION.value
-
-            job_data["salary_source"] = (
-                job_data["salary_source"]
-                if "min_amount" in job_data and job_data["min_amount"]
-                else None
-            )
+    try:
+        with ThreadPoolExecutor() as pool:
+            future_to_site = {
+                pool.submit(wrap_context(worker), site): site
+                for site in scraper_input.site_type
+            }
 
-            #naukri-specific fields
-            job_data["skills"] = (
-                ", ".join(job_data["skills"]) if job_data["skills"] else None
-            )
-            job_data["experience_range"] = job_data.get("experience_range")
-            job_data["company_rating"] = job_data.get("company_rating")
-            job_data["company_reviews_count"] = job_data.get("company_reviews_count")
-            job_data["vacancy_count"] = job_data.get("vacancy_count")
-            job_data["work_from_home_type"] = job_data.get("work_from_home_type")
+            for future in as_completed(future_to_site):
+                site_value, scraped_data = future.result()
+                if spill_writer is not None:
+                    # jobs a scraper kept are spilled once it is done, then released
+                    spill_jobs(Site(site_value), scraped_data.jobs)
+                    continue
+                site_to_jobs_dict[site_value] = scraped_data
+                if index is not None:
+                    index.add_many(scraped_data.jobs)
+    except BaseException:
+        if spill_writer is not None:
+            spill_writer.abort()
+        raise
+
+    if spill_writer is not None:
+        spilled = spill_writer.close()
+        if store is not None and len(spilled):
+            job_store = _get_store(store)
+            for batch in spilled.iter_batches():
+                job_store.upsert(batch)
+        return spilled
+
+    site_jobs = [
+        (site, job)
+        for site, job_response in site_to_jobs_dict.items()
+        for job in job_response.jobs
+    ]
+    if dedupe and site_jobs:
+        from jobspy.dedupe import JobDeduplicator
+
+        # the same posting is often syndicated to several boards under different ids
+        keep = JobDeduplicator().keep_indices([job for _, job in site_jobs])
+        site_jobs = [site_jobs[i] for i in keep]
+
+    with span("to_rows", "convert", jobs=len(site_jobs)):
+        rows = [to_row(site, job) for site, job in site_jobs]
 
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
+    if as_records:
+        # same columns and order as the DataFrame, without importing pandas
+        records = [{column: row.get(column) for column in columns} for row in rows]
+        records.sort(key=lambda row: row["date_posted"] or date.min, reverse=True)
+        records.sort(key=lambda row: row["site"])
+        if store is not None and records:
+            _get_store(store).upsert(records)
+        return records
 
+    import pandas as pd
+
+    with span("dataframes", "convert", rows=len(rows)):
+        jobs_dfs = [pd.DataFrame([job_data]) for job_data in rows]
     if jobs_dfs:
         # Step 1: Filter out all-NA columns from each DataFrame before concatenation
         filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
@@ -206,21 +372,31 @@ def scrape_jobs(
         jobs_df = pd.concat(filtered_dfs, ignore_index=True)
 
         # Step 3: Ensure all desired columns are present, adding missing ones as empty
-        for column in desired_order:
+        for column in columns:
             if column not in jobs_df.columns:
                 jobs_df[column] = None  # Add missing columns as empty
 
         # Reorder the DataFrame according to the desired order
-        jobs_df = jobs_df[desired_order]
+        jobs_df = jobs_df[columns]
 
         # Step 4: Sort the DataFrame as required
-        return jobs_df.sort_values(
+        jobs_df = jobs_df.sort_values(
             by=["site", "date_posted"], ascending=[True, False]
         ).reset_index(drop=True)
+
+        if store is not None:
+            _get_store(store).upsert(jobs_df)
+        return jobs_df
     else:
         return pd.DataFrame()
 
 
+def _get_store(store: str | JobStore) -> JobStore:
+    from jobspy.store import JobStore, connect as connect_store
+
+    return store if isinstance(store, JobStore) else connect_store(store)
+
+
 # Add BDJobs to __all__
 __all__ = [
     "BDJobs",
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import random
-import time
+import logging
 
 from bs4 import BeautifulSoup
 
+from jobspy.bayt.util import parse_job_details
 from jobspy.model import (
     Scraper,
     ScraperInput,
@@ -13,16 +13,27 @@ from jobspy.model import (
     JobResponse,
     Location,
     Country,
+    DescriptionFormat,
+)
+from jobspy.trace import traced
+from jobspy.util import (
+    DetailFetcher,
+    create_logger,
+    create_session,
+    extract_emails_from_text,
+    get_enum_from_job_type,
+    markdown_converter,
+    plain_converter,
 )
-from jobspy.util import create_logger, create_session
 
 log = create_logger("Bayt")
 
 
 class BaytScraper(Scraper):
     base_url = "https://www.bayt.com"
-    delay = 2
-    band_delay = 3
+    requests_per_second = 0.5
+    burst = 3
+    detail_timeout = 20
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
@@ -31,6 +42,15 @@ class BaytScraper(Scraper):
         self.scraper_input = None
         self.session = None
         self.country = "worldwide"
+        # search and job pages share one limiter, replacing the fixed sleeps
+        # between search pages
+        self.details = DetailFetcher(
+            self,
+            parse_job_details,
+            rate=self.requests_per_second,
+            burst=self.burst,
+            timeout=self.detail_timeout,
+        )
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
@@ -49,20 +69,22 @@ class BaytScraper(Scraper):
             if not job_elements:
                 break
 
-            if job_elements:
+            # prettify serializes the whole subtree, so only pay for it when debugging
+            debug = log.isEnabledFor(logging.DEBUG)
+            if debug:
                 log.debug(
                     "First job element snippet:\n" + job_elements[0].prettify()[:500]
                 )
 
-            initial_count = len(job_list)
+            page_jobs: list[JobPost] = []
             for job in job_elements:
+                if len(job_list) + len(page_jobs) >= results_wanted:
+                    break
                 try:
                     job_post = self._extract_job_info(job)
                     if job_post:
-                        job_list.append(job_post)
-                        if len(job_list) >= results_wanted:
-                            break
-                    else:
+                        page_jobs.append(job_post)
+                    elif debug:
                         log.debug(
                             "Extraction returned None. Job snippet:\n"
                             + job.prettify()[:500]
@@ -71,23 +93,27 @@ class BaytScraper(Scraper):
                     log.error(f"Bayt: Error extracting job info: {str(e)}")
                     continue
 
-            if len(job_list) == initial_count:
+            if not page_jobs:
                 log.info(f"No new jobs found on page {page}. Ending pagination.")
                 break
 
+            if scraper_input.linkedin_fetch_description:
+                self._add_details(page_jobs)
+            job_list.extend(page_jobs)
             page += 1
-            time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
 
         job_list = job_list[: scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
 
+    @traced("page", "page")
     def _fetch_jobs(self, query: str, page: int) -> list | None:
         """
         Grabs the job results for the given query and page number.
         """
         try:
             url = f"{self.base_url}/en/international/jobs/{query}-jobs/?page={page}"
-            response = self.session.get(url)
+            self.details.limiter.acquire()
+            response = self.unpaced_session.get(url)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, "html.parser")
             job_listings = soup.find_all("li", attrs={"data-js-job": ""})
@@ -97,6 +123,28 @@ class BaytScraper(Scraper):
             log.error(f"Bayt: Error fetching jobs - {str(e)}")
             return None
 
+    def _add_details(self, job_posts: list[JobPost]):
+        """
+        Fills description, posting date and job type from the job pages, fetched
+        concurrently after every card of the page has been parsed
+        """
+        job_details = self.details.fetch_many([post.job_url for post in job_posts])
+        for job_post, details in zip(job_posts, job_details):
+            description = details.get("description")
+            if description:
+                if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+                    description = markdown_converter(description)
+                elif self.scraper_input.description_format == DescriptionFormat.PLAIN:
+                    description = plain_converter(description)
+                job_post.description = description
+                job_post.emails = extract_emails_from_text(description)
+            job_post.date_posted = details.get("date_posted") or job_post.date_posted
+            job_type = get_enum_from_job_type(
+                (details.get("employment_type") or "").lower().replace("_", "")
+            )
+            if job_type:
+                job_post.job_type = [job_type]
+
     def _extract_job_info(self, job: BeautifulSoup) -> JobPost | None:
         """
         Extracts the job information from a single job listing.
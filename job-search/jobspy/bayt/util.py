@@ -0,0 +1,56 @@
+import json
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+from requests import Response
+
+from jobspy.util import create_logger
+
+log = create_logger("Bayt")
+
+
+def find_job_posting(soup: BeautifulSoup) -> dict | None:
+    """
+    Finds the schema.org JobPosting that Bayt embeds in each job page as JSON-LD
+    :param soup: parsed job page
+    :return: the JobPosting object, or None if the page has none
+    """
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            data = json.loads(script.string or "")
+        except ValueError:
+            continue
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict) and item.get("@type") == "JobPosting":
+                return item
+    return None
+
+
+def parse_job_details(response: Response) -> dict:
+    """
+    Extracts the description, posting date and employment type of a job page
+    :param response: job page response
+    :return: dict with description (html), date_posted and employment_type
+    """
+    soup = BeautifulSoup(response.text, "html.parser")
+    posting = find_job_posting(soup)
+    if posting is None:
+        log.debug(f"No JobPosting found on {response.url}")
+        return {}
+
+    date_posted = None
+    if posting.get("datePosted"):
+        try:
+            date_posted = datetime.fromisoformat(posting["datePosted"][:10]).date()
+        except ValueError:
+            pass
+
+    employment_type = posting.get("employmentType")
+    if isinstance(employment_type, list):
+        employment_type = employment_type[0] if employment_type else None
+
+    return {
+        "description": posting.get("description"),
+        "date_posted": date_posted,
+        "employment_type": employment_type,
+    }
@@ -1,14 +1,13 @@
 # __init__.py
 from __future__ import annotations
 
-import random
-import time
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 from bs4.element import Tag
+from requests import Response
 
 from jobspy.exception import BDJobsException
 from jobspy.bdjobs.constant import headers, search_params
@@ -29,9 +28,11 @@ from jobspy.model import (
     DescriptionFormat,
 )
 from jobspy.util import (
+    DetailFetcher,
     extract_emails_from_text,
     create_session,
     create_logger,
+    get_enum_from_job_type,
     remove_attributes,
     markdown_converter,
 )
@@ -42,11 +43,15 @@ log = create_logger("BDJobs")
 class BDJobs(Scraper):
     base_url = "https://jobs.bdjobs.com"
     search_url = "https://jobs.bdjobs.com/jobsearch.asp"
-    delay = 2
-    band_delay = 3
+    requests_per_second = 1.0
+    burst = 4
+    detail_timeout = 20
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
     ):
         """
         Initializes BDJobsScraper with the BDJobs job search url
@@ -63,6 +68,15 @@ class BDJobs(Scraper):
         self.session.headers.update(headers)
         self.scraper_input = None
         self.country = "bangladesh"
+        # search pages and detail pages share one limiter, and parsed details
+        # stay cached for as long as the scraper is reused
+        self.details = DetailFetcher(
+            self,
+            self._get_job_details,
+            rate=self.requests_per_second,
+            burst=self.burst,
+            timeout=self.detail_timeout,
+        )
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
@@ -91,7 +105,8 @@ class BDJobs(Scraper):
                 if page > 1:
                     params["pg"] = page
 
-                response = self.session.get(
+                self.details.limiter.acquire()
+                response = self.unpaced_session.get(
                     self.search_url,
                     params=params,
                     timeout=getattr(scraper_input, "request_timeout", 60),
@@ -110,21 +125,22 @@ class BDJobs(Scraper):
 
                 log.info(f"Found {len(job_cards)} job cards on page {page}")
 
+                # parse every card first, then fetch the detail pages together
+                page_jobs: list[JobPost] = []
                 for job_card in job_cards:
+                    if len(job_list) + len(page_jobs) >= scraper_input.results_wanted:
+                        break
                     try:
                         job_post = self._process_job(job_card)
                         if job_post and job_post.id not in seen_ids:
                             seen_ids.add(job_post.id)
-                            job_list.append(job_post)
-
-                            if not continue_search():
-                                break
+                            page_jobs.append(job_post)
                     except Exception as e:
                         log.error(f"Error processing job card: {str(e)}")
 
+                self._add_details(page_jobs)
+                job_list.extend(page_jobs)
                 page += 1
-                # Add delay between requests
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
 
             except Exception as e:
                 log.error(f"Error during scraping: {str(e)}")
@@ -237,28 +253,36 @@ class BDJobs(Scraper):
                 is_remote=is_remote,
                 site=self.site,
             )
-
-            # Always fetch description for BDJobs
-            job_details = self._get_job_details(job_url)
-            job_post.description = job_details.get("description", "")
-            job_post.job_type = job_details.get("job_type", "")
-
             return job_post
         except Exception as e:
             log.error(f"Error in _process_job: {str(e)}")
             return None
 
-    def _get_job_details(self, job_url: str) -> Dict[str, Any]:
+    def _add_details(self, job_posts: list[JobPost]):
+        """
+        Fills description, job type and industry from the job pages, which BDJobs
+        always fetches since its search cards carry no description
+        :param job_posts: job posts parsed from one search page
         """
-        Gets detailed job information from the job page
-        :param job_url: Job page URL
+        job_details = self.details.fetch_many([post.job_url for post in job_posts])
+        for job_post, details in zip(job_posts, job_details):
+            job_post.description = details.get("description") or None
+            job_type_text = (details.get("job_type") or "").lower()
+            job_type = get_enum_from_job_type(
+                job_type_text.replace(" ", "").replace("-", "")
+            )
+            job_post.job_type = [job_type] if job_type else None
+            job_post.company_industry = details.get("company_industry")
+            if job_post.description:
+                job_post.emails = extract_emails_from_text(job_post.description)
+
+    def _get_job_details(self, response: Response) -> Dict[str, Any]:
+        """
+        Parses detailed job information from a job page
+        :param response: Job page response
         :return: Dictionary with job details
         """
         try:
-            response = self.session.get(job_url, timeout=60)
-            if response.status_code != 200:
-                return {}
-
             soup = BeautifulSoup(response.text, "html.parser")
 
             # Find job description - IMPROVED based on correct.py
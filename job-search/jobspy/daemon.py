@@ -0,0 +1,251 @@
+"""
+jobspy.daemon
+~~~~~~~~~~~~~~~~~~~
+
+Long-running scheduler for saved searches::
+
+    python -m jobspy.daemon searches.yaml
+
+Unlike cron scripts that start a fresh interpreter per run, the daemon imports
+everything once and keeps one scraper (and so one HTTP session) per site alive
+between runs, along with the location cache and the store connection. Every
+site gets its own worker thread that runs queued searches one at a time, at
+least ``site_spacing`` seconds apart, so sites are scraped in parallel while
+each one sees a steady trickle of requests. Results are upserted into the job
+store as each (search, site) pair finishes.
+
+Example config::
+
+    store: ~/.jobspy/jobs.db
+    site_spacing: 30
+    verbose: 2
+    searches:
+      - name: python-sf
+        every: 2h
+        site_name: [indeed, linkedin]
+        search_term: python developer
+        location: San Francisco, CA
+        results_wanted: 50
+      - name: data-remote
+        every: 30m
+        site_name: zip_recruiter
+        search_term: data engineer
+        is_remote: true
+
+Any other key of a search is passed to ``scrape_jobs`` as is.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import os
+import queue
+import re
+import signal
+import threading
+import time
+
+import yaml
+from pydantic import BaseModel
+
+from jobspy import scrape_jobs
+from jobspy.model import Scraper, Site
+from jobspy.store import DEFAULT_STORE_PATH, JobStore, connect as connect_store
+from jobspy.util import create_logger, map_str_to_site
+
+log = create_logger("Daemon")
+
+_INTERVAL_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*$")
+interval_units = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_interval(value: int | float | str) -> float:
+    """Parses an interval such as 90, "45s", "30m", "2h" or "1d" into seconds"""
+    if isinstance(value, (int, float)):
+        seconds = float(value)
+    else:
+        match = _INTERVAL_RE.match(str(value).lower())
+        if not match:
+            raise ValueError(f"Invalid interval: {value!r}")
+        seconds = float(match.group(1)) * interval_units[match.group(2)]
+    if seconds <= 0:
+        raise ValueError(f"Interval must be positive: {value!r}")
+    return seconds
+
+
+class SavedSearch(BaseModel):
+    name: str
+    every: float
+    sites: list[Site]
+    params: dict = {}
+
+    @classmethod
+    def from_config(cls, config: dict, defaults: dict) -> "SavedSearch":
+        config = dict(config)
+        name = config.pop("name")
+        every = parse_interval(config.pop("every", "1h"))
+        site_names = config.pop("site_name", None) or [site.value for site in Site]
+        if isinstance(site_names, str):
+            site_names = [site_names]
+        sites = [map_str_to_site(site) for site in site_names]
+        return cls(name=name, every=every, sites=sites, params={**defaults, **config})
+
+
+class SiteWorker(threading.Thread):
+    """Runs the searches queued for one site, serially and spaced apart"""
+
+    def __init__(self, site: Site, store: JobStore, spacing: float, stop: threading.Event):
+        super().__init__(name=f"jobspy-{site.value}", daemon=True)
+        self.site = site
+        self.store = store
+        self.spacing = spacing
+        self.stop = stop
+        self.tasks: queue.Queue[SavedSearch | None] = queue.Queue()
+        self.pending: set[str] = set()
+        self.pending_lock = threading.Lock()
+        self.scrapers: dict[Site, Scraper] = {}
+        self.last_finished = 0.0
+
+    def submit(self, search: SavedSearch) -> bool:
+        """Queues a search unless a previous run of it is still waiting or running"""
+        with self.pending_lock:
+            if search.name in self.pending:
+                return False
+            self.pending.add(search.name)
+        self.tasks.put(search)
+        return True
+
+    def run(self):
+        while not self.stop.is_set():
+            search = self.tasks.get()
+            if search is None:
+                break
+            wait = self.last_finished + self.spacing - time.monotonic()
+            if wait > 0 and self.stop.wait(wait):
+                break
+            try:
+                self.run_search(search)
+            finally:
+                self.last_finished = time.monotonic()
+                with self.pending_lock:
+                    self.pending.discard(search.name)
+
+    def run_search(self, search: SavedSearch):
+        started = time.monotonic()
+        try:
+            jobs = scrape_jobs(
+                site_name=self.site,
+                store=self.store,
+                scrapers=self.scrapers,
+                **search.params,
+            )
+        except Exception as e:
+            log.error(f"{search.name} on {self.site.value} failed: {e}")
+            # a broken session should not poison the next run
+            self.scrapers.pop(self.site, None)
+            return
+        log.info(
+            f"{search.name} on {self.site.value}: {len(jobs)} jobs "
+            f"in {time.monotonic() - started:.1f}s"
+        )
+
+
+class Daemon:
+    """
+    Schedules saved searches and dispatches them to per-site workers.
+    :param searches: saved searches to run
+    :param store: job store results are written to
+    :param site_spacing: minimum seconds between two searches on the same site
+    """
+
+    def __init__(
+        self,
+        searches: list[SavedSearch],
+        store: JobStore,
+        site_spacing: float = 30,
+    ):
+        self.searches = searches
+        self.store = store
+        self.stop = threading.Event()
+        self.workers = {
+            site: SiteWorker(site, store, site_spacing, self.stop)
+            for site in {site for search in searches for site in search.sites}
+        }
+
+    @classmethod
+    def from_config(cls, config: dict) -> "Daemon":
+        defaults = {"verbose": config.get("verbose", 2)}
+        searches = [
+            SavedSearch.from_config(search, defaults)
+            for search in config.get("searches") or []
+        ]
+        if not searches:
+            raise ValueError("No searches configured")
+        names = [search.name for search in searches]
+        if len(set(names)) != len(names):
+            raise ValueError("Search names must be unique")
+        store = connect_store(os.path.expanduser(config.get("store", DEFAULT_STORE_PATH)))
+        return cls(searches, store, parse_interval(config.get("site_spacing", 30)))
+
+    def dispatch(self, search: SavedSearch):
+        for site in search.sites:
+            if not self.workers[site].submit(search):
+                log.warning(f"{search.name} on {site.value} is still pending, skipping this run")
+
+    def run(self, once: bool = False):
+        """Runs until stopped, or until every search ran once if once is set"""
+        for worker in self.workers.values():
+            worker.start()
+        now = time.monotonic()
+        schedule = [(now, i) for i in range(len(self.searches))]
+        heapq.heapify(schedule)
+        log.info(f"scheduling {len(self.searches)} searches over {len(self.workers)} sites")
+
+        while schedule and not self.stop.is_set():
+            due, i = schedule[0]
+            if self.stop.wait(max(0.0, due - time.monotonic())):
+                break
+            heapq.heappop(schedule)
+            search = self.searches[i]
+            self.dispatch(search)
+            if not once:
+                # runs missed while the process was busy or suspended are not replayed
+                heapq.heappush(schedule, (max(due + search.every, time.monotonic()), i))
+        self.shutdown(wait=once)
+
+    def shutdown(self, wait: bool = False):
+        """Stops the workers; with wait, queued searches are finished first"""
+        for worker in self.workers.values():
+            worker.tasks.put(None)
+        if not wait:
+            self.stop.set()
+        for worker in self.workers.values():
+            worker.join()
+        self.stop.set()
+
+
+def load_config(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Run saved jobspy searches on a schedule")
+    parser.add_argument("config", help="YAML file with the saved searches")
+    parser.add_argument("--once", action="store_true", help="Run every search once and exit")
+    args = parser.parse_args(argv)
+
+    daemon = Daemon.from_config(load_config(args.config))
+
+    def handle_signal(signum, frame):
+        log.info("shutting down")
+        daemon.stop.set()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+    daemon.run(once=args.once)
+
+
+if __name__ == "__main__":
+    main()
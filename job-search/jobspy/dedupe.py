@@ -0,0 +1,187 @@
+"""
+jobspy.dedupe
+~~~~~~~~~~~~~~~~~~~
+
+Near-duplicate detection for postings syndicated across job boards.
+
+Each posting is reduced to word shingles over its normalized title, company,
+location and description, summarized with a MinHash signature, and bucketed
+with banded LSH so only postings sharing a band are ever compared. Clusters
+are resolved with union-find and the richest posting of each is kept.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+
+import numpy as np
+
+from jobspy.model import JobPost
+
+_MAX_HASH = np.uint32((1 << 32) - 1)
+_SHIFT = np.uint64(32)
+_SHINGLE_MULT = np.uint64(0x9E3779B97F4A7C15)
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# hash functions applied at a time; bounds the permuted temporaries to
+# _PERM_BLOCK * shingles * 8 bytes instead of num_perm * shingles * 8
+_PERM_BLOCK = 16
+
+
+def normalize_text(text: str | None) -> list[str]:
+    """Lowercases text and splits it into alphanumeric tokens"""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.lower())
+
+
+def job_shingles(job: JobPost, k: int = 3, max_tokens: int = 400) -> np.ndarray:
+    """
+    Hashes the k-word shingles of a posting's title, company, location and description.
+    Title/company/location are always shingled; the description is capped at max_tokens.
+    :return: sorted array of unique shingle hashes
+    """
+    location = job.location.display_location() if job.location else ""
+    header = normalize_text(f"{job.title} {job.company_name or ''} {location}")
+    body = normalize_text(job.description)[:max_tokens]
+    # str hashes are salted per process, which is fine as signatures are never persisted
+    tokens = np.fromiter(map(hash, header + body), dtype=np.int64).view(np.uint64)
+    k = max(min(k, len(tokens)), 1)
+    shingles = np.zeros(len(tokens) - k + 1, dtype=np.uint64)
+    for offset in range(k):
+        shingles = shingles * _SHINGLE_MULT + tokens[offset : len(tokens) - k + 1 + offset]
+    return np.unique(shingles)
+
+
+class JobDeduplicator:
+    """
+    Clusters near-duplicate job postings with MinHash + LSH.
+    :param threshold: estimated Jaccard similarity at which two postings are duplicates
+    :param num_perm: MinHash signature length
+    :param bands: LSH bands, num_perm must be divisible by it
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 3,
+        seed: int = 1,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        # multiply-shift hashing: ((a * x + b) mod 2**64) >> 32 with odd a
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+
+    def _permute(self, hashes: np.ndarray, perms: slice) -> np.ndarray:
+        """Applies the hash functions in perms to every shingle hash, (len(perms), len(hashes))"""
+        permuted = np.outer(self._a[perms], hashes)
+        permuted += self._b[perms, None]
+        permuted >>= _SHIFT
+        return permuted
+
+    def _perm_blocks(self) -> list[slice]:
+        return [
+            slice(start, min(start + _PERM_BLOCK, self.num_perm))
+            for start in range(0, self.num_perm, _PERM_BLOCK)
+        ]
+
+    def signature(self, shingles: np.ndarray) -> np.ndarray:
+        """Computes the MinHash signature of an array of shingle hashes"""
+        sig = np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+        if len(shingles):
+            for perms in self._perm_blocks():
+                sig[perms] = self._permute(shingles, perms).min(axis=1)
+        return sig
+
+    def signatures(self, jobs: list[JobPost], chunk_size: int = 512) -> np.ndarray:
+        """
+        Computes a (len(jobs), num_perm) signature matrix.
+        Shingles of chunk_size postings are permuted together and reduced per posting,
+        a block of hash functions at a time.
+        """
+        sigs = np.full((len(jobs), self.num_perm), _MAX_HASH, dtype=np.uint32)
+        for start in range(0, len(jobs), chunk_size):
+            shingle_sets = [
+                job_shingles(job, k=self.shingle_size)
+                for job in jobs[start : start + chunk_size]
+            ]
+            counts = np.array([len(s) for s in shingle_sets])
+            rows = np.flatnonzero(counts)
+            if not len(rows):
+                continue
+            hashes = np.concatenate(shingle_sets)
+            offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))[rows]
+            for perms in self._perm_blocks():
+                permuted = self._permute(hashes, perms)
+                sigs[start + rows, perms] = np.minimum.reduceat(permuted, offsets, axis=1).T
+        return sigs
+
+    def cluster(self, jobs: list[JobPost]) -> list[list[int]]:
+        """
+        Groups job indices into clusters of near-duplicates.
+        Each LSH bucket is verified against its first member only, so work stays linear
+        in the number of postings even when a bucket is large.
+        :return: list of clusters (lists of indices), singletons included
+        """
+        parent = list(range(len(jobs)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        sigs = self.signatures(jobs)
+        empty = (sigs == _MAX_HASH).all(axis=1)
+        for band in range(self.bands):
+            buckets: dict[bytes, int] = {}
+            band_sigs = sigs[:, band * self.rows : (band + 1) * self.rows]
+            for i in range(len(jobs)):
+                if empty[i]:
+                    continue
+                key = band_sigs[i].tobytes()
+                head = buckets.setdefault(key, i)
+                if head == i:
+                    continue
+                root_i, root_head = find(i), find(head)
+                if root_i == root_head:
+                    continue
+                similarity = float(np.mean(sigs[i] == sigs[head]))
+                if similarity >= self.threshold:
+                    parent[root_i] = root_head
+
+        clusters: dict[int, list[int]] = defaultdict(list)
+        for i in range(len(jobs)):
+            clusters[find(i)].append(i)
+        return list(clusters.values())
+
+    def keep_indices(self, jobs: list[JobPost]) -> list[int]:
+        """Returns the index of the richest posting in every cluster, in input order"""
+        keep = [max(cluster, key=lambda i: richness(jobs[i])) for cluster in self.cluster(jobs)]
+        return sorted(keep)
+
+    def deduplicate(self, jobs: list[JobPost]) -> list[JobPost]:
+        """Drops near-duplicate postings, keeping the richest record per cluster"""
+        return [jobs[i] for i in self.keep_indices(jobs)]
+
+
+def richness(job: JobPost) -> tuple[int, int]:
+    """Ranks a posting by how many fields are populated, then by description length"""
+    filled = sum(
+        1 for value in job.__dict__.values() if value not in (None, "", [], {})
+    )
+    return filled, len(job.description or "")
+
+
+def deduplicate_jobs(jobs: list[JobPost], threshold: float = 0.8) -> list[JobPost]:
+    """Convenience wrapper around JobDeduplicator.deduplicate"""
+    return JobDeduplicator(threshold=threshold).deduplicate(jobs)
@@ -0,0 +1,101 @@
+"""
+jobspy.descriptions
+~~~~~~~~~~~~~~~~~~~
+
+Content-addressed, compressed description bodies for the job store.
+
+Descriptions are most of a job archive, and many postings repeat them word for
+word (reposts, the same job on several boards) or share long boilerplate
+(company blurbs, EEO statements). Each body is stored once under the hash of
+its text and compressed with zstd. Once enough bodies exist, a zstd dictionary
+is trained on them. The dictionary holds the shared boilerplate, so each body
+only pays for the text that is its own.
+
+zstandard is optional: without it bodies are stored as plain UTF-8.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from jobspy.util import create_logger
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+log = create_logger("Descriptions")
+
+CODEC_PLAIN = "plain"
+CODEC_ZSTD = "zstd"
+
+
+def description_hash(text: str) -> str:
+    """Content address of a description"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class DescriptionCodec:
+    """
+    Compresses description bodies, optionally with trained zstd dictionaries.
+    :param level: zstd compression level
+    :param dictionary_size: bytes of a trained dictionary
+    """
+
+    def __init__(self, level: int = 9, dictionary_size: int = 64 * 1024):
+        self.level = level
+        self.dictionary_size = dictionary_size
+        self.dictionaries: dict[int, "zstandard.ZstdCompressionDict"] = {}
+        self.current: int | None = None
+        self._compressors: dict[int | None, "zstandard.ZstdCompressor"] = {}
+        self._decompressors: dict[int | None, "zstandard.ZstdDecompressor"] = {}
+        if zstandard is None:
+            log.warning("zstandard is not installed, descriptions are stored uncompressed")
+
+    @property
+    def available(self) -> bool:
+        return zstandard is not None
+
+    def add_dictionary(self, dict_id: int, data: bytes, current: bool = True):
+        self.dictionaries[dict_id] = zstandard.ZstdCompressionDict(data)
+        self._compressors.pop(dict_id, None)
+        self._decompressors.pop(dict_id, None)
+        if current:
+            self.current = dict_id
+
+    def train(self, samples: list[str]) -> bytes:
+        """Trains a dictionary on sample bodies, returning its raw bytes"""
+        trained = zstandard.train_dictionary(
+            self.dictionary_size, [sample.encode("utf-8") for sample in samples], level=self.level
+        )
+        return trained.as_bytes()
+
+    def _compressor(self, dict_id: int | None) -> "zstandard.ZstdCompressor":
+        if dict_id not in self._compressors:
+            dictionary = self.dictionaries.get(dict_id) if dict_id is not None else None
+            self._compressors[dict_id] = zstandard.ZstdCompressor(
+                level=self.level, dict_data=dictionary
+            )
+        return self._compressors[dict_id]
+
+    def _decompressor(self, dict_id: int | None) -> "zstandard.ZstdDecompressor":
+        if dict_id not in self._decompressors:
+            dictionary = self.dictionaries.get(dict_id) if dict_id is not None else None
+            self._decompressors[dict_id] = zstandard.ZstdDecompressor(dict_data=dictionary)
+        return self._decompressors[dict_id]
+
+    def compress(self, text: str) -> tuple[str, int | None, bytes]:
+        """
+        Encodes a body with the current dictionary
+        :return: codec, dictionary id (None without one) and the encoded bytes
+        """
+        raw = text.encode("utf-8")
+        if zstandard is None:
+            return CODEC_PLAIN, None, raw
+        return CODEC_ZSTD, self.current, self._compressor(self.current).compress(raw)
+
+    def decompress(self, codec: str, dict_id: int | None, body: bytes) -> str:
+        if codec == CODEC_PLAIN:
+            return bytes(body).decode("utf-8")
+        return self._decompressor(dict_id).decompress(body).decode("utf-8")
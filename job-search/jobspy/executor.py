@@ -0,0 +1,129 @@
+"""
+jobspy.executor
+~~~~~~~~~~~~~~~~~~~
+
+Process-wide bounded thread pool for scraper sub-tasks.
+
+Scrapers used to create a ThreadPoolExecutor on every result page (30 threads
+for Glassdoor, 20 for ZipRecruiter) inside scrape_jobs' own per-site pool, so
+one multi-site call could start and tear down 50+ threads per page. Sub-tasks
+such as job detail fetches now go through one shared pool with a fixed number
+of threads. Each site also has a concurrency quota that is taken when a task
+is submitted, so a busy site blocks its own scraper instead of filling the pool
+and starving the other sites.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from jobspy.trace import wrap_context
+
+
+class SharedExecutor:
+    """
+    A size-bounded thread pool with per-site concurrency quotas and queue metrics.
+    :param max_workers: threads shared by every site
+    :param site_limit: tasks a site may have queued or running at once
+    :param site_limits: per-site overrides of site_limit, keyed on Site.value
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 24,
+        site_limit: int = 8,
+        site_limits: dict[str, int] | None = None,
+    ):
+        self.max_workers = max_workers
+        self.site_limit = site_limit
+        self.site_limits = dict(site_limits or {})
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jobspy")
+        self.lock = threading.Lock()
+        self.quotas: dict[str, threading.BoundedSemaphore] = {}
+        self.queued: dict[str, int] = defaultdict(int)
+        self.running: dict[str, int] = defaultdict(int)
+        self.completed: dict[str, int] = defaultdict(int)
+        self.max_queued = 0
+
+    def _quota(self, site: str) -> threading.BoundedSemaphore:
+        with self.lock:
+            if site not in self.quotas:
+                limit = self.site_limits.get(site, self.site_limit)
+                self.quotas[site] = threading.BoundedSemaphore(limit)
+            return self.quotas[site]
+
+    def submit(self, site: str, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Schedules fn(*args, **kwargs) for a site, blocking while the site's quota is used up
+        """
+        quota = self._quota(site)
+        quota.acquire()
+        with self.lock:
+            self.queued[site] += 1
+            self.max_queued = max(self.max_queued, sum(self.queued.values()))
+
+        def run():
+            with self.lock:
+                self.queued[site] -= 1
+                self.running[site] += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self.lock:
+                    self.running[site] -= 1
+                    self.completed[site] += 1
+                quota.release()
+
+        try:
+            # the task keeps the submitter's context, and with it an active tracer
+            return self.pool.submit(wrap_context(run))
+        except Exception:
+            with self.lock:
+                self.queued[site] -= 1
+            quota.release()
+            raise
+
+    def stats(self) -> dict:
+        """Queue depth, running and completed task counts, overall and per site"""
+        with self.lock:
+            sites = set(self.queued) | set(self.running) | set(self.completed)
+            return {
+                "max_workers": self.max_workers,
+                "queued": sum(self.queued.values()),
+                "running": sum(self.running.values()),
+                "max_queued": self.max_queued,
+                "sites": {
+                    site: {
+                        "queued": self.queued[site],
+                        "running": self.running[site],
+                        "completed": self.completed[site],
+                    }
+                    for site in sorted(sites)
+                },
+            }
+
+    def shutdown(self, wait: bool = True):
+        self.pool.shutdown(wait=wait)
+
+
+_shared: SharedExecutor | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_executor() -> SharedExecutor:
+    """Returns the process-wide executor, creating it with default sizes on first use"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = SharedExecutor()
+        return _shared
+
+
+def set_shared_executor(executor: SharedExecutor):
+    """Replaces the process-wide executor, e.g. to change its sizes or quotas"""
+    global _shared
+    with _shared_lock:
+        _shared = executor
@@ -0,0 +1,182 @@
+"""
+jobspy.geo
+~~~~~~~~~~~~~~~~~~~
+
+Offline location normalization and radius search.
+
+Free-form location strings ("SF, CA", "Bengaluru, Karnataka, India", "Austin,
+TX (Hybrid)") are resolved against a small bundled gazetteer of countries,
+states/provinces and major cities into canonical places with a stable id and
+coordinates. Resolution is memoized, so the many postings sharing a location
+string cost one lookup.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Iterable, NamedTuple
+
+from jobspy.geo.constant import admins, cities, countries
+
+EARTH_RADIUS_MILES = 3958.8
+MILES_PER_DEGREE_LAT = 69.05
+geo_columns = ["place_id", "latitude", "longitude"]
+
+_NOISE_RE = re.compile(
+    r"\([^)]*\)|\b(?:remote|hybrid|on-?site|in-office|area|metropolitan|metro|greater)\b"
+)
+_SPACE_RE = re.compile(r"\s+")
+
+
+class Place(NamedTuple):
+    id: str
+    name: str
+    kind: str  # "city", "admin" or "country"
+    country: str
+    admin: str | None
+    lat: float
+    lon: float
+
+    @property
+    def display_name(self) -> str:
+        """Place name followed by its state/province and country names, e.g. Austin, Texas, United States"""
+        names = [self.name]
+        if self.kind == "city" and self.admin:
+            admin = places_by_id.get(f"{self.country}-{self.admin}")
+            if admin:
+                names.append(admin.name)
+        if self.kind != "country":
+            names.append(places_by_id[self.country].name)
+        return ", ".join(names)
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def _build_gazetteer():
+    country_names: dict[str, Place] = {}
+    admin_names: dict[str, list[Place]] = defaultdict(list)
+    city_names: dict[str, list[tuple[int, Place]]] = defaultdict(list)
+
+    for iso, name, lat, lon, aliases in countries:
+        place = Place(iso, name, "country", iso, None, lat, lon)
+        for alias in (name.lower(), iso, *aliases):
+            country_names.setdefault(alias, place)
+    for iso, code, name, lat, lon in admins:
+        place = Place(f"{iso}-{code}", name, "admin", iso, code, lat, lon)
+        for alias in (name.lower(), code):
+            admin_names[alias].append(place)
+    for iso, code, name, lat, lon, rank, aliases in cities:
+        prefix = f"{iso}-{code}" if code else iso
+        place = Place(f"{prefix}-{_slug(name)}", name, "city", iso, code or None, lat, lon)
+        for alias in {name.lower(), *aliases}:
+            city_names[alias].append((rank, place))
+    for candidates in city_names.values():
+        candidates.sort(key=lambda candidate: candidate[0])
+    return country_names, dict(admin_names), dict(city_names)
+
+
+_country_names, _admin_names, _city_names = _build_gazetteer()
+places_by_id: dict[str, Place] = {
+    place.id: place
+    for place in [
+        *_country_names.values(),
+        *(p for ps in _admin_names.values() for p in ps),
+        *(p for ps in _city_names.values() for _, p in ps),
+    ]
+}
+
+
+def _pick(candidates: Iterable[Place], country: Place | None, admin: Place | None):
+    for place in candidates:
+        if country and place.country != country.country:
+            continue
+        if admin and place.admin != admin.admin:
+            continue
+        return place
+    return None
+
+
+def _resolve(parts: list[str], country: Place | None) -> Place | None:
+    admin = None
+    if len(parts) > 1 or parts[0] not in _city_names:
+        admin = _pick(_admin_names.get(parts[-1], ()), country, None)
+        if admin:
+            parts = parts[:-1]
+            country = country or _country_names[admin.country]
+    if parts:
+        city = _pick((p for _, p in _city_names.get(parts[0], ())), country, admin)
+        if city:
+            return city
+        if not admin and not country:
+            return _country_names.get(parts[0])
+    return admin or country
+
+
+@lru_cache(maxsize=65536)
+def normalize_location(location: str | None) -> Place | None:
+    """
+    Resolves a free-form location string to the most specific gazetteer place.
+    Parts are read right to left: an optional country, then state/province, then city.
+    :return: Place, or None if nothing in the string is known
+    """
+    if not location:
+        return None
+    text = _SPACE_RE.sub(" ", _NOISE_RE.sub(" ", location.lower()))
+    parts = [part.strip(" .-/") for part in text.split(",")]
+    parts = [part for part in parts if part]
+    if not parts:
+        return None
+
+    # a trailing two-letter code can be a state or a country ("CA", "IN", "DE"),
+    # so both readings are tried and the one resolving to a city wins
+    readings = [(parts, None)]
+    country = _country_names.get(parts[-1]) if len(parts) > 1 else None
+    if country:
+        readings.insert(0, (parts[:-1], country))
+    fallback = None
+    for reading_parts, reading_country in readings:
+        place = _resolve(reading_parts, reading_country)
+        if place is not None and place.kind == "city":
+            return place
+        fallback = fallback or place
+    return fallback
+
+
+def place_id(location: str | None) -> str | None:
+    place = normalize_location(location)
+    return place.id if place else None
+
+
+def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in miles"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_MILES * math.asin(min(1.0, math.sqrt(a)))
+
+
+def location_matches(
+    job_location: str | None, preferred: str | None, radius_miles: float = 50
+) -> bool | None:
+    """
+    Whether a job location satisfies a preferred location: inside the preferred
+    country or state, or within radius_miles of the preferred city.
+    :return: None when either side cannot be resolved
+    """
+    job_place, wanted = normalize_location(job_location), normalize_location(preferred)
+    if job_place is None or wanted is None:
+        return None
+    if wanted.kind == "country":
+        return job_place.country == wanted.country
+    if wanted.kind == "admin":
+        return job_place.country == wanted.country and job_place.admin == wanted.admin
+    if job_place.kind != "city":
+        return False
+    return haversine_miles(job_place.lat, job_place.lon, wanted.lat, wanted.lon) <= radius_miles
@@ -0,0 +1,378 @@
+# Offline gazetteer used by jobspy.geo. Coordinates are approximate (city centre,
+# or centroid for states/countries); population ranks break ties between cities
+# that share a name, lower is larger.
+
+# (iso2, name, lat, lon, aliases)
+countries = [
+    ("ar", "Argentina", -34.60, -58.38, ()),
+    ("au", "Australia", -25.27, 133.78, ()),
+    ("at", "Austria", 47.52, 14.55, ()),
+    ("bh", "Bahrain", 26.07, 50.56, ()),
+    ("bd", "Bangladesh", 23.68, 90.36, ()),
+    ("be", "Belgium", 50.50, 4.47, ()),
+    ("bg", "Bulgaria", 42.73, 25.49, ()),
+    ("br", "Brazil", -14.24, -51.93, ("brasil",)),
+    ("ca", "Canada", 56.13, -106.35, ()),
+    ("cl", "Chile", -35.68, -71.54, ()),
+    ("cn", "China", 35.86, 104.20, ()),
+    ("co", "Colombia", 4.57, -74.30, ()),
+    ("cr", "Costa Rica", 9.75, -83.75, ()),
+    ("hr", "Croatia", 45.10, 15.20, ()),
+    ("cy", "Cyprus", 35.13, 33.43, ()),
+    ("cz", "Czech Republic", 49.82, 15.47, ("czechia",)),
+    ("dk", "Denmark", 56.26, 9.50, ()),
+    ("ec", "Ecuador", -1.83, -78.18, ()),
+    ("eg", "Egypt", 26.82, 30.80, ()),
+    ("ee", "Estonia", 58.60, 25.01, ()),
+    ("fi", "Finland", 61.92, 25.75, ()),
+    ("fr", "France", 46.23, 2.21, ()),
+    ("de", "Germany", 51.17, 10.45, ("deutschland",)),
+    ("gr", "Greece", 39.07, 21.82, ()),
+    ("hk", "Hong Kong", 22.32, 114.17, ()),
+    ("hu", "Hungary", 47.16, 19.50, ()),
+    ("in", "India", 20.59, 78.96, ()),
+    ("id", "Indonesia", -0.79, 113.92, ()),
+    ("ie", "Ireland", 53.41, -8.24, ()),
+    ("il", "Israel", 31.05, 34.85, ()),
+    ("it", "Italy", 41.87, 12.57, ("italia",)),
+    ("jp", "Japan", 36.20, 138.25, ()),
+    ("kw", "Kuwait", 29.31, 47.48, ()),
+    ("lv", "Latvia", 56.88, 24.60, ()),
+    ("lt", "Lithuania", 55.17, 23.88, ()),
+    ("lu", "Luxembourg", 49.82, 6.13, ()),
+    ("my", "Malaysia", 4.21, 101.98, ()),
+    ("mt", "Malta", 35.94, 14.38, ()),
+    ("mx", "Mexico", 23.63, -102.55, ("méxico",)),
+    ("ma", "Morocco", 31.79, -7.09, ()),
+    ("nl", "Netherlands", 52.13, 5.29, ("the netherlands", "holland")),
+    ("nz", "New Zealand", -40.90, 174.89, ()),
+    ("ng", "Nigeria", 9.08, 8.68, ()),
+    ("no", "Norway", 60.47, 8.47, ()),
+    ("om", "Oman", 21.51, 55.92, ()),
+    ("pk", "Pakistan", 30.38, 69.35, ()),
+    ("pa", "Panama", 8.54, -80.78, ()),
+    ("pe", "Peru", -9.19, -75.02, ()),
+    ("ph", "Philippines", 12.88, 121.77, ()),
+    ("pl", "Poland", 51.92, 19.15, ()),
+    ("pt", "Portugal", 39.40, -8.22, ()),
+    ("qa", "Qatar", 25.35, 51.18, ()),
+    ("ro", "Romania", 45.94, 24.97, ()),
+    ("sa", "Saudi Arabia", 23.89, 45.08, ("ksa",)),
+    ("sg", "Singapore", 1.35, 103.82, ()),
+    ("sk", "Slovakia", 48.67, 19.70, ()),
+    ("si", "Slovenia", 46.15, 14.99, ()),
+    ("za", "South Africa", -30.56, 22.94, ()),
+    ("kr", "South Korea", 35.91, 127.77, ("korea", "republic of korea")),
+    ("es", "Spain", 40.46, -3.75, ("españa",)),
+    ("se", "Sweden", 60.13, 18.64, ()),
+    ("ch", "Switzerland", 46.82, 8.23, ()),
+    ("tw", "Taiwan", 23.70, 120.96, ()),
+    ("th", "Thailand", 15.87, 100.99, ()),
+    ("tr", "Turkey", 38.96, 35.24, ("türkiye", "turkiye")),
+    ("ua", "Ukraine", 48.38, 31.17, ()),
+    ("ae", "United Arab Emirates", 23.42, 53.85, ("uae",)),
+    ("gb", "United Kingdom", 55.38, -3.44, ("uk", "great britain", "england", "scotland", "wales")),
+    ("us", "United States", 39.83, -98.58, ("usa", "us", "united states of america", "america")),
+    ("uy", "Uruguay", -32.52, -55.77, ()),
+    ("ve", "Venezuela", 6.42, -66.59, ()),
+    ("vn", "Vietnam", 14.06, 108.28, ("viet nam",)),
+]
+
+# (country iso2, code, name, lat, lon)
+admins = [
+    ("us", "al", "Alabama", 32.81, -86.79),
+    ("us", "ak", "Alaska", 61.37, -152.40),
+    ("us", "az", "Arizona", 33.73, -111.43),
+    ("us", "ar", "Arkansas", 34.97, -92.37),
+    ("us", "ca", "California", 36.12, -119.68),
+    ("us", "co", "Colorado", 39.06, -105.31),
+    ("us", "ct", "Connecticut", 41.60, -72.76),
+    ("us", "de", "Delaware", 39.32, -75.51),
+    ("us", "dc", "District of Columbia", 38.90, -77.03),
+    ("us", "fl", "Florida", 27.77, -81.69),
+    ("us", "ga", "Georgia", 33.04, -83.64),
+    ("us", "hi", "Hawaii", 21.09, -157.50),
+    ("us", "id", "Idaho", 44.24, -114.48),
+    ("us", "il", "Illinois", 40.35, -88.99),
+    ("us", "in", "Indiana", 39.85, -86.26),
+    ("us", "ia", "Iowa", 42.01, -93.21),
+    ("us", "ks", "Kansas", 38.53, -96.73),
+    ("us", "ky", "Kentucky", 37.67, -84.67),
+    ("us", "la", "Louisiana", 31.17, -91.87),
+    ("us", "me", "Maine", 44.69, -69.38),
+    ("us", "md", "Maryland", 39.06, -76.80),
+    ("us", "ma", "Massachusetts", 42.23, -71.53),
+    ("us", "mi", "Michigan", 43.33, -84.54),
+    ("us", "mn", "Minnesota", 45.69, -93.90),
+    ("us", "ms", "Mississippi", 32.74, -89.68),
+    ("us", "mo", "Missouri", 38.46, -92.29),
+    ("us", "mt", "Montana", 46.92, -110.45),
+    ("us", "ne", "Nebraska", 41.13, -98.27),
+    ("us", "nv", "Nevada", 38.31, -117.06),
+    ("us", "nh", "New Hampshire", 43.45, -71.56),
+    ("us", "nj", "New Jersey", 40.30, -74.52),
+    ("us", "nm", "New Mexico", 34.84, -106.25),
+    ("us", "ny", "New York", 42.17, -74.95),
+    ("us", "nc", "North Carolina", 35.63, -79.81),
+    ("us", "nd", "North Dakota", 47.53, -99.78),
+    ("us", "oh", "Ohio", 40.39, -82.76),
+    ("us", "ok", "Oklahoma", 35.57, -96.93),
+    ("us", "or", "Oregon", 44.57, -122.07),
+    ("us", "pa", "Pennsylvania", 40.59, -77.21),
+    ("us", "ri", "Rhode Island", 41.68, -71.51),
+    ("us", "sc", "South Carolina", 33.86, -80.95),
+    ("us", "sd", "South Dakota", 44.30, -99.44),
+    ("us", "tn", "Tennessee", 35.75, -86.69),
+    ("us", "tx", "Texas", 31.05, -97.56),
+    ("us", "ut", "Utah", 40.15, -111.86),
+    ("us", "vt", "Vermont", 44.05, -72.71),
+    ("us", "va", "Virginia", 37.77, -78.17),
+    ("us", "wa", "Washington", 47.40, -121.49),
+    ("us", "wv", "West Virginia", 38.49, -80.95),
+    ("us", "wi", "Wisconsin", 44.27, -89.62),
+    ("us", "wy", "Wyoming", 42.76, -107.30),
+    ("ca", "ab", "Alberta", 53.93, -116.58),
+    ("ca", "bc", "British Columbia", 53.73, -127.65),
+    ("ca", "mb", "Manitoba", 53.76, -98.81),
+    ("ca", "nb", "New Brunswick", 46.57, -66.46),
+    ("ca", "nl", "Newfoundland and Labrador", 53.14, -57.66),
+    ("ca", "ns", "Nova Scotia", 44.68, -63.74),
+    ("ca", "on", "Ontario", 51.25, -85.32),
+    ("ca", "pe", "Prince Edward Island", 46.51, -63.42),
+    ("ca", "qc", "Quebec", 52.94, -73.55),
+    ("ca", "sk", "Saskatchewan", 52.94, -106.45),
+    ("in", "ka", "Karnataka", 15.32, 75.71),
+    ("in", "mh", "Maharashtra", 19.75, 75.71),
+    ("in", "tn", "Tamil Nadu", 11.13, 78.66),
+    ("in", "tg", "Telangana", 18.11, 79.02),
+    ("in", "dl", "Delhi", 28.70, 77.10),
+    ("in", "hr", "Haryana", 29.06, 76.09),
+    ("in", "up", "Uttar Pradesh", 26.85, 80.95),
+    ("in", "wb", "West Bengal", 22.99, 87.86),
+    ("in", "gj", "Gujarat", 22.26, 71.19),
+    ("in", "kl", "Kerala", 10.85, 76.27),
+    ("in", "rj", "Rajasthan", 27.02, 74.22),
+    ("au", "nsw", "New South Wales", -31.25, 146.92),
+    ("au", "vic", "Victoria", -36.98, 143.39),
+    ("au", "qld", "Queensland", -20.92, 142.70),
+    ("au", "wa", "Western Australia", -27.67, 121.63),
+    ("au", "sa", "South Australia", -30.00, 136.21),
+    ("gb", "eng", "England", 52.36, -1.17),
+    ("gb", "sct", "Scotland", 56.49, -4.20),
+    ("gb", "wls", "Wales", 52.13, -3.78),
+    ("gb", "nir", "Northern Ireland", 54.79, -6.49),
+]
+
+# (country iso2, admin code or "", name, lat, lon, population rank, aliases)
+cities = [
+    ("us", "ny", "New York", 40.71, -74.01, 1, ("new york city", "nyc", "manhattan", "brooklyn")),
+    ("us", "ca", "Los Angeles", 34.05, -118.24, 2, ("la",)),
+    ("us", "il", "Chicago", 41.88, -87.63, 3, ()),
+    ("us", "tx", "Houston", 29.76, -95.37, 4, ()),
+    ("us", "az", "Phoenix", 33.45, -112.07, 5, ()),
+    ("us", "pa", "Philadelphia", 39.95, -75.17, 6, ()),
+    ("us", "tx", "San Antonio", 29.42, -98.49, 7, ()),
+    ("us", "ca", "San Diego", 32.72, -117.16, 8, ()),
+    ("us", "tx", "Dallas", 32.78, -96.80, 9, ()),
+    ("us", "ca", "San Jose", 37.34, -121.89, 10, ()),
+    ("us", "tx", "Austin", 30.27, -97.74, 11, ()),
+    ("us", "fl", "Jacksonville", 30.33, -81.66, 12, ()),
+    ("us", "tx", "Fort Worth", 32.76, -97.33, 13, ()),
+    ("us", "oh", "Columbus", 39.96, -83.00, 14, ()),
+    ("us", "nc", "Charlotte", 35.23, -80.84, 15, ()),
+    ("us", "ca", "San Francisco", 37.77, -122.42, 16, ("sf", "sf bay", "san francisco bay", "bay")),
+    ("us", "in", "Indianapolis", 39.77, -86.16, 17, ()),
+    ("us", "wa", "Seattle", 47.61, -122.33, 18, ()),
+    ("us", "co", "Denver", 39.74, -104.99, 19, ()),
+    ("us", "dc", "Washington", 38.91, -77.04, 20, ("washington dc", "washington d.c.", "dc")),
+    ("us", "ma", "Boston", 42.36, -71.06, 21, ()),
+    ("us", "tn", "Nashville", 36.16, -86.78, 22, ()),
+    ("us", "mi", "Detroit", 42.33, -83.05, 23, ()),
+    ("us", "or", "Portland", 45.52, -122.68, 24, ()),
+    ("us", "nv", "Las Vegas", 36.17, -115.14, 25, ()),
+    ("us", "md", "Baltimore", 39.29, -76.61, 26, ()),
+    ("us", "wi", "Milwaukee", 43.04, -87.91, 27, ()),
+    ("us", "nm", "Albuquerque", 35.08, -106.65, 28, ()),
+    ("us", "ca", "Sacramento", 38.58, -121.49, 29, ()),
+    ("us", "mo", "Kansas City", 39.10, -94.58, 30, ()),
+    ("us", "ga", "Atlanta", 33.75, -84.39, 31, ()),
+    ("us", "fl", "Miami", 25.76, -80.19, 32, ()),
+    ("us", "nc", "Raleigh", 35.78, -78.64, 33, ()),
+    ("us", "ne", "Omaha", 41.26, -95.93, 34, ()),
+    ("us", "mn", "Minneapolis", 44.98, -93.27, 35, ()),
+    ("us", "fl", "Tampa", 27.95, -82.46, 36, ()),
+    ("us", "fl", "Orlando", 28.54, -81.38, 37, ()),
+    ("us", "oh", "Cleveland", 41.50, -81.69, 38, ()),
+    ("us", "oh", "Cincinnati", 39.10, -84.51, 39, ()),
+    ("us", "pa", "Pittsburgh", 40.44, -80.00, 40, ()),
+    ("us", "mo", "St. Louis", 38.63, -90.20, 41, ("st louis", "saint louis")),
+    ("us", "ut", "Salt Lake City", 40.76, -111.89, 42, ()),
+    ("us", "ca", "Irvine", 33.68, -117.83, 43, ()),
+    ("us", "ca", "Oakland", 37.80, -122.27, 44, ()),
+    ("us", "ca", "Palo Alto", 37.44, -122.14, 45, ()),
+    ("us", "ca", "Mountain View", 37.39, -122.08, 46, ()),
+    ("us", "ca", "Sunnyvale", 37.37, -122.04, 47, ()),
+    ("us", "ca", "Santa Clara", 37.35, -121.96, 48, ()),
+    ("us", "ca", "Menlo Park", 37.45, -122.18, 49, ()),
+    ("us", "ca", "Cupertino", 37.32, -122.03, 50, ()),
+    ("us", "ca", "Santa Monica", 34.02, -118.49, 51, ()),
+    ("us", "wa", "Redmond", 47.67, -122.12, 52, ()),
+    ("us", "wa", "Bellevue", 47.61, -122.20, 53, ()),
+    ("us", "ma", "Cambridge", 42.37, -71.11, 54, ()),
+    ("us", "va", "Arlington", 38.88, -77.10, 55, ()),
+    ("us", "va", "Reston", 38.96, -77.36, 56, ()),
+    ("us", "va", "Richmond", 37.54, -77.44, 57, ()),
+    ("us", "nj", "Jersey City", 40.73, -74.08, 58, ()),
+    ("us", "nj", "Newark", 40.74, -74.17, 59, ()),
+    ("us", "ct", "Stamford", 41.05, -73.54, 60, ()),
+    ("us", "nc", "Durham", 35.99, -78.90, 61, ()),
+    ("us", "co", "Boulder", 40.01, -105.27, 62, ()),
+    ("us", "id", "Boise", 43.62, -116.20, 63, ()),
+    ("us", "hi", "Honolulu", 21.31, -157.86, 64, ()),
+    ("us", "ak", "Anchorage", 61.22, -149.90, 65, ()),
+    ("us", "la", "New Orleans", 29.95, -90.07, 66, ()),
+    ("us", "tn", "Memphis", 35.15, -90.05, 67, ()),
+    ("us", "ky", "Louisville", 38.25, -85.76, 68, ()),
+    ("us", "ok", "Oklahoma City", 35.47, -97.52, 69, ()),
+    ("us", "az", "Scottsdale", 33.49, -111.93, 70, ()),
+    ("us", "tx", "Plano", 33.02, -96.70, 71, ()),
+    ("us", "tx", "Irving", 32.81, -96.95, 72, ()),
+    ("ca", "on", "Toronto", 43.65, -79.38, 1, ()),
+    ("ca", "qc", "Montreal", 45.50, -73.57, 2, ("montréal",)),
+    ("ca", "bc", "Vancouver", 49.28, -123.12, 3, ()),
+    ("ca", "ab", "Calgary", 51.05, -114.07, 4, ()),
+    ("ca", "on", "Ottawa", 45.42, -75.70, 5, ()),
+    ("ca", "ab", "Edmonton", 53.55, -113.49, 6, ()),
+    ("ca", "on", "Waterloo", 43.46, -80.52, 7, ()),
+    ("ca", "mb", "Winnipeg", 49.90, -97.14, 8, ()),
+    ("in", "ka", "Bengaluru", 12.97, 77.59, 1, ("bangalore", "bangalore urban")),
+    ("in", "mh", "Mumbai", 19.08, 72.88, 2, ("bombay", "navi mumbai")),
+    ("in", "dl", "New Delhi", 28.61, 77.21, 3, ("delhi", "delhi ncr", "ncr")),
+    ("in", "tg", "Hyderabad", 17.39, 78.49, 4, ("secunderabad",)),
+    ("in", "tn", "Chennai", 13.08, 80.27, 5, ("madras",)),
+    ("in", "mh", "Pune", 18.52, 73.86, 6, ("poona",)),
+    ("in", "wb", "Kolkata", 22.57, 88.36, 7, ("calcutta",)),
+    ("in", "hr", "Gurugram", 28.46, 77.03, 8, ("gurgaon",)),
+    ("in", "up", "Noida", 28.54, 77.39, 9, ()),
+    ("in", "gj", "Ahmedabad", 23.02, 72.57, 10, ()),
+    ("in", "kl", "Kochi", 9.93, 76.27, 11, ("cochin",)),
+    ("in", "rj", "Jaipur", 26.91, 75.79, 12, ()),
+    ("in", "tn", "Coimbatore", 11.02, 76.96, 13, ()),
+    ("in", "kl", "Thiruvananthapuram", 8.52, 76.94, 14, ("trivandrum",)),
+    ("in", "mh", "Nagpur", 21.15, 79.09, 15, ()),
+    ("in", "up", "Lucknow", 26.85, 80.95, 16, ()),
+    ("in", "ka", "Mysuru", 12.30, 76.64, 17, ("mysore",)),
+    ("gb", "eng", "London", 51.51, -0.13, 1, ("city of london",)),
+    ("gb", "eng", "Manchester", 53.48, -2.24, 2, ()),
+    ("gb", "eng", "Birmingham", 52.49, -1.89, 3, ()),
+    ("gb", "sct", "Edinburgh", 55.95, -3.19, 4, ()),
+    ("gb", "sct", "Glasgow", 55.86, -4.25, 5, ()),
+    ("gb", "eng", "Leeds", 53.80, -1.55, 6, ()),
+    ("gb", "eng", "Bristol", 51.45, -2.59, 7, ()),
+    ("gb", "eng", "Cambridge", 52.21, 0.12, 8, ()),
+    ("gb", "eng", "Oxford", 51.75, -1.26, 9, ()),
+    ("gb", "nir", "Belfast", 54.60, -5.93, 10, ()),
+    ("gb", "wls", "Cardiff", 51.48, -3.18, 11, ()),
+    ("au", "nsw", "Sydney", -33.87, 151.21, 1, ()),
+    ("au", "vic", "Melbourne", -37.81, 144.96, 2, ()),
+    ("au", "qld", "Brisbane", -27.47, 153.03, 3, ()),
+    ("au", "wa", "Perth", -31.95, 115.86, 4, ()),
+    ("au", "sa", "Adelaide", -34.93, 138.60, 5, ()),
+    ("au", "", "Canberra", -35.28, 149.13, 6, ()),
+    ("de", "", "Berlin", 52.52, 13.40, 1, ()),
+    ("de", "", "Hamburg", 53.55, 9.99, 2, ()),
+    ("de", "", "Munich", 48.14, 11.58, 3, ("münchen", "muenchen")),
+    ("de", "", "Cologne", 50.94, 6.96, 4, ("köln", "koeln")),
+    ("de", "", "Frankfurt", 50.11, 8.68, 5, ("frankfurt am main",)),
+    ("de", "", "Stuttgart", 48.78, 9.18, 6, ()),
+    ("de", "", "Düsseldorf", 51.23, 6.77, 7, ("dusseldorf", "duesseldorf")),
+    ("fr", "", "Paris", 48.86, 2.35, 1, ()),
+    ("fr", "", "Lyon", 45.76, 4.84, 2, ()),
+    ("fr", "", "Toulouse", 43.60, 1.44, 3, ()),
+    ("nl", "", "Amsterdam", 52.37, 4.90, 1, ()),
+    ("nl", "", "Rotterdam", 51.92, 4.48, 2, ()),
+    ("nl", "", "Eindhoven", 51.44, 5.47, 3, ()),
+    ("ie", "", "Dublin", 53.35, -6.26, 1, ()),
+    ("ie", "", "Cork", 51.90, -8.47, 2, ()),
+    ("es", "", "Madrid", 40.42, -3.70, 1, ()),
+    ("es", "", "Barcelona", 41.39, 2.17, 2, ()),
+    ("pt", "", "Lisbon", 38.72, -9.14, 1, ("lisboa",)),
+    ("pt", "", "Porto", 41.16, -8.63, 2, ()),
+    ("it", "", "Milan", 45.46, 9.19, 1, ("milano",)),
+    ("it", "", "Rome", 41.90, 12.50, 2, ("roma",)),
+    ("ch", "", "Zurich", 47.38, 8.54, 1, ("zürich",)),
+    ("ch", "", "Geneva", 46.20, 6.14, 2, ("genève",)),
+    ("at", "", "Vienna", 48.21, 16.37, 1, ("wien",)),
+    ("be", "", "Brussels", 50.85, 4.35, 1, ("bruxelles",)),
+    ("dk", "", "Copenhagen", 55.68, 12.57, 1, ("københavn",)),
+    ("se", "", "Stockholm", 59.33, 18.07, 1, ()),
+    ("no", "", "Oslo", 59.91, 10.75, 1, ()),
+    ("fi", "", "Helsinki", 60.17, 24.94, 1, ()),
+    ("pl", "", "Warsaw", 52.23, 21.01, 1, ("warszawa",)),
+    ("pl", "", "Krakow", 50.06, 19.94, 2, ("kraków",)),
+    ("cz", "", "Prague", 50.08, 14.44, 1, ("praha",)),
+    ("hu", "", "Budapest", 47.50, 19.04, 1, ()),
+    ("ro", "", "Bucharest", 44.43, 26.10, 1, ("bucurești",)),
+    ("bg", "", "Sofia", 42.70, 23.32, 1, ()),
+    ("gr", "", "Athens", 37.98, 23.73, 1, ()),
+    ("ua", "", "Kyiv", 50.45, 30.52, 1, ("kiev",)),
+    ("ee", "", "Tallinn", 59.44, 24.75, 1, ()),
+    ("lt", "", "Vilnius", 54.69, 25.28, 1, ()),
+    ("lv", "", "Riga", 56.95, 24.11, 1, ()),
+    ("lu", "", "Luxembourg", 49.61, 6.13, 1, ()),
+    ("tr", "", "Istanbul", 41.01, 28.98, 1, ()),
+    ("il", "", "Tel Aviv", 32.09, 34.78, 1, ("tel aviv-yafo",)),
+    ("ae", "", "Dubai", 25.20, 55.27, 1, ()),
+    ("ae", "", "Abu Dhabi", 24.45, 54.38, 2, ()),
+    ("sa", "", "Riyadh", 24.71, 46.68, 1, ()),
+    ("sa", "", "Jeddah", 21.49, 39.19, 2, ()),
+    ("qa", "", "Doha", 25.29, 51.53, 1, ()),
+    ("kw", "", "Kuwait City", 29.38, 47.99, 1, ()),
+    ("bh", "", "Manama", 26.23, 50.59, 1, ()),
+    ("om", "", "Muscat", 23.59, 58.41, 1, ()),
+    ("eg", "", "Cairo", 30.04, 31.24, 1, ()),
+    ("ma", "", "Casablanca", 33.57, -7.59, 1, ()),
+    ("ng", "", "Lagos", 6.52, 3.38, 1, ()),
+    ("za", "", "Johannesburg", -26.20, 28.05, 1, ()),
+    ("za", "", "Cape Town", -33.92, 18.42, 2, ()),
+    ("pk", "", "Karachi", 24.86, 67.01, 1, ()),
+    ("pk", "", "Lahore", 31.55, 74.34, 2, ()),
+    ("pk", "", "Islamabad", 33.68, 73.05, 3, ()),
+    ("bd", "", "Dhaka", 23.81, 90.41, 1, ()),
+    ("bd", "", "Chattogram", 22.36, 91.78, 2, ("chittagong",)),
+    ("sg", "", "Singapore", 1.29, 103.85, 1, ()),
+    ("my", "", "Kuala Lumpur", 3.14, 101.69, 1, ()),
+    ("id", "", "Jakarta", -6.21, 106.85, 1, ()),
+    ("ph", "", "Manila", 14.60, 120.98, 1, ("metro manila",)),
+    ("th", "", "Bangkok", 13.76, 100.50, 1, ()),
+    ("vn", "", "Ho Chi Minh City", 10.82, 106.63, 1, ("saigon",)),
+    ("vn", "", "Hanoi", 21.03, 105.85, 2, ()),
+    ("hk", "", "Hong Kong", 22.32, 114.17, 1, ()),
+    ("tw", "", "Taipei", 25.03, 121.57, 1, ()),
+    ("cn", "", "Shanghai", 31.23, 121.47, 1, ()),
+    ("cn", "", "Beijing", 39.90, 116.41, 2, ()),
+    ("cn", "", "Shenzhen", 22.54, 114.06, 3, ()),
+    ("jp", "", "Tokyo", 35.68, 139.69, 1, ()),
+    ("jp", "", "Osaka", 34.69, 135.50, 2, ()),
+    ("kr", "", "Seoul", 37.57, 126.98, 1, ()),
+    ("nz", "", "Auckland", -36.85, 174.76, 1, ()),
+    ("nz", "", "Wellington", -41.29, 174.78, 2, ()),
+    ("br", "", "São Paulo", -23.55, -46.63, 1, ("sao paulo",)),
+    ("br", "", "Rio de Janeiro", -22.91, -43.17, 2, ()),
+    ("ar", "", "Buenos Aires", -34.60, -58.38, 1, ()),
+    ("cl", "", "Santiago", -33.45, -70.67, 1, ()),
+    ("co", "", "Bogotá", 4.71, -74.07, 1, ("bogota",)),
+    ("pe", "", "Lima", -12.05, -77.04, 1, ()),
+    ("mx", "", "Mexico City", 19.43, -99.13, 1, ("ciudad de méxico", "cdmx")),
+    ("mx", "", "Guadalajara", 20.66, -103.35, 2, ()),
+    ("cr", "", "San José", 9.93, -84.08, 1, ()),
+    ("pa", "", "Panama City", 8.98, -79.52, 1, ()),
+    ("uy", "", "Montevideo", -34.90, -56.16, 1, ()),
+    ("ec", "", "Quito", -0.18, -78.47, 1, ()),
+    ("ve", "", "Caracas", 10.48, -66.90, 1, ()),
+    ("hr", "", "Zagreb", 45.81, 15.98, 1, ()),
+    ("cy", "", "Nicosia", 35.19, 33.38, 1, ()),
+    ("mt", "", "Valletta", 35.90, 14.51, 1, ()),
+    ("sk", "", "Bratislava", 48.15, 17.11, 1, ()),
+    ("si", "", "Ljubljana", 46.06, 14.51, 1, ()),
+]
@@ -5,7 +5,7 @@ import json
 import requests
 from typing import Tuple
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 
 from jobspy.glassdoor.constant import fallback_token, query_template, headers
 from jobspy.glassdoor.util import (
@@ -13,6 +13,7 @@ from jobspy.glassdoor.util import (
     parse_compensation,
     parse_location,
 )
+from jobspy.trace import traced
 from jobspy.util import (
     extract_emails_from_text,
     create_logger,
@@ -76,6 +77,7 @@ class Glassdoor(Scraper):
             log.error("Glassdoor: location not parsed")
             return JobResponse(jobs=[])
         job_list: list[JobPost] = []
+        found = 0
         cursor = None
 
         range_start = 1 + (scraper_input.offset // self.jobs_per_page)
@@ -87,15 +89,18 @@ class Glassdoor(Scraper):
                 jobs, cursor = self._fetch_jobs_page(
                     scraper_input, location_id, location_type, page, cursor
                 )
-                job_list.extend(jobs)
-                if not jobs or len(job_list) >= scraper_input.results_wanted:
-                    job_list = job_list[: scraper_input.results_wanted]
+                jobs = jobs[: scraper_input.results_wanted - found]
+                found += len(jobs)
+                if not self.emit(jobs):
+                    job_list.extend(jobs)
+                if not jobs or found >= scraper_input.results_wanted:
                     break
             except Exception as e:
                 log.error(f"Glassdoor: {str(e)}")
                 break
         return JobResponse(jobs=job_list)
 
+    @traced("page", "page")
     def _fetch_jobs_page(
         self,
         scraper_input: ScraperInput,
@@ -133,22 +138,20 @@ class Glassdoor(Scraper):
 
         jobs_data = res_json["data"]["jobListings"]["jobListings"]
 
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            future_to_job_data = {
-                executor.submit(self._process_job, job): job for job in jobs_data
-            }
-            for future in as_completed(future_to_job_data):
-                try:
-                    job_post = future.result()
-                    if job_post:
-                        jobs.append(job_post)
-                except Exception as exc:
-                    raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
+        future_to_job_data = {self.submit(self._process_job, job): job for job in jobs_data}
+        for future in as_completed(future_to_job_data):
+            try:
+                job_post = future.result()
+                if job_post:
+                    jobs.append(job_post)
+            except Exception as exc:
+                raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
 
         return jobs, get_cursor_for_page(
             res_json["data"]["jobListings"]["paginationCursors"], page_num + 1
         )
 
+    @traced("csrf_token", "setup")
     def _get_csrf_token(self):
         """
         Fetches csrf token needed for API by visiting a generic page
@@ -217,6 +220,7 @@ class Glassdoor(Scraper):
             listing_type=listing_type,
         )
 
+    @traced("description", "detail")
     def _fetch_job_description(self, job_id):
         """
         Fetches the job description for a single job ID.
@@ -255,6 +259,7 @@ class Glassdoor(Scraper):
             desc = markdown_converter(desc)
         return desc
 
+    @traced("location", "setup")
     def _get_location(self, location: str, is_remote: bool) -> (int, str):
         if not location or is_remote:
             return "11047", "STATE"  # remote options
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import math
 import re
-import json
 from typing import Tuple
 from datetime import datetime, timedelta
 
@@ -16,8 +15,9 @@ from jobspy.model import (
     Location,
     JobType,
 )
+from jobspy.trace import traced
 from jobspy.util import extract_emails_from_text, extract_job_type, create_session
-from jobspy.google.util import log, find_job_info_initial_page, find_job_info
+from jobspy.google.util import log, iter_job_infos
 
 
 class Google(Scraper):
@@ -50,7 +50,9 @@ class Google(Scraper):
         self.session = create_session(
             proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
         )
-        forward_cursor, job_list = self._get_initial_cursor_and_jobs()
+        forward_cursor, jobs = self._get_initial_cursor_and_jobs()
+        job_list: list[JobPost] = []
+        position = self._collect(job_list, jobs, 0)
         if forward_cursor is None:
             log.warning(
                 "initial cursor not found, try changing your query or there was at most 10 results"
@@ -74,15 +76,24 @@ class Google(Scraper):
             if not jobs:
                 log.info(f"found no jobs on page: {page}")
                 break
-            job_list += jobs
+            position = self._collect(job_list, jobs, position)
             page += 1
-        return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
-            ]
-        )
+        return JobResponse(jobs=job_list)
 
+    def _collect(self, job_list: list[JobPost], jobs: list[JobPost], position: int) -> int:
+        """
+        Keeps (or emits) the part of a page that falls within offset and results_wanted
+        :param position: how many jobs came before this page
+        :return: position after this page
+        """
+        start = self.scraper_input.offset
+        stop = start + self.scraper_input.results_wanted
+        wanted = jobs[max(start - position, 0) : max(stop - position, 0)]
+        if not self.emit(wanted):
+            job_list += wanted
+        return position + len(jobs)
+
+    @traced("initial_page", "page")
     def _get_initial_cursor_and_jobs(self) -> Tuple[str, list[JobPost]]:
         """Gets initial cursor and jobs to paginate through job listings"""
         query = f"{self.scraper_input.search_term} jobs"
@@ -126,39 +137,29 @@ class Google(Scraper):
         pattern_fc = r'<div jsname="Yust4d"[^>]+data-async-fc="([^"]+)"'
         match_fc = re.search(pattern_fc, response.text)
         data_async_fc = match_fc.group(1) if match_fc else None
-        jobs_raw = find_job_info_initial_page(response.text)
         jobs = []
-        for job_raw in jobs_raw:
+        for job_raw in iter_job_infos(response.text):
             job_post = self._parse_job(job_raw)
             if job_post:
                 jobs.append(job_post)
         return data_async_fc, jobs
 
+    @traced("page", "page")
     def _get_jobs_next_page(self, forward_cursor: str) -> Tuple[list[JobPost], str]:
         params = {"fc": [forward_cursor], "fcv": ["3"], "async": [async_param]}
         response = self.session.get(self.jobs_url, headers=headers_jobs, params=params)
         return self._parse_jobs(response.text)
 
+    @traced("parse", "parse")
     def _parse_jobs(self, job_data: str) -> Tuple[list[JobPost], str]:
         """
         Parses jobs on a page with next page cursor
         """
-        start_idx = job_data.find("[[[")
-        end_idx = job_data.rindex("]]]") + 3
-        s = job_data[start_idx:end_idx]
-        parsed = json.loads(s)[0]
-
         pattern_fc = r'data-async-fc="([^"]+)"'
         match_fc = re.search(pattern_fc, job_data)
         data_async_fc = match_fc.group(1) if match_fc else None
         jobs_on_page = []
-        for array in parsed:
-            _, job_data = array
-            if not job_data.startswith("[[["):
-                continue
-            job_d = json.loads(job_data)
-
-            job_info = find_job_info(job_d)
+        for job_info in iter_job_infos(job_data):
             job_post = self._parse_job(job_info)
             if job_post:
                 jobs_on_page.append(job_post)
@@ -1,41 +1,49 @@
+import json
 import re
+from json.decoder import scanstring
+from typing import Iterator
 
 from jobspy.util import create_logger
 
 log = create_logger("Google")
 
-
-def find_job_info(jobs_data: list | dict) -> list | None:
-    """Iterates through the JSON data to find the job listings"""
-    if isinstance(jobs_data, dict):
-        for key, value in jobs_data.items():
-            if key == "520084652" and isinstance(value, list):
-                return value
-            else:
-                result = find_job_info(value)
-                if result:
-                    return result
-    elif isinstance(jobs_data, list):
-        for item in jobs_data:
-            result = find_job_info(item)
-            if result:
-                return result
-    return None
-
-
-def find_job_info_initial_page(html_text: str):
-    pattern = f'520084652":(' + r"\[.*?\]\s*])\s*}\s*]\s*]\s*]\s*]\s*]"
-    results = []
-    matches = re.finditer(pattern, html_text)
-
-    import json
-
-    for match in matches:
-        try:
-            parsed_data = json.loads(match.group(1))
-            results.append(parsed_data)
-
-        except json.JSONDecodeError as e:
-            log.error(f"Failed to parse match: {str(e)}")
-            results.append({"raw_match": match.group(0), "error": str(e)})
-    return results
+JOB_INFO_KEY = "520084652"
+# the key either plain, or escaped inside an encoded string, followed by an array
+_JOB_INFO_KEY_RE = re.compile(r'(\\?)"' + JOB_INFO_KEY + r'\1":\s*(?=\[)')
+_decoder = json.JSONDecoder()
+
+
+def _decode_array(text: str, start: int, escaped: bool) -> tuple[list | None, int]:
+    """
+    Decodes the array starting at text[start], returning it and where it ends.
+    An escaped array lives inside a JSON string (the async payload nests each job
+    as an encoded string), so only the rest of that string is unescaped first.
+    """
+    try:
+        if not escaped:
+            return _decoder.raw_decode(text, start)
+        rest, end = scanstring(text, start)
+        return _decoder.raw_decode(rest)[0], end
+    except (json.JSONDecodeError, ValueError) as e:
+        log.error(f"Failed to parse job info: {e}")
+        return None, start
+
+
+def iter_job_infos(text: str) -> Iterator[list]:
+    """
+    Yields every job info array of a search page or async payload, left to right
+    in a single pass. The job info key appears either plain (initial HTML) or
+    escaped inside an encoded string (async payload); in both cases only the
+    array itself is decoded, never the surrounding document.
+    """
+    pos = 0
+    while (pos := text.find(JOB_INFO_KEY, pos)) >= 0:
+        quote = pos - 2 if pos >= 2 and text[pos - 2] == "\\" else pos - 1
+        match = _JOB_INFO_KEY_RE.match(text, max(quote, 0))
+        if match is None:
+            pos += len(JOB_INFO_KEY)
+            continue
+        value, end = _decode_array(text, match.end(), escaped=bool(match.group(1)))
+        if isinstance(value, list):
+            yield value
+        pos = max(end, match.end())
@@ -16,6 +16,7 @@ from jobspy.model import (
     JobType,
     DescriptionFormat,
 )
+from jobspy.trace import traced
 from jobspy.util import (
     extract_emails_from_text,
     markdown_converter,
@@ -60,6 +61,7 @@ class Indeed(Scraper):
         self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
         job_list = []
         page = 1
+        position = 0  # jobs seen before the current page, to apply the offset
 
         cursor = None
 
@@ -71,15 +73,15 @@ class Indeed(Scraper):
             if not jobs:
                 log.info(f"found no jobs on page: {page}")
                 break
-            job_list += jobs
+            start = max(scraper_input.offset - position, 0)
+            end = max(scraper_input.offset + scraper_input.results_wanted - position, 0)
+            position += len(jobs)
+            if not self.emit(jobs[start:end]):
+                job_list += jobs[start:end]
             page += 1
-        return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
-            ]
-        )
+        return JobResponse(jobs=job_list)
 
+    @traced("page", "page")
     def _scrape_page(self, cursor: str | None) -> Tuple[list[JobPost], str | None]:
         """
         Scrapes a page of Indeed for jobs with scraper_input criteria
@@ -0,0 +1,240 @@
+"""
+jobspy.index
+~~~~~~~~~~~~~~~~~~~
+
+In-memory inverted index over job titles, skills and descriptions.
+
+Postings keep token positions so quoted phrases can be matched, and ranking
+uses BM25F: each occurrence counts towards a term's frequency with the weight
+of its field, so a title match outweighs the same word in the body. Jobs can be added one at a
+time while scraping; per-term NumPy arrays are rebuilt lazily on the next
+query that touches a changed term, so queries stay vectorized.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from functools import lru_cache
+from typing import Iterable
+
+import numpy as np
+
+from jobspy.model import JobPost
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+_PHRASE_RE = re.compile(r'"([^"]+)"')
+_FIELD_GAP = 16  # keeps phrases from matching across fields
+_POSITION_BITS = 24
+
+stop_words = frozenset(
+    "a an and are as at be by for from has have in is it of on or our the this to "
+    "we will with you your".split()
+)
+field_weights = {"title": 3.0, "skills": 2.0, "description": 1.0}
+_field_codes = {field: code for code, field in enumerate(field_weights)}
+_weights = np.array(list(field_weights.values()))
+
+
+@lru_cache(maxsize=65536)
+def stem(token: str) -> str:
+    """
+    Light suffix-stripping stemmer (plural, -ing, -ed, -ly, -ment, ...).
+    Tokens containing digits or symbols (c++, python3, node.js) are left untouched.
+    """
+    if len(token) <= 3 or not token.isalpha():
+        return token
+    for suffix, replacement in (
+        ("ational", "ate"),
+        ("ization", "ize"),
+        ("iveness", "ive"),
+        ("fulness", "ful"),
+        ("ements", ""),
+        ("ement", ""),
+        ("ments", ""),
+        ("ment", ""),
+        ("ities", ""),
+        ("ity", ""),
+        ("ings", ""),
+        ("ing", ""),
+        ("ies", "y"),
+        ("edly", ""),
+        ("ed", ""),
+        ("ly", ""),
+        ("es", ""),
+        ("s", ""),
+    ):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            if suffix == "s" and token.endswith(("ss", "us", "is")):
+                return token
+            return token[: len(token) - len(suffix)] + replacement
+    return token
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Lowercases, splits, drops stop words and stems text"""
+    if not text:
+        return []
+    return [stem(t) for t in _TOKEN_RE.findall(text.lower()) if t not in stop_words]
+
+
+def _job_fields(job: JobPost | dict) -> tuple[str | None, dict[str, str | None]]:
+    if isinstance(job, JobPost):
+        job = job.__dict__
+    skills = job.get("skills")
+    if isinstance(skills, (list, tuple)):
+        skills = " ".join(skills)
+    elif not isinstance(skills, str):
+        skills = None
+    description = job.get("description")
+    key = job.get("id") or job.get("job_url")
+    return key, {
+        "title": job.get("title") if isinstance(job.get("title"), str) else None,
+        "skills": skills,
+        "description": description if isinstance(description, str) else None,
+    }
+
+
+class _Postings:
+    """
+    Occurrences of one term, encoded as doc << _POSITION_BITS | position,
+    with the field of each occurrence as its code in field_weights
+    """
+
+    __slots__ = ("occurrences", "fields", "arrays")
+
+    def __init__(self):
+        self.occurrences: list[int] = []
+        self.fields = bytearray()
+        self.arrays: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+
+
+class JobIndex:
+    """
+    BM25 inverted index keyed on job id (or job_url when there is no id).
+    Adding a job whose key is already indexed is a no-op.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.keys: list[str] = []
+        self.key_to_doc: dict[str, int] = {}
+        self.doc_lengths: list[float] = []
+        self.postings: dict[str, _Postings] = {}
+        self._total_length = 0.0
+        self._norm: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.key_to_doc
+
+    def add(self, job: JobPost | dict) -> int | None:
+        """
+        Indexes a JobPost or a scrape_jobs row dict.
+        :return: internal doc number, or None if the job was already indexed
+        """
+        key, fields = _job_fields(job)
+        if key is None or key in self.key_to_doc:
+            return None
+        doc = len(self.keys)
+        self.keys.append(key)
+        self.key_to_doc[key] = doc
+
+        base = doc << _POSITION_BITS
+        offset, length = 0, 0.0
+        for field, text in fields.items():
+            tokens = tokenize(text)
+            code = _field_codes[field]
+            for position, token in enumerate(tokens, start=offset):
+                postings = self.postings.get(token)
+                if postings is None:
+                    postings = self.postings[token] = _Postings()
+                postings.occurrences.append(base | position)
+                postings.fields.append(code)
+                postings.arrays = None
+            offset += len(tokens) + _FIELD_GAP
+            length += field_weights[field] * len(tokens)
+        self.doc_lengths.append(length)
+        self._total_length += length
+        self._norm = None
+        return doc
+
+    def add_many(self, jobs: Iterable[JobPost | dict]) -> int:
+        """Indexes several jobs, returning how many were new"""
+        return sum(1 for job in jobs if self.add(job) is not None)
+
+    def _arrays(self, token: str) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """(occurrences, docs, field-weighted term frequencies) for a token, built on first use"""
+        postings = self.postings.get(token)
+        if postings is None:
+            return None
+        if postings.arrays is None:
+            occurrences = np.asarray(postings.occurrences, dtype=np.int64)
+            weights = _weights[np.frombuffer(postings.fields, dtype=np.uint8)]
+            docs, doc_index = np.unique(occurrences >> _POSITION_BITS, return_inverse=True)
+            tfs = np.bincount(doc_index.reshape(-1), weights=weights, minlength=len(docs))
+            postings.arrays = occurrences, docs, tfs
+        return postings.arrays
+
+    def _phrase_docs(self, tokens: list[str]) -> np.ndarray:
+        """Docs containing tokens at consecutive positions"""
+        arrays = [self._arrays(token) for token in tokens]
+        if not tokens or any(a is None for a in arrays):
+            return np.empty(0, dtype=np.int64)
+        starts = arrays[0][0]
+        for i, (occurrences, _, _) in enumerate(arrays[1:], start=1):
+            # occurrences are appended in (doc, position) order, so they are sorted
+            found = np.searchsorted(occurrences, starts + i)
+            found[found == len(occurrences)] = 0
+            starts = starts[occurrences[found] == starts + i]
+            if not len(starts):
+                break
+        return np.unique(starts >> _POSITION_BITS)
+
+    def phrase(self, text: str) -> list[str]:
+        """Returns the keys of jobs containing text as a phrase"""
+        return [self.keys[doc] for doc in self._phrase_docs(tokenize(text))]
+
+    def scores(self, query: str) -> np.ndarray:
+        """
+        BM25 scores of every indexed job for a query.
+        Quoted segments are required phrases; jobs missing one score 0.
+        """
+        n_docs = len(self.keys)
+        scores = np.zeros(n_docs)
+        tokens = tokenize(_PHRASE_RE.sub(r" \1 ", query))
+        if not n_docs or not tokens:
+            return scores
+        if self._norm is None:
+            avg_length = self._total_length / n_docs or 1.0
+            lengths = np.asarray(self.doc_lengths)
+            self._norm = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+        norm = self._norm
+        for token in set(tokens):
+            arrays = self._arrays(token)
+            if arrays is None:
+                continue
+            _, docs, tfs = arrays
+            idf = math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            scores[docs] += idf * tfs * (self.k1 + 1) / (tfs + norm[docs])
+
+        for phrase in _PHRASE_RE.findall(query):
+            mask = np.zeros(n_docs, dtype=bool)
+            mask[self._phrase_docs(tokenize(phrase))] = True
+            scores[~mask] = 0.0
+        return scores
+
+    def search(self, query: str, k: int | None = 10) -> list[tuple[str, float]]:
+        """
+        Ranks jobs against a keyword query.
+        :return: (key, score) pairs with a positive score, best first
+        """
+        scores = self.scores(query)
+        hits = np.flatnonzero(scores > 0)
+        if k is not None and len(hits) > k:
+            hits = hits[np.argpartition(scores[hits], -k)[-k:]]
+        hits = hits[np.argsort(-scores[hits], kind="stable")]
+        return [(self.keys[doc], float(scores[doc])) for doc in hits]
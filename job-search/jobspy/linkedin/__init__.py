@@ -18,7 +18,8 @@ from jobspy.linkedin.util import (
     job_type_code,
     parse_job_type,
     parse_job_level,
-    parse_company_industry
+    parse_company_industry,
+    parse_location,
 )
 from jobspy.model import (
     JobPost,
@@ -31,6 +32,7 @@ from jobspy.model import (
     ScraperInput,
     Site,
 )
+from jobspy.trace import span, traced
 from jobspy.util import (
     extract_emails_from_text,
     currency_parser,
@@ -81,11 +83,12 @@ class LinkedIn(Scraper):
         seen_ids = set()
         start = scraper_input.offset // 10 * 10 if scraper_input.offset else 0
         request_count = 0
+        found = 0
         seconds_old = (
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
         continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and start < 1000
+            lambda: found < scraper_input.results_wanted and start < 1000
         )
         while continue_search():
             request_count += 1
@@ -138,11 +141,13 @@ class LinkedIn(Scraper):
                     log.error(f"LinkedIn: {str(e)}")
                 return JobResponse(jobs=job_list)
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            job_cards = soup.find_all("div", class_="base-search-card")
+            with span("parse", "parse"):
+                soup = BeautifulSoup(response.text, "html.parser")
+                job_cards = soup.find_all("div", class_="base-search-card")
             if len(job_cards) == 0:
                 return JobResponse(jobs=job_list)
 
+            page_jobs = []
             for job_card in job_cards:
                 href_tag = job_card.find("a", class_="base-card__full-link")
                 if href_tag and "href" in href_tag.attrs:
@@ -157,14 +162,18 @@ class LinkedIn(Scraper):
                         fetch_desc = scraper_input.linkedin_fetch_description
                         job_post = self._process_job(job_card, job_id, fetch_desc)
                         if job_post:
-                            job_list.append(job_post)
+                            page_jobs.append(job_post)
+                            found += 1
                         if not continue_search():
                             break
                     except Exception as e:
                         raise LinkedInException(str(e))
+            if not self.emit(page_jobs):
+                job_list += page_jobs
 
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+                with span("sleep", "wait"):
+                    time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
                 start += len(job_cards)
 
         job_list = job_list[: scraper_input.results_wanted]
@@ -242,6 +251,7 @@ class LinkedIn(Scraper):
             job_function=job_details.get("job_function"),
         )
 
+    @traced("job_details", "detail")
     def _get_job_details(self, job_id: str) -> dict:
         """
         Retrieves job description and other job details by going to the job page url
@@ -303,25 +313,13 @@ class LinkedIn(Scraper):
         :param metadata_card
         :return: location
         """
-        location = Location(country=Country.from_string(self.country))
+        location_string = "N/A"
         if metadata_card is not None:
             location_tag = metadata_card.find(
                 "span", class_="job-search-card__location"
             )
             location_string = location_tag.text.strip() if location_tag else "N/A"
-            parts = location_string.split(", ")
-            if len(parts) == 2:
-                city, state = parts
-                location = Location(
-                    city=city,
-                    state=state,
-                    country=Country.from_string(self.country),
-                )
-            elif len(parts) == 3:
-                city, state, country = parts
-                country = Country.from_string(country)
-                location = Location(city=city, state=state, country=country)
-        return location
+        return parse_location(location_string, self.country)
 
     def _parse_job_url_direct(self, soup: BeautifulSoup) -> str | None:
         """
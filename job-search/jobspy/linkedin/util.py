@@ -1,6 +1,8 @@
+from functools import lru_cache
+
 from bs4 import BeautifulSoup
 
-from jobspy.model import JobType, Location
+from jobspy.model import JobType, Location, Country
 from jobspy.util import get_enum_from_job_type
 
 
@@ -94,3 +96,20 @@ def is_job_remote(title: dict, description: str, location: Location) -> bool:
     full_string = f'{title} {description} {location}'.lower()
     is_remote = any(keyword in full_string for keyword in remote_keywords)
     return is_remote
+
+
+@lru_cache(maxsize=4096)
+def parse_location(location_string: str, default_country: str) -> Location:
+    """
+    Parses a "City, State" or "City, State, Country" card location.
+    Cards repeat a handful of locations, so results are memoized; the returned
+    Location is shared and must not be mutated.
+    """
+    parts = location_string.split(", ")
+    if len(parts) == 2:
+        city, state = parts
+        return Location(city=city, state=state, country=Country.from_string(default_country))
+    if len(parts) == 3:
+        city, state, country = parts
+        return Location(city=city, state=state, country=Country.from_string(country))
+    return Location(country=Country.from_string(default_country))
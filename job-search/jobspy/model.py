@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import Future
+from typing import Callable, Optional
 from datetime import date
 from enum import Enum
 from pydantic import BaseModel
 
+from jobspy.executor import SharedExecutor, get_shared_executor
+
 class JobType(Enum):
     FULL_TIME = (
         "fulltime",
@@ -235,6 +238,15 @@ class DescriptionFormat(Enum):
     HTML = "html"
     PLAIN = "plain"
 
+
+class DetailPolicy(Enum):
+    """When a scraper fetches a job's detail page on top of its search result"""
+
+    NEVER = "never"
+    TRUNCATED = "truncated"  # only when the search result's description looks incomplete
+    ALWAYS = "always"
+
+
 class JobPost(BaseModel):
     id: str | None = None
     title: str
@@ -313,6 +325,8 @@ class ScraperInput(BaseModel):
     offset: int = 0
     linkedin_fetch_description: bool = False
     linkedin_company_ids: list[int] | None = None
+    naukri_fan_out: bool = False
+    ziprecruiter_detail_policy: DetailPolicy = DetailPolicy.TRUNCATED
     description_format: DescriptionFormat | None = DescriptionFormat.MARKDOWN
 
     request_timeout: int = 60
@@ -329,6 +343,49 @@ class Scraper(ABC):
         self.proxies = proxies
         self.ca_cert = ca_cert
         self.user_agent = user_agent
+        self.executor: SharedExecutor | None = None  # None uses the process-wide one
+        # set by scrape_jobs(spill=True) to take jobs off the scraper as they are parsed
+        self.job_sink: Callable[[list[JobPost]], None] | None = None
+        self._session = None
+
+    @property
+    def session(self):
+        return self._session
+
+    @session.setter
+    def session(self, session):
+        # jobspy.util imports this module, so it is imported on first use
+        from jobspy.util import paced_session
+
+        # with a limiter set for the site (jobspy.runner sets shared ones), every request is paced
+        self._session = paced_session(self.site.value, session)
+
+    @property
+    def unpaced_session(self):
+        """The session without per-request pacing, for requests whose rate limiter token is already taken"""
+        return getattr(self._session, "unpaced", self._session)
 
     @abstractmethod
     def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
+
+    def reset(self):
+        """Clears per-search state so the instance, and its session, can run another search"""
+        seen_urls = getattr(self, "seen_urls", None)
+        if seen_urls is not None:
+            seen_urls.clear()
+
+    def emit(self, jobs: list[JobPost]) -> bool:
+        """
+        Hands jobs to the job sink as soon as they are scraped, if one is set
+        :return: whether the sink took them, otherwise the caller keeps them for its JobResponse
+        """
+        if self.job_sink is None:
+            return False
+        if jobs:
+            self.job_sink(jobs)
+        return True
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """Runs a sub-task (e.g. a detail page fetch) on the shared executor under this site's quota"""
+        executor = self.executor or get_shared_executor()
+        return executor.submit(self.site.value, fn, *args, **kwargs)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import math
 import random
 import time
+from concurrent.futures import as_completed
 from datetime import datetime, date, timedelta
 from typing import Optional
 
@@ -27,12 +28,14 @@ from jobspy.model import (
     ScraperInput,
     Site,
 )
+from jobspy.trace import span, traced
 from jobspy.util import (
     extract_emails_from_text,
     currency_parser,
     markdown_converter,
     create_session,
     create_logger,
+    get_rate_limiter,
 )
 
 log = create_logger("Naukri")
@@ -41,7 +44,11 @@ class Naukri(Scraper):
     base_url = "https://www.naukri.com/jobapi/v3/search"
     delay = 3
     band_delay = 4
-    jobs_per_page = 20  
+    jobs_per_page = 20
+    bulk_jobs_per_page = 100
+    max_bulk_pages = 20
+    fan_out_burst = 4  # fan-out requests that may be sent back to back
+    fan_out_rate = 1.0  # requests per second across all fan-out requests
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
@@ -70,14 +77,13 @@ class Naukri(Scraper):
         :return: job_response
         """
         self.scraper_input = scraper_input
+        if scraper_input.naukri_fan_out:
+            return self._scrape_fan_out(scraper_input)
         job_list: list[JobPost] = []
         seen_ids = set()
         start = scraper_input.offset or 0
         page = (start // self.jobs_per_page) + 1
         request_count = 0
-        seconds_old = (
-            scraper_input.hours_old * 3600 if scraper_input.hours_old else None
-        )
         continue_search = (
             lambda: len(job_list) < scraper_input.results_wanted and page <= 50  # Arbitrary limit
         )
@@ -88,32 +94,8 @@ class Naukri(Scraper):
                 f"Scraping page {request_count} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)} "
                 f"for search term: {scraper_input.search_term}"
             )
-            params = {
-                "noOfResults": self.jobs_per_page,
-                "urlType": "search_by_keyword",
-                "searchType": "adv",
-                "keyword": scraper_input.search_term,
-                "pageNo": page,
-                "k": scraper_input.search_term,
-                "seoKey": f"{scraper_input.search_term.lower().replace(' ', '-')}-jobs",
-                "src": "jobsearchDesk",
-                "latLong": "",
-                "location": scraper_input.location,
-                "remote": "true" if scraper_input.is_remote else None,
-            }
-            if seconds_old:
-                params["days"] = seconds_old // 86400  # Convert to days
-
-            params = {k: v for k, v in params.items() if v is not None}
             try:
-                log.debug(f"Sending request to {self.base_url} with params: {params}")
-                response = self.session.get(self.base_url, params=params, timeout=10)
-                if response.status_code not in range(200, 400):
-                    err = f"Naukri API response status code {response.status_code} - {response.text}"
-                    log.error(err)
-                    return JobResponse(jobs=job_list)
-                data = response.json()
-                job_details = data.get("jobDetails", [])
+                job_details, _ = self._fetch_page(page, self.jobs_per_page)
                 log.info(f"Received {len(job_details)} job entries from API")
                 if not job_details:
                     log.warning("No job details found in API response")
@@ -122,33 +104,131 @@ class Naukri(Scraper):
                 log.error(f"Naukri API request failed: {str(e)}")
                 return JobResponse(jobs=job_list)
 
-            for job in job_details:
-                job_id = job.get("jobId")
-                if not job_id or job_id in seen_ids:
-                    continue
-                seen_ids.add(job_id)
-                log.debug(f"Processing job ID: {job_id}")
-
-                try:
-                    fetch_desc = scraper_input.linkedin_fetch_description
-                    job_post = self._process_job(job, job_id, fetch_desc)
-                    if job_post:
-                        job_list.append(job_post)
-                        log.info(f"Added job: {job_post.title} (ID: {job_id})")
-                    if not continue_search():
-                        break
-                except Exception as e:
-                    log.error(f"Error processing job ID {job_id}: {str(e)}")
-                    raise NaukriException(str(e))
+            self._add_jobs(job_details, job_list, seen_ids, continue_search)
 
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+                with span("sleep", "wait"):
+                    time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
                 page += 1
 
         job_list = job_list[:scraper_input.results_wanted]
         log.info(f"Scraping completed. Total jobs collected: {len(job_list)}")
         return JobResponse(jobs=job_list)
 
+    def _scrape_fan_out(self, scraper_input: ScraperInput) -> JobResponse:
+        """
+        Requests larger pages and fetches the page range concurrently. pageNo needs
+        no cursor, so once the first page reports the total number of jobs every
+        remaining page is independent; requests go through the process-wide Naukri
+        rate limit and pages are merged back in page order.
+        """
+        offset = scraper_input.offset or 0
+        page_size = self.bulk_jobs_per_page
+        first_page = offset // page_size + 1
+        try:
+            job_details, total = self._fetch_page(first_page, page_size)
+        except Exception as e:
+            log.error(f"Naukri API request failed: {str(e)}")
+            return JobResponse(jobs=[])
+        pages = {first_page: job_details}
+        if 0 < len(job_details) < page_size and total > len(job_details):
+            # the API capped the page size, pages are numbered in that size, so the
+            # page holding the offset is recomputed and only kept if it is the one fetched
+            log.info(f"Naukri returned {len(job_details)} jobs per page instead of {page_size}")
+            page_size = len(job_details)
+            capped_first_page = offset // page_size + 1
+            if capped_first_page != first_page:
+                first_page, pages = capped_first_page, {}
+
+        fetched = sum(len(details) for details in pages.values())
+        next_page = first_page + len(pages)
+        remaining = scraper_input.results_wanted - fetched
+        available = total - (next_page - 1) * page_size if total else remaining
+        last_page = min(
+            next_page - 1 + math.ceil(max(0, min(remaining, available)) / page_size),
+            first_page + self.max_bulk_pages - 1,
+        )
+        if last_page >= next_page:
+            log.info(f"Fetching pages {next_page}-{last_page} concurrently")
+            # pages run on the shared executor, within Naukri's quota of it
+            futures = {
+                self.submit(self._fetch_page, page, page_size): page
+                for page in range(next_page, last_page + 1)
+            }
+            for future in as_completed(futures):
+                try:
+                    pages[futures[future]] = future.result()[0]
+                except Exception as e:
+                    log.error(f"Naukri API request for page {futures[future]} failed: {str(e)}")
+
+        job_list: list[JobPost] = []
+        seen_ids = set()
+        continue_search = lambda: len(job_list) < scraper_input.results_wanted
+        for page in sorted(pages):
+            if not continue_search():
+                break
+            self._add_jobs(pages[page], job_list, seen_ids, continue_search)
+        log.info(f"Scraping completed. Total jobs collected: {len(job_list)}")
+        return JobResponse(jobs=job_list[: scraper_input.results_wanted])
+
+    @traced("page", "page")
+    def _fetch_page(self, page: int, page_size: int) -> tuple[list[dict], int]:
+        """
+        Requests one page of search results
+        :return: the page's job details and the total number of matching jobs
+        """
+        scraper_input = self.scraper_input
+        params = {
+            "noOfResults": page_size,
+            "urlType": "search_by_keyword",
+            "searchType": "adv",
+            "keyword": scraper_input.search_term,
+            "pageNo": page,
+            "k": scraper_input.search_term,
+            "seoKey": f"{scraper_input.search_term.lower().replace(' ', '-')}-jobs",
+            "src": "jobsearchDesk",
+            "latLong": "",
+            "location": scraper_input.location,
+            "remote": "true" if scraper_input.is_remote else None,
+        }
+        if scraper_input.hours_old:
+            params["days"] = scraper_input.hours_old * 3600 // 86400  # Convert to days
+
+        params = {k: v for k, v in params.items() if v is not None}
+        log.debug(f"Sending request to {self.base_url} with params: {params}")
+        session = self.session
+        if scraper_input.naukri_fan_out:
+            get_rate_limiter("naukri", self.fan_out_rate, self.fan_out_burst).acquire()
+            session = self.unpaced_session  # the token is taken, don't take a second one
+        response = session.get(self.base_url, params=params, timeout=10)
+        if response.status_code not in range(200, 400):
+            raise NaukriException(
+                f"Naukri API response status code {response.status_code} - {response.text}"
+            )
+        data = response.json()
+        return data.get("jobDetails", []), data.get("noOfJobs") or 0
+
+    def _add_jobs(self, job_details: list[dict], job_list: list[JobPost], seen_ids: set, continue_search):
+        """Processes a page of job details into job_list, skipping ids already seen"""
+        for job in job_details:
+            job_id = job.get("jobId")
+            if not job_id or job_id in seen_ids:
+                continue
+            seen_ids.add(job_id)
+            log.debug(f"Processing job ID: {job_id}")
+
+            try:
+                fetch_desc = self.scraper_input.linkedin_fetch_description
+                job_post = self._process_job(job, job_id, fetch_desc)
+                if job_post:
+                    job_list.append(job_post)
+                    log.info(f"Added job: {job_post.title} (ID: {job_id})")
+                if not continue_search():
+                    break
+            except Exception as e:
+                log.error(f"Error processing job ID {job_id}: {str(e)}")
+                raise NaukriException(str(e))
+
     def _process_job(
         self, job: dict, job_id: str, full_descr: bool
     ) -> Optional[JobPost]:
@@ -0,0 +1,245 @@
+"""
+jobspy.runner
+~~~~~~~~~~~~~~~~~~~
+
+Multi-process runner for large search matrices::
+
+    python -m jobspy.runner sweep.yaml --out jobs.jsonl
+
+A single process tops out on GIL-bound parsing (BeautifulSoup, markdownify)
+long before the network does. The runner expands the matrix into one task per
+(search, site) pair and spreads the tasks over worker processes. Each worker
+keeps its scrapers, and so its HTTP sessions, warm across the tasks it runs.
+Every site has one token bucket in shared memory that all workers take a token
+from for each HTTP request their scrapers send (search pages and detail pages
+alike), so adding processes adds parsing throughput without multiplying the
+request rate a site sees. Rows stream back to the parent as tasks finish and are
+written to a single sink (a JSONL file or the job store).
+
+Example config::
+
+    processes: 8
+    store: ~/.jobspy/jobs.db
+    verbose: 1
+    site_rates:          # requests per second per site, across all workers
+      indeed: 2
+      linkedin: 0.5
+    defaults:
+      results_wanted: 50
+      hours_old: 24
+    matrix:
+      site_name: [indeed, linkedin]
+      search_term: [python developer, data engineer]
+      location: ["San Francisco, CA", "Austin, TX"]
+
+Every list in ``matrix`` is crossed with the others. ``defaults`` and any
+scalar in ``matrix`` are passed to ``scrape_jobs`` as is.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import time
+from typing import Callable, Iterable, Iterator
+
+import yaml
+
+from jobspy.model import Scraper, Site
+from jobspy.store import DEFAULT_STORE_PATH, connect as connect_store
+from jobspy.util import RateLimiter, create_logger, map_str_to_site, set_rate_limiter
+
+log = create_logger("Runner")
+
+DEFAULT_SITE_RATE = 1.0
+DEFAULT_SITE_BURST = 4
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    Token bucket kept in shared memory, so every worker process draws from the
+    same budget. It must reach the workers when they are started (as a Process or
+    Pool initializer argument), like any other multiprocessing synchronized value.
+    :param rate: requests per second
+    :param burst: requests that may be sent back to back after an idle period
+    """
+
+    def __init__(self, rate: float, burst: int = 1, context=multiprocessing):
+        self.rate = rate
+        self.burst = burst
+        self.state = context.Array("d", [float(burst), time.monotonic()])
+
+    def acquire(self):
+        """Blocks until a request may be sent"""
+        with self.state.get_lock():
+            tokens, updated = self.state[0], self.state[1]
+            now = time.monotonic()
+            tokens = min(self.burst, tokens + (now - updated) * self.rate) - 1
+            self.state[0], self.state[1] = tokens, now
+            wait = -tokens / self.rate if tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+def expand_matrix(matrix: dict, defaults: dict | None = None) -> list[dict]:
+    """
+    Crosses every list-valued key of a matrix with the others.
+    :return: one scrape_jobs parameter dict per combination
+    """
+    keys = [key for key, value in matrix.items() if isinstance(value, list)]
+    fixed = {key: value for key, value in matrix.items() if key not in keys}
+    return [
+        {**(defaults or {}), **fixed, **dict(zip(keys, values))}
+        for values in itertools.product(*(matrix[key] for key in keys))
+    ]
+
+
+def split_by_site(searches: Iterable[dict]) -> list[tuple[Site, dict]]:
+    """Turns searches into (site, params) tasks, one per site of each search"""
+    tasks = []
+    for params in searches:
+        params = dict(params)
+        site_names = params.pop("site_name", None) or [site.value for site in Site]
+        if isinstance(site_names, (str, Site)):
+            site_names = [site_names]
+        for site in site_names:
+            tasks.append((map_str_to_site(site) if isinstance(site, str) else site, params))
+    return tasks
+
+
+def task_name(site: Site, params: dict) -> str:
+    parts = [params.get("search_term"), params.get("location"), params.get("country_indeed")]
+    return f"{site.value}: " + " / ".join(str(part) for part in parts if part)
+
+
+# per worker process state, set up by _init_worker
+_scrapers: dict[Site, Scraper] = {}
+
+
+def _init_worker(limiters: dict[Site, SharedRateLimiter]):
+    for site, limiter in limiters.items():
+        # scrapers pace every request of their session with the limiter of their site
+        set_rate_limiter(site.value, limiter)
+
+
+def _run_task(task: tuple[int, Site, dict]) -> tuple[int, list[dict], str | None, float]:
+    from jobspy import scrape_jobs
+
+    i, site, params = task
+    started = time.monotonic()
+    try:
+        rows = scrape_jobs(site_name=site, scrapers=_scrapers, as_records=True, **params)
+    except Exception as e:
+        # a broken session should not poison the next task of this worker
+        _scrapers.pop(site, None)
+        return i, [], f"{type(e).__name__}: {e}", time.monotonic() - started
+    return i, rows, None, time.monotonic() - started
+
+
+class JsonlSink:
+    """Appends rows to a JSON lines file"""
+
+    def __init__(self, path: str):
+        self.file = open(path, "a", encoding="utf-8")
+
+    def __call__(self, rows: list[dict]):
+        for row in rows:
+            self.file.write(json.dumps(row, default=str, ensure_ascii=False) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class ShardedRunner:
+    """
+    Runs (site, params) tasks on a pool of worker processes.
+    :param processes: worker processes
+    :param site_rates: requests per second per site, shared by all workers
+    :param site_burst: requests a site may receive back to back after an idle period
+    """
+
+    def __init__(
+        self,
+        processes: int | None = None,
+        site_rates: dict[str, float] | None = None,
+        site_burst: int = DEFAULT_SITE_BURST,
+    ):
+        self.processes = processes or os.cpu_count() or 1
+        # spawned workers start clean instead of inheriting the parent's threads and sessions
+        self.context = multiprocessing.get_context("spawn")
+        rates = {map_str_to_site(name): rate for name, rate in (site_rates or {}).items()}
+        self.limiters = {
+            site: SharedRateLimiter(rates.get(site, DEFAULT_SITE_RATE), site_burst, self.context)
+            for site in Site
+        }
+
+    def run(self, tasks: list[tuple[Site, dict]]) -> Iterator[tuple[Site, dict, list[dict], str | None]]:
+        """
+        Runs every task, yielding (site, params, rows, error) as each one finishes
+        """
+        with self.context.Pool(
+            self.processes, initializer=_init_worker, initargs=(self.limiters,)
+        ) as pool:
+            indexed = [(i, site, params) for i, (site, params) in enumerate(tasks)]
+            for i, rows, error, elapsed in pool.imap_unordered(_run_task, indexed):
+                site, params = tasks[i]
+                if error:
+                    log.error(f"{task_name(site, params)} failed: {error}")
+                else:
+                    log.info(f"{task_name(site, params)}: {len(rows)} jobs in {elapsed:.1f}s")
+                yield site, params, rows, error
+
+    def run_into(self, tasks: list[tuple[Site, dict]], sink: Callable[[list[dict]], object]) -> int:
+        """Runs every task, writing rows to sink as they arrive, and returns the row count"""
+        total = 0
+        for _, _, rows, _ in self.run(tasks):
+            if rows:
+                sink(rows)
+                total += len(rows)
+        return total
+
+
+def load_config(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Scrape a search matrix on several processes")
+    parser.add_argument("config", help="YAML file with the search matrix")
+    parser.add_argument("--processes", type=int, help="Worker processes (default: config or CPU count)")
+    parser.add_argument("--out", help="JSON lines file to append rows to instead of the store")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    defaults = {"verbose": config.get("verbose", 2), **(config.get("defaults") or {})}
+    tasks = split_by_site(expand_matrix(config.get("matrix") or {}, defaults))
+    if not tasks:
+        raise ValueError("The search matrix is empty")
+
+    runner = ShardedRunner(
+        processes=args.processes or config.get("processes"),
+        site_rates=config.get("site_rates"),
+    )
+    if args.out:
+        sink = JsonlSink(args.out)
+        close = sink.close
+    else:
+        store = connect_store(os.path.expanduser(config.get("store", DEFAULT_STORE_PATH)))
+        sink, close = store.upsert, store.close
+
+    started = time.monotonic()
+    log.info(f"running {len(tasks)} tasks on {runner.processes} processes")
+    try:
+        total = runner.run_into(tasks, sink)
+    finally:
+        close()
+    log.info(f"wrote {total} jobs in {time.monotonic() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
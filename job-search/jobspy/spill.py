@@ -0,0 +1,168 @@
+"""
+jobspy.spill
+~~~~~~~~~~~~~~~~~~~
+
+Bounded-memory results for very large searches.
+
+With ``scrape_jobs(spill=True)`` rows are written to a temporary Parquet file
+as scrapers produce them, instead of piling up as JobPosts, per-row DataFrames
+and a concatenated frame. The call returns a SpilledJobs handle that reads the
+file back lazily, in batches or as a DataFrame when asked. Peak memory is then
+bounded by a write batch and the pages still in flight, not by results_wanted.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import weakref
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterator
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_float_columns = {
+    "min_amount",
+    "max_amount",
+    "company_rating",
+    "latitude",
+    "longitude",
+}
+_int_columns = {"company_reviews_count", "vacancy_count"}
+
+
+def _column_type(column: str) -> pa.DataType:
+    if column == "date_posted":
+        return pa.date32()
+    if column == "is_remote":
+        return pa.bool_()
+    if column in _float_columns:
+        return pa.float64()
+    if column in _int_columns:
+        return pa.int64()
+    return pa.string()
+
+
+def _coerce(value, kind: pa.DataType):
+    if value is None or value != value:  # None or NaN
+        return None
+    if kind == pa.string():
+        return value if isinstance(value, str) else str(value)
+    if kind == pa.date32():
+        return value.date() if isinstance(value, datetime) else value
+    if kind == pa.float64():
+        return float(value)
+    if kind == pa.int64():
+        return int(value)
+    return bool(value)
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class SpillWriter:
+    """
+    Appends rows to a Parquet file in row groups of batch_size, from any thread.
+    :param columns: columns written, in order; other keys of a row are dropped
+    :param batch_size: rows buffered before a row group is written
+    :param directory: where the file is created, the system temp dir by default
+    """
+
+    def __init__(self, columns: list[str], batch_size: int = 500, directory: str | None = None):
+        self.columns = columns
+        self.schema = pa.schema([(column, _column_type(column)) for column in columns])
+        self.types = [field.type for field in self.schema]
+        self.batch_size = batch_size
+        fd, self.path = tempfile.mkstemp(prefix="jobspy-", suffix=".parquet", dir=directory)
+        os.close(fd)
+        self.writer = pq.ParquetWriter(self.path, self.schema)
+        self.buffer: list[dict] = []
+        self.rows = 0
+        self.lock = threading.Lock()
+
+    def write(self, rows: list[dict]):
+        with self.lock:
+            self.buffer.extend(rows)
+            self.rows += len(rows)
+            if len(self.buffer) >= self.batch_size:
+                self._flush()
+
+    def _flush(self):
+        if not self.buffer:
+            return
+        arrays = [
+            pa.array([_coerce(row.get(column), kind) for row in self.buffer], type=kind)
+            for column, kind in zip(self.columns, self.types)
+        ]
+        self.writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+        self.buffer = []
+
+    def close(self) -> SpilledJobs:
+        with self.lock:
+            self._flush()
+            self.writer.close()
+        return SpilledJobs(self.path, self.rows, delete=True)
+
+    def abort(self):
+        self.writer.close()
+        _remove(self.path)
+
+
+class SpilledJobs:
+    """
+    Lazily loaded scrape_jobs result backed by a Parquet file.
+    :param path: Parquet file holding the rows
+    :param rows: number of rows in the file
+    :param delete: remove the file once this object is garbage collected
+    """
+
+    def __init__(self, path: str, rows: int, delete: bool = False):
+        self.path = path
+        self.rows = rows
+        if delete:
+            self._finalizer = weakref.finalize(self, _remove, path)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __repr__(self) -> str:
+        return f"SpilledJobs({self.rows} rows at {self.path!r})"
+
+    @property
+    def columns(self) -> list[str]:
+        return pq.read_schema(self.path).names
+
+    def iter_batches(self, batch_size: int = 500, columns: list[str] | None = None) -> Iterator[list[dict]]:
+        """Yields rows as lists of dicts, reading batch_size rows at a time"""
+        parquet = pq.ParquetFile(self.path)
+        try:
+            for batch in parquet.iter_batches(batch_size=batch_size, columns=columns):
+                yield batch.to_pylist()
+        finally:
+            parquet.close()
+
+    def __iter__(self) -> Iterator[dict]:
+        for batch in self.iter_batches():
+            yield from batch
+
+    def to_pandas(self, columns: list[str] | None = None) -> pd.DataFrame:
+        """Loads the rows into a DataFrame, sorted like scrape_jobs' own result"""
+        df = pq.read_table(self.path, columns=columns).to_pandas()
+        if {"site", "date_posted"} <= set(df.columns):
+            df = df.sort_values(
+                by=["site", "date_posted"], ascending=[True, False]
+            ).reset_index(drop=True)
+        return df
+
+    def delete(self):
+        """Removes the backing file now instead of at garbage collection"""
+        _remove(self.path)
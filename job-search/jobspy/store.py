@@ -0,0 +1,577 @@
+"""
+jobspy.store
+~~~~~~~~~~~~~~~~~~~
+
+Persistent local job warehouse backed by SQLite.
+
+``scrape_jobs(store=...)`` upserts every scraped posting into the ``jobs``
+table, keyed on the posting id. Common filters are indexed and titles and
+descriptions are searchable through an FTS5 index, so dashboards can be served
+with ``jobspy.store.query(...)`` instead of re-scraping.
+
+Descriptions are kept out of the ``jobs`` table: each distinct body is stored
+once in ``descriptions`` under its content hash, zstd-compressed with a
+dictionary trained on the store's own bodies (see jobspy.descriptions), and
+only decompressed for the rows a query returns.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import sqlite3
+import threading
+from datetime import date, datetime, timezone
+from typing import Iterable
+
+from jobspy.descriptions import DescriptionCodec, description_hash
+from jobspy.geo import haversine_miles, normalize_location, MILES_PER_DEGREE_LAT
+from jobspy.util import create_logger, desired_order
+
+log = create_logger("Store")
+
+DEFAULT_STORE_PATH = os.getenv(
+    "JOBSPY_STORE_PATH", os.path.join(os.path.expanduser("~"), ".jobspy", "jobs.db")
+)
+
+column_types = {
+    "min_amount": "REAL",
+    "max_amount": "REAL",
+    "is_remote": "INTEGER",
+    "company_rating": "REAL",
+    "company_reviews_count": "INTEGER",
+    "vacancy_count": "INTEGER",
+}
+derived_columns = {
+    "description_hash": "TEXT",
+    "place_id": "TEXT",
+    "latitude": "REAL",
+    "longitude": "REAL",
+    "annual_min_amount": "REAL",
+    "annual_max_amount": "REAL",
+    "first_seen": "TEXT",
+    "last_seen": "TEXT",
+}
+annual_multipliers = {
+    "yearly": 1,
+    "monthly": 12,
+    "weekly": 52,
+    "daily": 260,
+    "hourly": 2080,
+}
+indexed_columns = [
+    "site",
+    "date_posted",
+    "company",
+    "location",
+    "annual_min_amount",
+    "annual_max_amount",
+    "place_id",
+    "latitude",
+    "description_hash",
+]
+# bodies stored before the first dictionary is trained, and bodies sampled for training
+DICTIONARY_MIN_SAMPLES = 200
+DICTIONARY_MAX_SAMPLES = 2000
+# keeps IN (...) lists under SQLite's bound parameter limit
+_IN_CHUNK = 500
+
+
+def _clean(value):
+    """Converts pandas/NumPy scalars and dates into values sqlite3 can bind"""
+    if value is None:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if hasattr(value, "item"):  # NumPy scalar
+        return _clean(value.item())
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+def _annualize(amount: float | None, interval: str | None) -> float | None:
+    if amount is None:
+        return None
+    return amount * annual_multipliers.get(interval or "yearly", 1)
+
+
+def _sql_haversine(lat1, lon1, lat2, lon2) -> float | None:
+    if None in (lat1, lon1, lat2, lon2):
+        return None
+    return haversine_miles(lat1, lon1, lat2, lon2)
+
+
+class JobStore:
+    """
+    A SQLite job warehouse.
+    :param path: database file, created along with its directory if missing
+    """
+
+    def __init__(self, path: str | os.PathLike = DEFAULT_STORE_PATH):
+        self.path = os.fspath(path)
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.create_function("haversine_miles", 4, _sql_haversine, deterministic=True)
+        self.codec = DescriptionCodec()
+        self.conn.create_function(
+            "job_description", 3, self.codec.decompress, deterministic=True
+        )
+        self.lock = threading.Lock()
+        self.has_fts = False
+        self._create_schema()
+
+    def _create_schema(self):
+        columns = [
+            f"{column} {column_types.get(column, 'TEXT')}"
+            + (" PRIMARY KEY" if column == "id" else "")
+            for column in desired_order
+        ] + [f"{column} {sql_type}" for column, sql_type in derived_columns.items()]
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS jobs ({', '.join(columns)})")
+            existing = {row["name"] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+            for column, sql_type in derived_columns.items():
+                if column not in existing:  # stores created by an older version
+                    self.conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {sql_type}")
+            for column in indexed_columns:
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_jobs_{column} ON jobs ({column})"
+                )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS descriptions (hash TEXT PRIMARY KEY, "
+                "codec TEXT NOT NULL, dict_id INTEGER, size INTEGER, body BLOB NOT NULL)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS description_dicts "
+                "(id INTEGER PRIMARY KEY, created TEXT, data BLOB NOT NULL)"
+            )
+            if self.codec.available:
+                for row in self.conn.execute("SELECT id, data FROM description_dicts ORDER BY id"):
+                    self.codec.add_dictionary(row["id"], row["data"])
+            # stores created by an older version index descriptions kept in the jobs table
+            legacy_fts = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'jobs_fts_ai'"
+            ).fetchone()
+            if legacy_fts:
+                self.conn.executescript(
+                    """
+                    DROP TRIGGER jobs_fts_ai;
+                    DROP TRIGGER IF EXISTS jobs_fts_ad;
+                    DROP TRIGGER IF EXISTS jobs_fts_au;
+                    DROP TABLE IF EXISTS jobs_fts;
+                    """
+                )
+            self._move_descriptions()
+            try:
+                self._create_fts()
+                self.has_fts = True
+            except sqlite3.OperationalError as e:
+                log.warning(f"FTS5 unavailable, text search falls back to LIKE: {e}")
+
+    def _create_fts(self):
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'"
+        ).fetchone()
+        # contentless, since descriptions only exist compressed; upsert keeps it in sync
+        self.conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(title, description, content='')"
+        )
+        if not exists:
+            rows = self.conn.execute("SELECT rowid, title, description_hash FROM jobs").fetchall()
+            bodies = self._get_bodies({row["description_hash"] for row in rows})
+            self.conn.executemany(
+                "INSERT INTO jobs_fts(rowid, title, description) VALUES (?, ?, ?)",
+                [
+                    (row["rowid"], row["title"], bodies.get(row["description_hash"]))
+                    for row in rows
+                ],
+            )
+
+    def _move_descriptions(self):
+        """Moves descriptions stored in the jobs table by older versions into descriptions"""
+        rows = self.conn.execute(
+            "SELECT rowid, description FROM jobs "
+            "WHERE description IS NOT NULL AND description_hash IS NULL"
+        ).fetchall()
+        if not rows:
+            return
+        hashes = [description_hash(row["description"]) for row in rows]
+        self._put_bodies(dict(zip(hashes, (row["description"] for row in rows))))
+        self.conn.executemany(
+            "UPDATE jobs SET description = NULL, description_hash = ? WHERE rowid = ?",
+            [(h, row["rowid"]) for h, row in zip(hashes, rows)],
+        )
+        log.info(f"moved {len(rows)} descriptions into the descriptions table")
+        self._maybe_train_dictionary()
+
+    def _select_in(self, sql: str, values: Iterable) -> list[sqlite3.Row]:
+        """Runs sql, whose single {} is an IN list, over values in chunks"""
+        values = list(values)
+        rows = []
+        for start in range(0, len(values), _IN_CHUNK):
+            chunk = values[start : start + _IN_CHUNK]
+            rows += self.conn.execute(sql.format(", ".join("?" * len(chunk))), chunk).fetchall()
+        return rows
+
+    def _put_bodies(self, texts: dict[str, str]):
+        """Compresses and stores bodies whose hash is not stored yet"""
+        stored = {
+            row["hash"]
+            for row in self._select_in("SELECT hash FROM descriptions WHERE hash IN ({})", texts)
+        }
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO descriptions (hash, codec, dict_id, body, size) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (h, *self.codec.compress(text), len(text.encode("utf-8")))
+                for h, text in texts.items()
+                if h not in stored
+            ],
+        )
+
+    def _get_bodies(self, hashes: Iterable[str | None]) -> dict[str, str]:
+        rows = self._select_in(
+            "SELECT hash, codec, dict_id, body FROM descriptions WHERE hash IN ({})",
+            {h for h in hashes if h},
+        )
+        return {
+            row["hash"]: self.codec.decompress(row["codec"], row["dict_id"], row["body"])
+            for row in rows
+        }
+
+    def _maybe_train_dictionary(self):
+        if not self.codec.available or self.codec.current is not None:
+            return
+        count = self.conn.execute("SELECT COUNT(*) FROM descriptions").fetchone()[0]
+        if count >= DICTIONARY_MIN_SAMPLES:
+            self._train_dictionary(DICTIONARY_MAX_SAMPLES)
+
+    def _train_dictionary(self, max_samples: int) -> int | None:
+        rows = self.conn.execute(
+            "SELECT codec, dict_id, body FROM descriptions ORDER BY rowid DESC LIMIT ?",
+            (max_samples,),
+        ).fetchall()
+        samples = [self.codec.decompress(row["codec"], row["dict_id"], row["body"]) for row in rows]
+        try:
+            data = self.codec.train(samples)
+        except Exception as e:
+            log.warning(f"could not train a description dictionary: {e}")
+            return None
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        dict_id = self.conn.execute(
+            "INSERT INTO description_dicts (created, data) VALUES (?, ?)", (now, data)
+        ).lastrowid
+        previous = self.codec.current
+        self.codec.add_dictionary(dict_id, data)
+        # bodies written before any dictionary existed are the ones that gain the most
+        if previous is None:
+            rows = self.conn.execute(
+                "SELECT hash, codec, dict_id, body FROM descriptions WHERE dict_id IS NULL"
+            ).fetchall()
+            self.conn.executemany(
+                "UPDATE descriptions SET codec = ?, dict_id = ?, body = ? WHERE hash = ?",
+                [
+                    (
+                        *self.codec.compress(
+                            self.codec.decompress(row["codec"], row["dict_id"], row["body"])
+                        ),
+                        row["hash"],
+                    )
+                    for row in rows
+                ],
+            )
+        log.info(f"trained description dictionary {dict_id} on {len(samples)} bodies")
+        return dict_id
+
+    def train_dictionary(self, max_samples: int = DICTIONARY_MAX_SAMPLES) -> int | None:
+        """
+        Trains a new zstd dictionary on the most recent bodies; later bodies use it.
+        One is trained automatically once DICTIONARY_MIN_SAMPLES bodies are stored,
+        retraining helps after the mix of sites or searches has changed.
+        :return: the dictionary id, or None if training was not possible
+        """
+        if not self.codec.available:
+            return None
+        with self.lock, self.conn:
+            return self._train_dictionary(max_samples)
+
+    def get_descriptions(self, hashes: Iterable[str]) -> dict[str, str]:
+        """Decompresses the descriptions with the given hashes, keyed by hash"""
+        with self.lock:
+            return self._get_bodies(hashes)
+
+    def prune_descriptions(self) -> int:
+        """Deletes bodies no posting refers to anymore, returning how many were removed"""
+        with self.lock, self.conn:
+            return self.conn.execute(
+                "DELETE FROM descriptions WHERE hash NOT IN "
+                "(SELECT description_hash FROM jobs WHERE description_hash IS NOT NULL)"
+            ).rowcount
+
+    def description_stats(self) -> dict:
+        """Distinct bodies, their raw and stored sizes, and the postings referring to them"""
+        with self.lock:
+            bodies, raw, stored = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(body)), 0) "
+                "FROM descriptions"
+            ).fetchone()
+            postings = self.conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE description_hash IS NOT NULL"
+            ).fetchone()[0]
+        return {
+            "postings": postings,
+            "bodies": bodies,
+            "raw_bytes": raw,
+            "stored_bytes": stored,
+            "ratio": raw / stored if stored else None,
+        }
+
+    def _to_row(self, job: dict, now: str) -> dict:
+        row = {column: _clean(job.get(column)) for column in desired_order}
+        row["id"] = row["id"] or row["job_url"]
+        description = row["description"]
+        row["description_hash"] = (
+            description_hash(description) if isinstance(description, str) and description else None
+        )
+        place = normalize_location(row["location"])
+        row["place_id"] = place.id if place else None
+        row["latitude"] = place.lat if place and place.kind == "city" else None
+        row["longitude"] = place.lon if place and place.kind == "city" else None
+        row["annual_min_amount"] = _annualize(row["min_amount"], row["interval"])
+        row["annual_max_amount"] = _annualize(row["max_amount"], row["interval"])
+        row["first_seen"] = row["last_seen"] = now
+        return row
+
+    def upsert(self, jobs: "pd.DataFrame | Iterable[dict]") -> int:
+        """
+        Inserts new postings and refreshes existing ones, keeping their first_seen time.
+        :param jobs: a scrape_jobs DataFrame or an iterable of row dicts
+        :return: number of rows written
+        """
+        if hasattr(jobs, "to_dict"):
+            jobs = jobs.to_dict("records")
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        rows = [self._to_row(job, now) for job in jobs]
+        # the last copy of a posting wins, as it would row by row
+        rows = list({row["id"]: row for row in rows if row["id"]}.values())
+        if not rows:
+            return 0
+        texts = {}
+        for row in rows:
+            if row["description_hash"]:
+                texts[row["description_hash"]] = row["description"]
+            row["description"] = None
+        columns = list(rows[0])
+        updates = ", ".join(
+            f"{column}=excluded.{column}"
+            for column in columns
+            if column not in ("id", "first_seen")
+        )
+        sql = (
+            f"INSERT INTO jobs ({', '.join(columns)}) "
+            f"VALUES ({', '.join(':' + column for column in columns)}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}"
+        )
+        with self.lock, self.conn:
+            previous = {}
+            if self.has_fts:
+                previous = {
+                    row["id"]: row
+                    for row in self._select_in(
+                        "SELECT rowid, id, title, description_hash FROM jobs WHERE id IN ({})",
+                        (row["id"] for row in rows),
+                    )
+                }
+            self._put_bodies(texts)
+            self.conn.executemany(sql, rows)
+            if self.has_fts:
+                self._update_fts(rows, previous, texts)
+            self._maybe_train_dictionary()
+        log.info(f"upserted {len(rows)} jobs into {self.path}")
+        return len(rows)
+
+    def _update_fts(self, rows: list[dict], previous: dict[str, sqlite3.Row], texts: dict[str, str]):
+        """Re-indexes postings that are new or whose title or description changed"""
+        changed = [
+            row
+            for row in rows
+            if row["id"] not in previous
+            or (previous[row["id"]]["title"], previous[row["id"]]["description_hash"])
+            != (row["title"], row["description_hash"])
+        ]
+        if not changed:
+            return
+        stale = [previous[row["id"]] for row in changed if row["id"] in previous]
+        # a contentless index forgets a row only when given the exact values it indexed
+        old_texts = self._get_bodies(old["description_hash"] for old in stale)
+        self.conn.executemany(
+            "INSERT INTO jobs_fts(jobs_fts, rowid, title, description) VALUES ('delete', ?, ?, ?)",
+            [
+                (old["rowid"], old["title"], old_texts.get(old["description_hash"]))
+                for old in stale
+            ],
+        )
+        rowids = {
+            row["id"]: row["rowid"]
+            for row in self._select_in(
+                "SELECT rowid, id FROM jobs WHERE id IN ({})", (row["id"] for row in changed)
+            )
+        }
+        self.conn.executemany(
+            "INSERT INTO jobs_fts(rowid, title, description) VALUES (?, ?, ?)",
+            [
+                (rowids[row["id"]], row["title"], texts.get(row["description_hash"]))
+                for row in changed
+            ],
+        )
+
+    def _build_where(
+        self,
+        *,
+        title_like: str | None = None,
+        company: str | None = None,
+        location_like: str | None = None,
+        site: str | list[str] | None = None,
+        min_salary: float | None = None,
+        max_salary: float | None = None,
+        posted_after: date | str | None = None,
+        posted_before: date | str | None = None,
+        is_remote: bool | None = None,
+        text: str | None = None,
+        near: str | None = None,
+        radius_miles: float = 50,
+    ) -> tuple[str, list]:
+        clauses, params = [], []
+        if title_like:
+            clauses.append("title LIKE ?")
+            params.append(f"%{title_like}%")
+        if company:
+            clauses.append("company = ? COLLATE NOCASE")
+            params.append(company)
+        if location_like:
+            clauses.append("location LIKE ?")
+            params.append(f"%{location_like}%")
+        if site:
+            sites = [site] if isinstance(site, str) else list(site)
+            clauses.append(f"site IN ({', '.join('?' * len(sites))})")
+            params.extend(sites)
+        if min_salary is not None:
+            clauses.append("COALESCE(annual_max_amount, annual_min_amount) >= ?")
+            params.append(min_salary)
+        if max_salary is not None:
+            clauses.append("COALESCE(annual_min_amount, annual_max_amount) <= ?")
+            params.append(max_salary)
+        if posted_after:
+            clauses.append("date_posted >= ?")
+            params.append(_clean(posted_after))
+        if posted_before:
+            clauses.append("date_posted <= ?")
+            params.append(_clean(posted_before))
+        if is_remote is not None:
+            clauses.append("is_remote = ?")
+            params.append(int(is_remote))
+        if text:
+            if self.has_fts:
+                clauses.append(
+                    "rowid IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)"
+                )
+                params.append(text)
+            else:
+                clauses.append(
+                    "(title LIKE ? OR description_hash IN (SELECT hash FROM descriptions "
+                    "WHERE job_description(codec, dict_id, body) LIKE ?))"
+                )
+                params.extend([f"%{text}%"] * 2)
+        if near:
+            place = normalize_location(near)
+            if place is None:
+                raise ValueError(f"Unknown location: {near}")
+            if place.kind == "city":
+                # the latitude band uses the index, the exact distance check runs after it
+                band = radius_miles / MILES_PER_DEGREE_LAT
+                clauses.append(
+                    "latitude BETWEEN ? AND ? AND haversine_miles(latitude, longitude, ?, ?) <= ?"
+                )
+                params.extend(
+                    [place.lat - band, place.lat + band, place.lat, place.lon, radius_miles]
+                )
+            else:
+                clauses.append("(place_id = ? OR place_id LIKE ?)")
+                params.extend([place.id, f"{place.id}-%"])
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(
+        self,
+        *,
+        limit: int | None = None,
+        order_by: str = "date_posted",
+        descending: bool = True,
+        descriptions: bool = True,
+        **filters,
+    ) -> "pd.DataFrame":
+        """
+        Returns stored postings as a DataFrame with the scrape_jobs columns.
+        :param descriptions: decompress the description of each returned row; without it
+            the column is empty and get_descriptions(description_hash) loads them on demand
+        :param title_like: substring of the title
+        :param company: exact company name (case-insensitive)
+        :param location_like: substring of the location
+        :param site: site name or list of site names
+        :param min_salary: minimum annualized salary
+        :param max_salary: maximum annualized salary
+        :param posted_after: earliest date_posted (date or ISO string)
+        :param posted_before: latest date_posted (date or ISO string)
+        :param is_remote: remote flag
+        :param text: FTS5 match expression over title and description
+        :param near: location to search around; a state or country matches everything inside it
+        :param radius_miles: search radius when near is a city
+        """
+        import pandas as pd
+
+        if order_by not in desired_order and order_by not in derived_columns:
+            raise ValueError(f"Invalid order_by column: {order_by}")
+        where, params = self._build_where(**filters)
+        direction = "DESC" if descending else "ASC"
+        sql = f"SELECT * FROM jobs{where} ORDER BY {order_by} {direction}"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self.lock:
+            df = pd.read_sql_query(sql, self.conn, params=params)
+            if descriptions and len(df):
+                bodies = self._get_bodies(df["description_hash"].dropna().unique())
+                df["description"] = df["description_hash"].map(bodies)
+        return df
+
+    def count(self, **filters) -> int:
+        where, params = self._build_where(**filters)
+        with self.lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM jobs{where}", params).fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+_stores: dict[str, JobStore] = {}
+_stores_lock = threading.Lock()
+
+
+def connect(path: str | os.PathLike = DEFAULT_STORE_PATH) -> JobStore:
+    """Returns a shared JobStore for path, opening it on first use"""
+    path = os.fspath(path)
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = JobStore(path)
+        return _stores[path]
+
+
+def query(path: str | os.PathLike = DEFAULT_STORE_PATH, **kwargs) -> "pd.DataFrame":
+    """Queries the job store at path, see JobStore.query for the filters"""
+    return connect(path).query(**kwargs)
@@ -0,0 +1,33 @@
+"""
+jobspy.tls
+~~~~~~~~~~~~~~~~~~~
+
+Proxy-rotating tls_client session, kept out of jobspy.util so that importing
+jobspy does not load tls_client unless a scraper creates a TLS session.
+"""
+
+from __future__ import annotations
+
+import tls_client
+
+from jobspy.trace import span
+from jobspy.util import RotatingProxySession
+
+
+class TLSRotating(RotatingProxySession, tls_client.Session):
+    def __init__(self, proxies=None):
+        RotatingProxySession.__init__(self, proxies=proxies)
+        tls_client.Session.__init__(self, random_tls_extension_order=True)
+
+    def execute_request(self, method, url, *args, **kwargs):
+        if self.proxy_cycle:
+            next_proxy = next(self.proxy_cycle)
+            if next_proxy["http"] != "http://localhost":
+                self.proxies = next_proxy
+            else:
+                self.proxies = {}
+        with span("request", "http", method=method, url=url) as request_span:
+            response = tls_client.Session.execute_request(self, method, url, *args, **kwargs)
+            request_span.set(status=response.status_code)
+        response.ok = response.status_code in range(200, 400)
+        return response
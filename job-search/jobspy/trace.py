@@ -0,0 +1,251 @@
+"""
+jobspy.trace
+~~~~~~~~~~~~~~~~~~~
+
+Opt-in structured tracing of a scrape.
+
+``scrape_jobs(trace="scrape.json")`` records nested spans (site, search page,
+HTTP request, parse, detail fetch, description conversion, sleeps) with wall
+and CPU time and the thread they ran on, then writes them as a Chrome trace
+(open in chrome://tracing or https://ui.perfetto.dev). A Tracer passed instead of a
+path can also be saved as OTLP/JSON for OpenTelemetry tooling, or summarized::
+
+    tracer = Tracer()
+    scrape_jobs(..., trace=tracer)
+    tracer.save("scrape.otlp.json", format="otlp")
+    print(tracer.summary())
+
+The active tracer lives in a context variable that scrape_jobs and the shared
+executor carry into their worker threads. With no tracer active, a span costs
+one context variable lookup.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar, copy_context
+
+_current: ContextVar[tuple["Tracer", "Span | None"] | None] = ContextVar(
+    "jobspy_trace", default=None
+)
+
+
+class Span:
+    """One timed operation; attributes can be added while it runs with set()"""
+
+    __slots__ = (
+        "id", "parent", "name", "category", "attributes",
+        "start_ns", "duration_ns", "cpu_ns", "thread_id", "thread_name",
+    )
+
+    def __init__(self, span_id: int, parent: int | None, name: str, category: str, attributes: dict):
+        self.id = span_id
+        self.parent = parent
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+        self.start_ns = 0
+        self.duration_ns = 0
+        self.cpu_ns = 0
+        thread = threading.current_thread()
+        self.thread_id = thread.ident
+        self.thread_name = thread.name
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+
+class _NoopSpan:
+    def set(self, **attributes):
+        pass
+
+
+_noop = _NoopSpan()
+
+
+class span:
+    """
+    Times the enclosed block as a child of the current span, if a tracer is active.
+    :param name: operation, e.g. "request" or "parse"
+    :param category: level of the timeline it belongs to, e.g. "site", "page", "http"
+    """
+
+    __slots__ = ("name", "category", "attributes", "span", "token", "cpu_start")
+
+    def __init__(self, name: str, category: str = "jobspy", **attributes):
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+        self.span = None
+
+    def __enter__(self) -> Span | _NoopSpan:
+        state = _current.get()
+        if state is None:
+            return _noop
+        tracer, parent = state
+        self.span = Span(
+            next(tracer.ids), parent.id if parent else None, self.name, self.category, self.attributes
+        )
+        self.token = _current.set((tracer, self.span))
+        self.cpu_start = time.thread_time_ns()
+        self.span.start_ns = time.perf_counter_ns()
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.span is None:
+            return
+        self.span.duration_ns = time.perf_counter_ns() - self.span.start_ns
+        self.span.cpu_ns = time.thread_time_ns() - self.cpu_start
+        if exc_type is not None:
+            self.span.attributes["error"] = f"{exc_type.__name__}: {exc}"
+        tracer = _current.get()[0]
+        _current.reset(self.token)
+        tracer.add(self.span)
+
+
+def traced(name: str, category: str = "jobspy"):
+    """Decorator form of span, timing every call of the decorated function"""
+
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _current.get() is None:
+                return fn(*args, **kwargs)
+            with span(name, category):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def wrap_context(fn):
+    """Binds fn to a copy of the current context, so a thread running it keeps the active tracer"""
+    return functools.partial(copy_context().run, fn)
+
+
+class Tracer:
+    """Collects the spans recorded while it is active"""
+
+    def __init__(self):
+        self.spans: list[Span] = []
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+        # wall clock at the perf_counter origin, to give exported spans absolute times
+        self.epoch_ns = time.time_ns() - time.perf_counter_ns()
+        self.token = None
+
+    def add(self, span: Span):
+        with self.lock:
+            self.spans.append(span)
+
+    def __enter__(self) -> "Tracer":
+        self.token = _current.set((self, None))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current.reset(self.token)
+        self.token = None
+
+    def chrome_trace(self) -> dict:
+        """Spans as Chrome trace events: complete events with CPU time in their args"""
+        pid = os.getpid()
+        with self.lock:
+            spans = sorted(self.spans, key=lambda s: s.start_ns)
+        origin = spans[0].start_ns if spans else 0
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in {s.thread_id: s.thread_name for s in spans}.items()
+        ]
+        for s in spans:
+            events.append(
+                {
+                    "name": s.name,
+                    "cat": s.category,
+                    "ph": "X",
+                    "ts": (s.start_ns - origin) / 1000,
+                    "dur": s.duration_ns / 1000,
+                    "pid": pid,
+                    "tid": s.thread_id,
+                    "args": {**s.attributes, "cpu_ms": round(s.cpu_ns / 1e6, 3)},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def otlp(self, service_name: str = "jobspy") -> dict:
+        """Spans in the OTLP/JSON export format, as one trace"""
+        trace_id = os.urandom(16).hex()
+
+        def attribute(key, value):
+            if isinstance(value, bool):
+                return {"key": key, "value": {"boolValue": value}}
+            if isinstance(value, int):
+                return {"key": key, "value": {"intValue": str(value)}}
+            if isinstance(value, float):
+                return {"key": key, "value": {"doubleValue": value}}
+            return {"key": key, "value": {"stringValue": str(value)}}
+
+        with self.lock:
+            spans = list(self.spans)
+        otlp_spans = []
+        for s in spans:
+            attributes = {
+                **s.attributes,
+                "jobspy.category": s.category,
+                "jobspy.cpu_ms": round(s.cpu_ns / 1e6, 3),
+                "thread.id": s.thread_id,
+                "thread.name": s.thread_name,
+            }
+            start = self.epoch_ns + s.start_ns
+            otlp_span = {
+                "traceId": trace_id,
+                "spanId": f"{s.id:016x}",
+                "name": s.name,
+                "kind": 3 if s.category == "http" else 1,  # client or internal
+                "startTimeUnixNano": str(start),
+                "endTimeUnixNano": str(start + s.duration_ns),
+                "attributes": [attribute(key, value) for key, value in attributes.items()],
+            }
+            if s.parent is not None:
+                otlp_span["parentSpanId"] = f"{s.parent:016x}"
+            if "error" in s.attributes:
+                otlp_span["status"] = {"code": 2, "message": s.attributes["error"]}
+            otlp_spans.append(otlp_span)
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [attribute("service.name", service_name)]},
+                    "scopeSpans": [{"scope": {"name": "jobspy.trace"}, "spans": otlp_spans}],
+                }
+            ]
+        }
+
+    def save(self, path: str, format: str = "chrome"):
+        """Writes the trace as "chrome" trace events or "otlp" JSON"""
+        if format not in ("chrome", "otlp"):
+            raise ValueError(f"Invalid trace format: {format}")
+        data = self.chrome_trace() if format == "chrome" else self.otlp()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def summary(self, top: int = 20) -> str:
+        """Total wall and CPU time per (category, name), largest wall time first"""
+        totals = defaultdict(lambda: [0, 0, 0])
+        with self.lock:
+            for s in self.spans:
+                total = totals[(s.category, s.name)]
+                total[0] += 1
+                total[1] += s.duration_ns
+                total[2] += s.cpu_ns
+        lines = [f"{'category':10} {'name':24} {'count':>6} {'wall s':>9} {'cpu s':>9}"]
+        for (category, name), (count, wall, cpu) in sorted(
+            totals.items(), key=lambda item: -item[1][1]
+        )[:top]:
+            lines.append(f"{category:10} {name:24} {count:6} {wall / 1e9:9.3f} {cpu / 1e9:9.3f}")
+        return "\n".join(lines)
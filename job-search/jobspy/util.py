@@ -2,16 +2,19 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from itertools import cycle
+from typing import Callable
 
-import numpy as np
 import requests
-import tls_client
 import urllib3
-from markdownify import markdownify as md
 from requests.adapters import HTTPAdapter, Retry
 
 from jobspy.model import CompensationInterval, JobType, Site
+from jobspy.trace import span
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -29,6 +32,9 @@ def create_logger(name: str):
     return logger
 
 
+log = create_logger("Detail")
+
+
 class RotatingProxySession:
     def __init__(self, proxies=None):
         if isinstance(proxies, str):
@@ -83,23 +89,9 @@ class RequestsRotating(RotatingProxySession, requests.Session):
                 self.proxies = next_proxy
             else:
                 self.proxies = {}
-        return requests.Session.request(self, method, url, **kwargs)
-
-
-class TLSRotating(RotatingProxySession, tls_client.Session):
-    def __init__(self, proxies=None):
-        RotatingProxySession.__init__(self, proxies=proxies)
-        tls_client.Session.__init__(self, random_tls_extension_order=True)
-
-    def execute_request(self, *args, **kwargs):
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        response = tls_client.Session.execute_request(self, *args, **kwargs)
-        response.ok = response.status_code in range(200, 400)
+        with span("request", "http", method=method, url=url) as request_span:
+            response = requests.Session.request(self, method, url, **kwargs)
+            request_span.set(status=response.status_code)
         return response
 
 
@@ -117,6 +109,9 @@ def create_session(
     :return: A session object
     """
     if is_tls:
+        # tls_client is slow to import, so it is only loaded by scrapers that use it
+        from jobspy.tls import TLSRotating
+
         session = TLSRotating(proxies=proxies)
     else:
         session = RequestsRotating(
@@ -132,6 +127,182 @@ def create_session(
     return session
 
 
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by everything sending requests to one site.
+    :param rate: requests per second
+    :param burst: requests that may be sent back to back after an idle period
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a request may be sent"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1  # reserve a token, callers queue up behind a negative balance
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+_rate_limiters: dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+# limiters set with set_rate_limiter, which pace every request of their site
+_request_limiters: dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(name: str, rate: float, burst: int = 1) -> RateLimiter:
+    """Returns the process-wide rate limiter for name, creating it on first use"""
+    with _rate_limiters_lock:
+        if name not in _rate_limiters:
+            _rate_limiters[name] = RateLimiter(rate, burst)
+        return _rate_limiters[name]
+
+
+def set_rate_limiter(name: str, limiter: RateLimiter):
+    """
+    Replaces the rate limiter for name, e.g. with one shared between processes.
+    Scrapers of that site then take a token for every request sent through their
+    session (search pages included), not only for detail pages.
+    """
+    with _rate_limiters_lock:
+        _rate_limiters[name] = limiter
+        _request_limiters[name] = limiter
+
+
+class PacedSession:
+    """Wraps a session, taking a rate limiter token before every request"""
+
+    _methods = ("request", "get", "post", "put", "patch", "delete", "head", "options")
+
+    def __init__(self, session, limiter: RateLimiter):
+        object.__setattr__(self, "unpaced", session)
+        object.__setattr__(self, "limiter", limiter)
+
+    def __getattr__(self, name):
+        attribute = getattr(self.unpaced, name)
+        if name not in self._methods:
+            return attribute
+
+        def paced(*args, **kwargs):
+            with span("rate_limit", "wait"):
+                self.limiter.acquire()
+            return attribute(*args, **kwargs)
+
+        return paced
+
+    def __setattr__(self, name, value):
+        setattr(self.unpaced, name, value)
+
+
+def paced_session(name: str, session):
+    """session, paced by the limiter set for name with set_rate_limiter if there is one"""
+    with _rate_limiters_lock:
+        limiter = _request_limiters.get(name)
+    if limiter is None or session is None or isinstance(session, PacedSession):
+        return session
+    return PacedSession(session, limiter)
+
+
+class DetailFetcher:
+    """
+    Fetches job detail pages for a scraper: requests run concurrently on the
+    scraper's shared executor quota, are paced by a site-wide rate limiter, and
+    parsed results are cached by url so repeat postings cost nothing.
+    :param scraper: scraper whose session and executor quota are used
+    :param parse: turns a detail page response into a dict of fields
+    :param rate: detail requests per second, shared with the site's other requests
+    :param burst: requests that may be sent back to back after an idle period
+    :param timeout: seconds to wait for a detail page
+    :param cache_size: parsed pages kept, least recently used are evicted first
+    """
+
+    def __init__(
+        self,
+        scraper,
+        parse: Callable[[requests.Response], dict],
+        rate: float,
+        burst: int = 1,
+        timeout: int = 20,
+        cache_size: int = 2048,
+    ):
+        self.scraper = scraper
+        self.parse = parse
+        self.limiter = get_rate_limiter(scraper.site.value, rate, burst)
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self.cache: OrderedDict[str, dict] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _cached(self, url: str) -> dict | None:
+        with self.lock:
+            if url in self.cache:
+                self.cache.move_to_end(url)
+                return self.cache[url]
+        return None
+
+    def fetch(self, url: str) -> dict:
+        """Fetches and parses one detail page, returning {} on failure (failures are not cached)"""
+        details = self._cached(url)
+        if details is not None:
+            return details
+        with span("rate_limit", "wait"):
+            self.limiter.acquire()
+        return self._fetch(url)
+
+    def _fetch(self, url: str) -> dict:
+        """Fetches and parses a detail page whose rate limiter token is already taken"""
+        with span("detail", "detail", url=url):
+            response = self.scraper.unpaced_session.get(url, timeout=self.timeout)
+            if not response.ok:
+                log.debug(f"detail page {url} responded with status code {response.status_code}")
+                return {}
+            with span("parse", "parse"):
+                details = self.parse(response)
+        with self.lock:
+            self.cache[url] = details
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return details
+
+    def fetch_many(self, urls: list[str]) -> list[dict]:
+        """
+        Fetches detail pages concurrently, returning details in the order of urls.
+        Rate limiting waits happen here, before each submit, so a throttled site never
+        holds a thread of the shared pool that other sites are waiting for.
+        """
+        futures: dict[str, Future | dict] = {}
+        for url in urls:
+            if url in futures:
+                continue
+            cached = self._cached(url)
+            if cached is not None:
+                futures[url] = cached
+                continue
+            with span("rate_limit", "wait"):
+                self.limiter.acquire()
+            futures[url] = self.scraper.submit(self._fetch, url)
+        details: dict[str, dict] = {}
+        for url, future in futures.items():
+            if isinstance(future, dict):
+                details[url] = future
+                continue
+            try:
+                details[url] = future.result()
+            except Exception as e:
+                log.error(f"Failed to fetch details for {url}: {e}")
+                details[url] = {}
+        return [details[url] for url in urls]
+
+
 def set_logger_level(verbose: int):
     """
     Adjusts the logger's level. This function allows the logging level to be changed at runtime.
@@ -154,7 +325,10 @@ def set_logger_level(verbose: int):
 def markdown_converter(description_html: str):
     if description_html is None:
         return None
-    markdown = md(description_html)
+    from markdownify import markdownify as md
+
+    with span("markdown", "convert", chars=len(description_html)):
+        markdown = md(description_html)
     return markdown.strip()
 
 def plain_converter(decription_html:str):
@@ -199,7 +373,7 @@ def currency_parser(cur_str):
     else:
         num = float(cur_str)
 
-    return np.round(num, 2)
+    return round(num, 2)
 
 
 def remove_attributes(tag):
@@ -4,12 +4,12 @@ import json
 import math
 import re
 import time
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from bs4 import BeautifulSoup
 
 from jobspy.ziprecruiter.constant import headers, get_cookie_data
+from jobspy.trace import span, traced
 from jobspy.util import (
     extract_emails_from_text,
     create_session,
@@ -24,11 +24,16 @@ from jobspy.model import (
     JobResponse,
     Country,
     DescriptionFormat,
+    DetailPolicy,
     Scraper,
     ScraperInput,
     Site,
 )
-from jobspy.ziprecruiter.util import get_job_type_enum, add_params
+from jobspy.ziprecruiter.util import (
+    get_job_type_enum,
+    add_params,
+    is_description_complete,
+)
 
 log = create_logger("ZipRecruiter")
 
@@ -69,7 +74,8 @@ class ZipRecruiter(Scraper):
             if len(job_list) >= scraper_input.results_wanted:
                 break
             if page > 1:
-                time.sleep(self.delay)
+                with span("sleep", "wait"):
+                    time.sleep(self.delay)
             log.info(f"search page: {page} / {max_pages}")
             jobs_on_page, continue_token = self._find_jobs_in_page(
                 scraper_input, continue_token
@@ -82,6 +88,7 @@ class ZipRecruiter(Scraper):
                 break
         return JobResponse(jobs=job_list[: scraper_input.results_wanted])
 
+    @traced("page", "page")
     def _find_jobs_in_page(
         self, scraper_input: ScraperInput, continue_token: str | None = None
     ) -> tuple[list[JobPost], str | None]:
@@ -115,11 +122,43 @@ class ZipRecruiter(Scraper):
         res_data = res.json()
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_list]
+        job_posts = []
+        for job in jobs_list:
+            job_post = self._process_job(job)
+            if job_post:
+                job_posts.append((job_post, job.get("job_description")))
+        self._add_details(job_posts, scraper_input.ziprecruiter_detail_policy)
+        return [job_post for job_post, _ in job_posts], next_continue_token
 
-        job_list = list(filter(None, (result.result() for result in job_results)))
-        return job_list, next_continue_token
+    def _add_details(self, job_posts: list[tuple[JobPost, str | None]], policy: DetailPolicy):
+        """
+        Replaces search result descriptions with the job page's full description
+        (and adds the direct url) according to the detail policy. Pages are fetched
+        on the shared executor and reuse the scraper's session.
+        """
+        if policy == DetailPolicy.NEVER:
+            return
+        to_fetch = [
+            job_post
+            for job_post, raw_description in job_posts
+            if policy == DetailPolicy.ALWAYS or not is_description_complete(raw_description)
+        ]
+        if not to_fetch:
+            return
+        log.debug(f"fetching {len(to_fetch)}/{len(job_posts)} job pages")
+        futures = [
+            (job_post, self.submit(self._get_descr, job_post.job_url))
+            for job_post in to_fetch
+        ]
+        for job_post, future in futures:
+            try:
+                description_full, job_url_direct = future.result()
+            except Exception as e:
+                log.error(f"failed to fetch job page {job_post.job_url}: {e}")
+                continue
+            if description_full:
+                job_post.description = description_full
+            job_post.job_url_direct = job_url_direct
 
     def _process_job(self, job: dict) -> JobPost | None:
         """
@@ -154,7 +193,6 @@ class ZipRecruiter(Scraper):
         comp_min = int(job["compensation_min"]) if "compensation_min" in job else None
         comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
-        description_full, job_url_direct = self._get_descr(job_url)
 
         return JobPost(
             id=f'zr-{job["listing_key"]}',
@@ -170,12 +208,12 @@ class ZipRecruiter(Scraper):
             ),
             date_posted=date_posted,
             job_url=job_url,
-            description=description_full if description_full else description,
+            description=description,
             emails=extract_emails_from_text(description) if description else None,
-            job_url_direct=job_url_direct,
             listing_type=listing_type,
         )
 
+    @traced("description", "detail")
     def _get_descr(self, job_url):
         res = self.session.get(job_url, allow_redirects=True)
         description_full = job_url_direct = None
@@ -211,6 +249,7 @@ class ZipRecruiter(Scraper):
 
         return description_full, job_url_direct
 
+    @traced("cookies", "setup")
     def _get_cookies(self):
         """
         Sends a session event to the API with device properties.
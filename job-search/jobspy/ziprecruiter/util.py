@@ -1,5 +1,10 @@
+import re
+
 from jobspy.model import JobType
 
+_TAG_RE = re.compile(r"<[^>]+>")
+truncation_markers = ("...", "\u2026", "read more", "see more", "show more")
+
 
 def add_params(scraper_input) -> dict[str, str | int]:
     params: dict[str, str | int] = {
@@ -29,3 +34,17 @@ def get_job_type_enum(job_type_str: str) -> list[JobType] | None:
         if job_type_str in job_type.value:
             return [job_type]
     return None
+
+
+def is_description_complete(description: str | None, min_length: int = 300) -> bool:
+    """
+    Guesses whether a search result description is the full posting rather than
+    a snippet: long enough once tags are stripped, and not ending in an ellipsis
+    or a "read more" link.
+    """
+    if not description:
+        return False
+    text = " ".join(_TAG_RE.sub(" ", description).split())
+    if len(text) < min_length:
+        return False
+    return not text.lower().rstrip(" )]").endswith(truncation_markers)